@@ -0,0 +1,173 @@
+"""
+Bootstrap Module
+
+This module implements the nonparametric subject-level bootstrap of Test/Reference effects used as a
+sensitivity analysis by the design classes.
+
+Subjects are resampled with replacement within strata (the sequences of a crossover, the treatment
+arms of a parallel study) so that every replicate keeps the design's group sizes. The estimators are
+linear combinations of stratum means of per-subject values (e.g. Test - Reference differences), so a
+block of replicates is evaluated at once by indexing the values with an integer matrix of resampled
+subjects and taking the stratum means with ``crossover_stats.sequence_means``.
+
+Replicates are generated in fixed-size blocks, each drawn from its own ``SeedSequence`` child
+stream. The replicates therefore depend only on the seed, not on the number of worker processes.
+"""
+
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List, Optional, Sequence
+
+from . import crossover_stats
+
+# Replicates per block; every block has its own random stream
+BLOCK_SIZE = 1000
+
+
+def resample_indices(rng: np.random.Generator, n_subjects: int, n_boot: int) -> np.ndarray:
+    """
+    Draw bootstrap samples of subject positions.
+
+    Parameters
+    ----------
+    rng : np.random.Generator
+        Random generator
+    n_subjects : int
+        Number of subjects in the stratum
+    n_boot : int
+        Number of replicates
+
+    Returns
+    -------
+    np.ndarray
+        Integer matrix of shape (n_boot, n_subjects); row b holds the subjects of replicate b
+    """
+    return rng.integers(0, n_subjects, size=(n_boot, n_subjects))
+
+
+def _block_estimates(
+    strata: List[np.ndarray],
+    weights: np.ndarray,
+    n_boot: int,
+    seed: np.random.SeedSequence,
+) -> np.ndarray:
+    """Evaluate one block of replicates of sum_k weights[k] * mean(strata[k])."""
+    rng = np.random.default_rng(seed)
+    resampled = np.hstack([values[resample_indices(rng, len(values), n_boot)] for values in strata])
+    labels = np.repeat(np.arange(len(strata)), [len(values) for values in strata])
+    return crossover_stats.sequence_means(resampled, labels)["group_means"] @ weights
+
+
+def stratified_mean_bootstrap(
+    strata: Sequence[np.ndarray],
+    weights: Sequence[float],
+    n_boot: int = 10000,
+    seed: Optional[int] = None,
+    n_jobs: int = 1,
+) -> np.ndarray:
+    """
+    Bootstrap a weighted sum of stratum means by resampling subjects within strata.
+
+    Parameters
+    ----------
+    strata : Sequence[np.ndarray]
+        Per-subject values of every stratum
+    weights : Sequence[float]
+        Weight of every stratum mean in the estimator
+    n_boot : int, default=10000
+        Number of bootstrap replicates
+    seed : int, optional
+        Seed of the root ``SeedSequence`` (fresh entropy when None)
+    n_jobs : int, default=1
+        Number of worker processes; blocks are evaluated in a process pool when > 1
+
+    Returns
+    -------
+    np.ndarray
+        Replicate estimates of shape (n_boot,)
+    """
+    strata = [np.asarray(values, dtype=np.float64) for values in strata]
+    weights = np.asarray(weights, dtype=np.float64)
+    if any(len(values) == 0 for values in strata):
+        raise ValueError("Every stratum needs at least one subject")
+    if n_boot < 1:
+        raise ValueError("n_boot must be at least 1")
+
+    sizes = [BLOCK_SIZE] * (n_boot // BLOCK_SIZE)
+    if n_boot % BLOCK_SIZE:
+        sizes.append(n_boot % BLOCK_SIZE)
+    streams = np.random.SeedSequence(seed).spawn(len(sizes))
+    args = [(strata, weights, size, stream) for size, stream in zip(sizes, streams)]
+
+    if n_jobs > 1 and len(args) > 1:
+        with ProcessPoolExecutor(max_workers=n_jobs) as pool:
+            blocks = list(pool.map(_block_estimates, *zip(*args)))
+    else:
+        blocks = [_block_estimates(*arg) for arg in args]
+    return np.concatenate(blocks)
+
+
+def percentile_interval(estimates: np.ndarray, alpha: float = 0.1) -> Dict[str, float]:
+    """
+    Summarize log-scale bootstrap replicates as a ratio with a percentile interval.
+
+    Parameters
+    ----------
+    estimates : np.ndarray
+        Replicate estimates (log scale)
+    alpha : float, default=0.1
+        Two-sided significance level (0.1 gives the 90% interval used for BE)
+
+    Returns
+    -------
+    Dict[str, float]
+        standard_error (log scale) and lower_ci, upper_ci as percentages
+    """
+    lower, upper = np.quantile(estimates, [alpha / 2, 1 - alpha / 2])
+    return {
+        "standard_error": float(np.std(estimates, ddof=1)) if len(estimates) > 1 else np.nan,
+        "lower_ci": float(np.exp(lower) * 100),
+        "upper_ci": float(np.exp(upper) * 100),
+    }
+
+
+def summarize_bootstrap(
+    estimate: float,
+    estimates: np.ndarray,
+    alpha: float = 0.1,
+    seed: Optional[int] = None,
+) -> Dict[str, Any]:
+    """
+    Summarize a log-scale estimate and its bootstrap replicates, and print the interval.
+
+    Parameters
+    ----------
+    estimate : float
+        Estimate on the original data (log scale)
+    estimates : np.ndarray
+        Replicate estimates (log scale)
+    alpha : float, default=0.1
+        Two-sided significance level of the percentile interval
+    seed : int, optional
+        Seed the replicates were drawn with, reported for reproducibility
+
+    Returns
+    -------
+    Dict[str, Any]
+        point_estimate (percent), the ``percentile_interval`` entries, n_boot,
+        seed and the replicate ``estimates``
+    """
+    results = {
+        "point_estimate": float(np.exp(estimate) * 100),
+        **percentile_interval(estimates, alpha),
+        "n_boot": len(estimates),
+        "seed": seed,
+        "estimates": estimates,
+    }
+    level = round((1 - alpha) * 100)
+    print(f"Point Estimate (Test/Reference): {results['point_estimate']:.2f}%")
+    print(
+        f"Bootstrap {level}% Percentile Interval ({len(estimates)} replicates): "
+        f"{results['lower_ci']:.2f}% - {results['upper_ci']:.2f}%"
+    )
+    return results
@@ -3,9 +3,13 @@ import numpy as np
 import statsmodels.api as sm
 import statsmodels.formula.api as smf
 from typing import Dict, List, Optional, Tuple, Union
+from scipy import stats
 
+from .design_base import PKDesignMixin
+from . import bootstrap, crossover_stats, nca
 
-class Crossover2x2:
+
+class Crossover2x2(PKDesignMixin):
     """
     Analyze a 2x2 crossover study to compute bioequivalence (BE) metrics and statistical analyses.
     
@@ -20,8 +24,9 @@ class Crossover2x2:
     
     Parameters
     ----------
-    data : pl.DataFrame
-        Input dataset containing concentration-time profiles
+    data : pl.DataFrame or pl.LazyFrame
+        Input dataset containing concentration-time profiles. A ``pl.LazyFrame``
+        (e.g. from ``pl.scan_parquet``) is read only for the configured columns
     subject_col : str
         Column name for subject identifiers
     seq_col : str
@@ -34,6 +39,19 @@ class Crossover2x2:
         Column name for concentration measurements
     form_col : str
         Column name for formulation information (Test vs Reference)
+    lazy : bool, default=False
+        If True, the constructor only validates and indexes the data; PK
+        parameters are computed on first use and only for the requested columns
+        (see ``get_params_df``)
+    filters : pl.Expr, optional
+        Row filter (e.g. on analyte or study) pushed down into the data scan
+    auc_method : str, default="linear"
+        Trapezoidal rule for AUC: "linear", or "linear_up_log_down" to use the
+        logarithmic rule on declining segments
+    lambda_z_method : str, default="last_3"
+        Terminal-phase selection for lambda_z: "last_3" uses the last three
+        samples, "best_fit" picks the window (at least three positive samples
+        after Tmax) with the best adjusted R², preferring more points within 1e-4
     
     Attributes
     ----------
@@ -43,13 +61,17 @@ class Crossover2x2:
 
     def __init__(
         self,
-        data: pl.DataFrame,
+        data: Union[pl.DataFrame, pl.LazyFrame],
         subject_col: str,
         seq_col: str,
         period_col: str,
         time_col: str,
         conc_col: str,
         form_col: str,
+        lazy: bool = False,
+        filters: Optional[pl.Expr] = None,
+        auc_method: str = "linear",
+        lambda_z_method: str = "last_3",
     ) -> None:
         """Initialize the Crossover2x2 analyzer with study data and column specifications."""
 
@@ -60,27 +82,46 @@ class Crossover2x2:
         self._time_col = time_col
         self._conc_col = conc_col
         self._form_col = form_col
+        self._auc_method = auc_method
+        self._lambda_z_method = lambda_z_method
 
         self._validate_data()
         self._validate_colvals()
 
-        # Calculate all PK parameters
-        self._df_params = self._calculate_auc()
-        self._df_params = self._calculate_cmax()
-        self._df_params = self._calculate_tmax()
-        self._df_params = self._calculate_log_transform()
-        self._df_params = self._calculate_half_life()
-        self._df_params = self._calculate_auc_extrapolated()
-
-        # Sort the dataframe for better readability
-        self.params_df = self._df_params.sort(
-            [self._subject_col, self._form_col, self._period_col]
+        # Pack the concentration-time profiles once for the shared NCA kernels
+        self._profiles = nca.ProfileSet.from_frame(
+            self._data,
+            [self._subject_col, self._period_col, self._seq_col, self._form_col],
+            self._time_col,
+            self._conc_col,
+            filters=filters,
+        )
+
+        # PK parameters are computed on demand and memoized per column
+        self._parameters = nca.ParameterTable(
+            self._profiles.keys,
+            {
+                "AUC": self._calculate_auc,
+                "Cmax": self._calculate_cmax,
+                "Tmax": self._calculate_tmax,
+                "log_AUC": lambda: self._calculate_log_transform("AUC"),
+                "log_Cmax": lambda: self._calculate_log_transform("Cmax"),
+                "t_half": self._calculate_half_life,
+                "AUC_inf": self._calculate_auc_extrapolated,
+                "log_AUC_inf": lambda: self._calculate_log_transform("AUC_inf"),
+                **nca.lambda_z_calculators(lambda: self._lambda_z_fit),
+            },
         )
+        self._reset_params()
+
+        # Calculate all PK parameters unless running lazily
+        if not lazy:
+            self._params_df = self.params_df
 
     def _validate_data(self) -> None:
-        """Check that data is a Polars DataFrame."""
-        if not isinstance(self._data, pl.DataFrame):
-            raise TypeError("Data must be a Polars DataFrame")
+        """Check that data is a Polars DataFrame or LazyFrame."""
+        if not isinstance(self._data, (pl.DataFrame, pl.LazyFrame)):
+            raise TypeError("Data must be a Polars DataFrame or LazyFrame")
 
     def _validate_colvals(self) -> None:
         """Ensure all required columns exist in the dataset."""
@@ -92,152 +133,102 @@ class Crossover2x2:
             self._conc_col,
             self._form_col,
         ]
-        missing = [col for col in required if col not in self._data.columns]
+        missing = [col for col in required if col not in nca.column_names(self._data)]
         if missing:
             raise ValueError(
                 f"Required column(s) not found in dataset: {', '.join(missing)}"
             )
+        if self._auc_method not in nca.AUC_METHODS:
+            raise ValueError(f"auc_method must be one of: {', '.join(nca.AUC_METHODS)}")
+        if self._lambda_z_method not in nca.LAMBDA_Z_METHODS:
+            raise ValueError(
+                f"lambda_z_method must be one of: {', '.join(nca.LAMBDA_Z_METHODS)}"
+            )
 
-    def _calculate_auc(self) -> pl.DataFrame:
+    def _calculate_auc(self) -> pl.Series:
         """
-        Compute AUC (Area Under the Curve) using the trapezoidal rule.
+        Compute AUC (Area Under the Curve) using the configured trapezoidal rule.
         
         Returns
         -------
-        pl.DataFrame
-            DataFrame with AUC values added
-        """
-        grouped_df = self._data.group_by(
-            [self._subject_col, self._period_col, self._seq_col, self._form_col]
-        ).agg([pl.col(self._time_col), pl.col(self._conc_col)])
-        auc_vals = [
-            np.trapezoid(row[self._conc_col], row[self._time_col])
-            for row in grouped_df.to_dicts()
-        ]
-        return grouped_df.with_columns(pl.Series("AUC", auc_vals))
+        pl.Series
+            AUC of every profile
+        """
+        return nca.as_series("AUC", nca.auc(self._profiles, self._auc_method))
 
-    def _calculate_cmax(self) -> pl.DataFrame:
+    def _calculate_cmax(self) -> pl.Series:
         """
         Compute Cmax (maximum concentration).
         
         Returns
         -------
-        pl.DataFrame
-            DataFrame with Cmax values added
+        pl.Series
+            Cmax of every profile
         """
-        cmax_df = self._data.group_by(
-            [self._subject_col, self._period_col, self._form_col]
-        ).agg(pl.col(self._conc_col).max().alias("Cmax"))
-        return self._df_params.join(
-            cmax_df, on=[self._subject_col, self._period_col, self._form_col]
-        )
+        return nca.as_series("Cmax", nca.cmax(self._profiles), self._profiles.conc_dtype)
 
-    def _calculate_tmax(self) -> pl.DataFrame:
+    def _calculate_tmax(self) -> pl.Series:
         """
         Compute Tmax (time when Cmax occurs).
         
         Returns
         -------
-        pl.DataFrame
-            DataFrame with Tmax values added
-        """
-        tmax_df = (
-            self._data.filter(
-                pl.col(self._conc_col)
-                == pl.col(self._conc_col)
-                .max()
-                .over([self._subject_col, self._period_col, self._form_col])
-            )
-            .group_by([self._subject_col, self._period_col, self._form_col])
-            .agg(pl.col(self._time_col).min().alias("Tmax"))
-        )
-        return self._df_params.join(
-            tmax_df, on=[self._subject_col, self._period_col, self._form_col]
-        )
+        pl.Series
+            Tmax of every profile
+        """
+        cmax = self._parameters["Cmax"].cast(pl.Float64).to_numpy()
+        return nca.as_series("Tmax", nca.tmax(self._profiles, cmax), self._profiles.time_dtype)
 
-    def _calculate_log_transform(self) -> pl.DataFrame:
+    def _calculate_log_transform(self, parameter: str) -> pl.Series:
         """
-        Compute log-transformed AUC and Cmax.
+        Compute a log-transformed PK parameter (log_AUC or log_Cmax).
+        
+        Parameters
+        ----------
+        parameter : str
+            The PK parameter to transform (e.g., "AUC", "Cmax")
         
         Returns
         -------
-        pl.DataFrame
-            DataFrame with log-transformed values added
+        pl.Series
+            Log-transformed values of every profile
         """
-        return self._df_params.with_columns(
-            [
-                pl.col("AUC").log().alias("log_AUC"),
-                pl.col("Cmax").log().alias("log_Cmax"),
-            ]
-        )
+        return self._parameters[parameter].log().alias(f"log_{parameter}")
 
-    def _calculate_half_life(self) -> pl.DataFrame:
+    def _terminal_window(self) -> np.ndarray:
         """
-        Estimate elimination half-life using log-linear regression on terminal phase.
+        Select the terminal-phase samples used to estimate lambda_z.
         
-        This is a simplified estimation using the last 3 time points.
+        With ``lambda_z_method="last_3"`` this is a simplified selection of the last
+        3 time points (all points after the first when fewer than 4 are available),
+        ignoring non-positive concentrations. With ``"best_fit"`` the window is
+        chosen by adjusted R² among the positive samples after Tmax.
         
         Returns
         -------
-        pl.DataFrame
-            DataFrame with half-life estimates added
+        np.ndarray
+            Boolean mask over the packed samples
         """
-        half_lives = []
-        for row in self._df_params.to_dicts():
-            subject = row[self._subject_col]
-            period = row[self._period_col]
-            formulation = row[self._form_col]
-            
-            # Get concentration-time data for this subject/period/formulation
-            subject_data = self._data.filter(
-                (pl.col(self._subject_col) == subject) &
-                (pl.col(self._period_col) == period) &
-                (pl.col(self._form_col) == formulation)
-            ).sort(self._time_col)
-            
-            times = subject_data[self._time_col].to_numpy()
-            concs = subject_data[self._conc_col].to_numpy()
-            
-            # Use last 3 time points if available, otherwise use all time points except t=0
-            if len(times) >= 4:  # At least 4 points (including t=0)
-                terminal_times = times[-3:]
-                terminal_concs = concs[-3:]
-            else:
-                terminal_times = times[1:] if len(times) > 1 else times
-                terminal_concs = concs[1:] if len(concs) > 1 else concs
-            
-            # Skip if all concentrations are zero or less than 3 points
-            if np.all(terminal_concs <= 0) or len(terminal_times) < 2:
-                half_lives.append(None)
-                continue
-                
-            # Remove any zero concentrations
-            valid_indices = terminal_concs > 0
-            if np.sum(valid_indices) < 2:
-                half_lives.append(None)
-                continue
-                
-            valid_times = terminal_times[valid_indices]
-            valid_concs = terminal_concs[valid_indices]
-            
-            # Linear regression on log-transformed concentrations
-            log_concs = np.log(valid_concs)
-            X = sm.add_constant(valid_times)
-            model = sm.OLS(log_concs, X).fit()
-            
-            # Calculate half-life (t1/2 = ln(2)/ke, where ke is the slope)
-            slope = model.params[1]
-            if slope >= 0:  # Invalid slope (should be negative)
-                half_lives.append(None)
-            else:
-                half_life = np.log(2) / (-slope)
-                half_lives.append(half_life)
-                
-        return self._df_params.with_columns(
-            pl.Series("t_half", half_lives).alias("t_half")
-        )
+        profiles = self._profiles
+        if self._lambda_z_method == "best_fit":
+            tmax = self._parameters["Tmax"].cast(pl.Float64).to_numpy()
+            eligible = (profiles.concs > 0) & (profiles.times > tmax[profiles.segment_ids])
+            return nca.best_fit_window(profiles, eligible)
+        window = nca.terminal_window(profiles, n_points=3, eligible=profiles.positions > 0)
+        return window & (profiles.concs > 0)
 
-    def _calculate_auc_extrapolated(self) -> pl.DataFrame:
+    def _calculate_half_life(self) -> pl.Series:
+        """
+        Estimate elimination half-life using log-linear regression on terminal phase.
+        
+        Returns
+        -------
+        pl.Series
+            Half-life estimates of every profile
+        """
+        return nca.as_series("t_half", nca.half_life(self._lambda_z_fit.slope))
+
+    def _calculate_auc_extrapolated(self) -> pl.Series:
         """
         Calculate AUC extrapolated to infinity using the terminal elimination rate constant.
         
@@ -245,48 +236,61 @@ class Crossover2x2:
         
         Returns
         -------
-        pl.DataFrame
-            DataFrame with AUC_inf values added
+        pl.Series
+            AUC_inf of every profile
         """
-        auc_inf_values = []
+        auc_inf = nca.auc_inf(
+            self._parameters["AUC"].to_numpy(),
+            nca.clast(self._profiles, positive_only=False),
+            self._parameters["t_half"].to_numpy(),
+        )
+        return nca.as_series("AUC_inf", auc_inf)
+
+    def _subject_contrasts(self, metric: str, params: Optional[pl.DataFrame] = None) -> pl.DataFrame:
+        """
+        Arrange a metric as one row per subject with its Test and Reference observations.
         
-        for row in self._df_params.to_dicts():
-            subject = row[self._subject_col]
-            period = row[self._period_col]
-            formulation = row[self._form_col]
-            t_half = row.get("t_half")
-            
-            if t_half is None or t_half <= 0:
-                auc_inf_values.append(None)
-                continue
-            
-            # Get concentration-time data for this subject/period/formulation
-            subject_data = self._data.filter(
-                (pl.col(self._subject_col) == subject) &
-                (pl.col(self._period_col) == period) &
-                (pl.col(self._form_col) == formulation)
-            ).sort(self._time_col)
-            
-            # Get the last concentration
-            if len(subject_data) > 0:
-                last_time = subject_data[self._time_col][-1]
-                last_conc = subject_data[self._conc_col][-1]
-                
-                # Calculate terminal elimination rate constant
-                ke = np.log(2) / t_half
-                
-                # Calculate extrapolated AUC
-                auc_extrapolated = last_conc / ke if ke > 0 else 0
-                auc_inf = row["AUC"] + auc_extrapolated
-                auc_inf_values.append(auc_inf)
-            else:
-                auc_inf_values.append(None)
-        
-        return self._df_params.with_columns(
-            pl.Series("AUC_inf", auc_inf_values).alias("AUC_inf")
+        The formulation levels are ordered as in treatment coding: the first level
+        (alphabetically, e.g. "Reference") is the reference and the other one the test.
+        
+        Parameters
+        ----------
+        metric : str
+            The PK parameter to arrange
+        params : pl.DataFrame, optional
+            Parameter frame holding ``metric`` (default: ``_params_for([metric])``)
+        
+        Returns
+        -------
+        pl.DataFrame
+            Subject, sequence, y_test, y_ref and test_second (True when Test was given
+            in the later period) for every subject with both observations
+        """
+        if params is None:
+            params = self._params_for([metric])
+        df = params.drop_nulls(metric)
+        levels = sorted(df[self._form_col].unique().to_list())
+        if len(levels) != 2:
+            raise ValueError(f"Exactly 2 formulation levels required, but found {len(levels)}.")
+        reference, test = levels
+        is_test = pl.col(self._form_col) == test
+        is_ref = pl.col(self._form_col) == reference
+        return (
+            df.group_by(self._subject_col)
+            .agg([
+                pl.col(self._seq_col).first(),
+                pl.col(metric).filter(is_test).first().alias("y_test"),
+                pl.col(metric).filter(is_ref).first().alias("y_ref"),
+                (
+                    pl.col(self._period_col).filter(is_test).first()
+                    > pl.col(self._period_col).filter(is_ref).first()
+                ).alias("test_second"),
+            ])
+            .drop_nulls(["y_test", "y_ref"])
+            .sort(self._subject_col)
         )
 
-    def run_anova(self, metric: str) -> Dict[str, any]:
+    def run_anova(self, metric: str, engine: str = "native") -> Dict[str, any]:
         """
         Perform ANOVA for the specified metric.
         
@@ -294,21 +298,36 @@ class Crossover2x2:
         ----------
         metric : str
             The PK parameter to analyze (e.g., "AUC", "Cmax", "log_AUC", "log_Cmax")
+        engine : str, default="native"
+            "native" computes the full 2x2 crossover ANOVA table (sequence,
+            subject(sequence), period, formulation and residual) in closed form from
+            the subjects with both periods, without fitting a model. "statsmodels"
+            fits an OLS model with formulation, period and sequence effects and
+            reports ``anova_lm`` (type II), as a cross-check.
             
         Returns
         -------
         Dict
-            Dictionary with ANOVA results
+            Dictionary with ANOVA results. With the native engine ``anova_table`` is a
+            pl.DataFrame with columns Source, sum_sq, df, mean_sq, F and p_value, and
+            ``n_subjects`` is the number of complete subjects; with statsmodels it is
+            the pandas table from ``anova_lm`` and ``model`` holds the OLS fit.
             
         Notes
         -----
         The function displays unique levels for formulation, period, and sequence before 
         printing ANOVA results, and performs validation checks.
+        
+        Earlier versions always used statsmodels. Code that reads ``model`` or
+        expects a pandas ``anova_table`` should pass ``engine="statsmodels"``.
         """
-        df = self._df_params.to_pandas()
-        unique_form = df[self._form_col].unique()
-        unique_period = df[self._period_col].unique()
-        unique_seq = df[self._seq_col].unique()
+        if engine not in ("native", "statsmodels"):
+            raise ValueError("engine must be either 'native' or 'statsmodels'")
+        
+        params = self._params_for([metric])
+        unique_form = params[self._form_col].unique(maintain_order=True).to_numpy()
+        unique_period = params[self._period_col].unique(maintain_order=True).to_numpy()
+        unique_seq = params[self._seq_col].unique(maintain_order=True).to_numpy()
 
         print("Formulation levels:", unique_form)
         print("Period levels:", unique_period)
@@ -329,18 +348,93 @@ class Crossover2x2:
             print(error_msg)
             return {"error": error_msg}
 
-        formula = f"{metric} ~ C({self._form_col}) + C({self._period_col}) + C({self._seq_col})"
-        model = smf.ols(formula, data=df).fit()
-        anova_table = sm.stats.anova_lm(model, typ=2)
+        if engine == "statsmodels":
+            df = self._model_frame(params).pandas
+            formula = f"{metric} ~ C({self._form_col}) + C({self._period_col}) + C({self._seq_col})"
+            model = smf.ols(formula, data=df).fit()
+            anova_table = sm.stats.anova_lm(model, typ=2)
+            print("ANOVA Results for", metric)
+            print(anova_table)
+            
+            return {
+                "anova_table": anova_table,
+                "model": model,
+                "formula": formula
+            }
+
+        anova_table, n_subjects = self._anova_table(metric, params)
+        formula = (
+            f"{metric} ~ C({self._seq_col}) + C({self._subject_col}):C({self._seq_col})"
+            f" + C({self._period_col}) + C({self._form_col})"
+        )
         print("ANOVA Results for", metric)
         print(anova_table)
         
         return {
             "anova_table": anova_table,
-            "model": model,
-            "formula": formula
+            "formula": formula,
+            "n_subjects": n_subjects
         }
 
+    def run_anovas(self, metrics: Optional[List[str]] = None) -> pl.DataFrame:
+        """
+        Compute the closed-form 2x2 crossover ANOVA of several metrics at once.
+        
+        The parameter frame holding every metric is built once (in lazy mode only
+        these columns are computed); each metric is then tabulated from its
+        complete subjects as in ``run_anova(metric, engine="native")``.
+        
+        Parameters
+        ----------
+        metrics : List[str], optional
+            PK parameters to analyze (default: ["log_AUC", "log_Cmax"])
+        
+        Returns
+        -------
+        pl.DataFrame
+            The ANOVA tables stacked, with columns metric, Source, sum_sq, df,
+            mean_sq, F, p_value and n_subjects
+        """
+        if metrics is None:
+            metrics = ["log_AUC", "log_Cmax"]
+        params = self._params_for(metrics)
+        factors = {"formulation": self._form_col, "period": self._period_col, "sequence": self._seq_col}
+        for label, column in factors.items():
+            n_levels = params[column].n_unique()
+            if n_levels < 2:
+                raise ValueError(f"At least 2 {label} levels required, but found {n_levels}.")
+        
+        tables = []
+        for metric in metrics:
+            anova_table, n_subjects = self._anova_table(metric, params)
+            tables.append(anova_table.select(
+                pl.lit(metric).alias("metric"), pl.all(), pl.lit(n_subjects).alias("n_subjects")
+            ))
+        results = pl.concat(tables)
+        print("ANOVA Results:")
+        print(results)
+        return results
+
+    def _anova_table(self, metric: str, params: pl.DataFrame) -> Tuple[pl.DataFrame, int]:
+        """Closed-form 2x2 ANOVA table of ``metric`` and the number of complete subjects."""
+        contrasts = self._subject_contrasts(metric, params)
+        table = crossover_stats.anova_2x2(
+            contrasts["y_test"].to_numpy(),
+            contrasts["y_ref"].to_numpy(),
+            contrasts["test_second"].to_numpy(),
+        )
+        sources = {
+            "sequence": self._seq_col,
+            "subject": f"{self._subject_col}({self._seq_col})",
+            "period": self._period_col,
+            "formulation": self._form_col,
+            "residual": "Residual",
+        }
+        anova_table = pl.DataFrame(
+            [{"Source": label, **table[key]} for key, label in sources.items()]
+        ).select(["Source", "sum_sq", "df", "mean_sq", "F", "p_value"])
+        return anova_table, len(contrasts)
+
     def run_nlme(self, metric: str) -> Dict[str, any]:
         """
         Perform a mixed effects model analysis for the specified metric.
@@ -360,10 +454,10 @@ class Crossover2x2:
         The function displays unique levels for formulation, period, and sequence before 
         printing model summary, and performs validation checks.
         """
-        df = self._df_params.to_pandas()
-        unique_form = df[self._form_col].unique()
-        unique_period = df[self._period_col].unique()
-        unique_seq = df[self._seq_col].unique()
+        model = self._model_frame(self._params_for([metric]))
+        unique_form = model.params[self._form_col].unique(maintain_order=True).to_numpy()
+        unique_period = model.params[self._period_col].unique(maintain_order=True).to_numpy()
+        unique_seq = model.params[self._seq_col].unique(maintain_order=True).to_numpy()
 
         print("Formulation levels:", unique_form)
         print("Period levels:", unique_period)
@@ -385,8 +479,7 @@ class Crossover2x2:
             return {"error": error_msg}
 
         formula = f"{metric} ~ C({self._form_col}) + C({self._period_col}) + C({self._seq_col})"
-        model = smf.mixedlm(formula, data=df, groups=df[self._subject_col])
-        mdf = model.fit()
+        mdf = model.mixed_model(metric, [self._form_col, self._period_col, self._seq_col]).fit()
         print("Mixed Effects Model Results for", metric)
         print(mdf.summary())
         
@@ -400,6 +493,19 @@ class Crossover2x2:
         """
         Calculate point estimate for Test/Reference ratio.
         
+        When every subject has both periods, the difference and its 90% CI are
+        computed exactly from the within-subject Test - Reference differences
+        (two-sample t-interval over the sequences, equivalent to the 2x2 ANOVA
+        with N - 2 degrees of freedom). Studies with incomplete subjects fall back
+        to a mixed effects model with subject as random effect.
+        
+        The exact interval uses the t distribution with N - 2 df, whereas the
+        mixed model reports a normal-approximation (Wald) interval. For complete
+        studies the CI is therefore wider than in earlier versions, which always
+        used the mixed model; the point estimate is unchanged. For example, a
+        log_AUC CI of 87.44-104.15% becomes 87.03-104.65%. Check ``method`` to
+        see which interval was reported.
+        
         Parameters
         ----------
         metric : str
@@ -408,32 +514,50 @@ class Crossover2x2:
         Returns
         -------
         Dict
-            Dictionary with point estimate and confidence intervals
+            Dictionary with point estimate and confidence intervals, and the
+            ``method`` used ("exact" or "mixedlm")
         """
         if not metric.startswith("log_"):
             print(f"Warning: {metric} may not be log-transformed. Point estimates are valid for log-transformed metrics.")
         
-        df = self._df_params.to_pandas()
-        
-        # Filter out rows with missing values
-        df_valid = df.dropna(subset=[metric])
-        
-        # Fit mixed effects model
-        formula = f"{metric} ~ C({self._form_col}) + C({self._period_col}) + C({self._seq_col})"
-        model = smf.mixedlm(formula, data=df_valid, groups=df_valid[self._subject_col])
-        result = model.fit()
-        
-        # Extract coefficient for Test formulation
-        coef_index = result.params.index[result.params.index.str.contains(self._form_col)]
-        if len(coef_index) == 0:
-            return {"error": f"Could not find coefficient for {self._form_col}"}
+        model = self._model_frame(self._params_for([metric]))
+        params = model.params.drop_nulls(metric)
+        
+        contrasts = None
+        if params[self._form_col].n_unique() == 2:
+            contrasts = self._subject_contrasts(metric)
+            complete = 2 * len(contrasts) == len(params)
+            n_rt = int(contrasts["test_second"].sum())
+            if not complete or n_rt == 0 or n_rt == len(contrasts) or len(contrasts) < 3:
+                contrasts = None
+        
+        if contrasts is not None:
+            exact = crossover_stats.point_estimate_2x2(
+                contrasts["y_test"].to_numpy(),
+                contrasts["y_ref"].to_numpy(),
+                contrasts["test_second"].to_numpy(),
+                alpha=0.1,  # 90% CI for bioequivalence
+            )
+            method = "exact"
+            test_ref_diff = float(exact["estimate"])
+            lower_ci = float(exact["lower"])
+            upper_ci = float(exact["upper"])
+        else:
+            # Fit mixed effects model on the cached design
+            result = model.mixed_model(metric, [self._form_col, self._period_col, self._seq_col]).fit()
             
-        test_ref_diff = result.params[coef_index[0]]
-        
-        # Calculate confidence intervals
-        conf_int = result.conf_int(alpha=0.1)  # 90% CI for bioequivalence
-        lower_ci = conf_int.loc[coef_index[0], 0]
-        upper_ci = conf_int.loc[coef_index[0], 1]
+            # Extract coefficient for Test formulation
+            coef_index = result.params.index[result.params.index.str.contains(self._form_col)]
+            if len(coef_index) == 0:
+                return {"error": f"Could not find coefficient for {self._form_col}"}
+                
+            method = "mixedlm"
+            test_ref_diff = result.params[coef_index[0]]
+            
+            # Calculate confidence intervals
+            conf_int = result.conf_int(alpha=0.1)  # 90% CI for bioequivalence
+            lower_ci = conf_int.loc[coef_index[0], 0]
+            upper_ci = conf_int.loc[coef_index[0], 1]
         
         # Convert from log scale to ratio
         point_estimate = np.exp(test_ref_diff) * 100  # as percentage
@@ -447,7 +571,8 @@ class Crossover2x2:
             "point_estimate": point_estimate,
             "lower_90ci": lower_ci_ratio,
             "upper_90ci": upper_ci_ratio,
-            "be_criteria_met": be_criteria_met
+            "be_criteria_met": be_criteria_met,
+            "method": method
         }
         
         print(f"Point Estimate (Test/Reference): {point_estimate:.2f}%")
@@ -459,6 +584,143 @@ class Crossover2x2:
             
         return results
         
+    def calculate_point_estimates(self, metrics: Optional[List[str]] = None) -> pl.DataFrame:
+        """
+        Calculate Test/Reference point estimates and 90% CIs for several metrics at once.
+        
+        All metrics share one fixed-effects model with subject, period and
+        formulation effects. Its design matrix is factorized once (QR) and every
+        metric is solved as one response column; metrics with different missing
+        values are grouped by the rows they are observed on.
+        
+        Parameters
+        ----------
+        metrics : List[str], optional
+            Log-transformed PK parameters to analyze (default: ["log_AUC", "log_Cmax"],
+            e.g. also "log_AUC_inf")
+        
+        Returns
+        -------
+        pl.DataFrame
+            One row per metric with n, df, estimate and se (log scale), point_estimate,
+            lower_90ci and upper_90ci (percent) and be_criteria_met (80-125% rule)
+        """
+        if metrics is None:
+            metrics = ["log_AUC", "log_Cmax"]
+        params = self._params_for(metrics)
+        n_forms = params[self._form_col].n_unique()
+        if n_forms != 2:
+            raise ValueError(f"Exactly 2 formulation levels required, but found {n_forms}.")
+        
+        results = self._model_frame(params).formulation_effects(
+            metrics, [self._subject_col, self._period_col], self._form_col
+        )
+        print("Point Estimates (Test/Reference):")
+        print(results.select(
+            ["metric", "point_estimate", "lower_90ci", "upper_90ci", "be_criteria_met"]
+        ))
+        return results
+
+    def bootstrap_point_estimate(
+        self,
+        metric: str = "log_AUC",
+        n_boot: int = 10000,
+        seed: Optional[int] = None,
+        alpha: float = 0.1,
+        n_jobs: int = 1,
+    ) -> Dict[str, any]:
+        """
+        Bootstrap the Test/Reference ratio by resampling subjects within sequences.
+        
+        Each replicate resamples the subjects of every sequence with replacement
+        and re-evaluates the closed-form 2x2 estimator (the average over sequences
+        of the mean Test - Reference difference). Replicates are evaluated in
+        batches from integer index matrices; only subjects with both periods are
+        used.
+        
+        Parameters
+        ----------
+        metric : str, default="log_AUC"
+            The log-transformed PK parameter to analyze
+        n_boot : int, default=10000
+            Number of bootstrap replicates
+        seed : int, optional
+            Seed of the ``SeedSequence`` the replicate streams are spawned from;
+            results for a given seed do not depend on ``n_jobs``
+        alpha : float, default=0.1
+            Two-sided significance level (0.1 gives the 90% percentile interval)
+        n_jobs : int, default=1
+            Number of worker processes
+        
+        Returns
+        -------
+        Dict
+            point_estimate, lower_ci and upper_ci (percent, percentile interval),
+            standard_error (log scale), n_boot, seed and the log-scale replicate
+            ``estimates``
+        """
+        contrasts = self._subject_contrasts(metric)
+        diff = (contrasts["y_test"] - contrasts["y_ref"]).to_numpy()
+        test_second = contrasts["test_second"].to_numpy()
+        strata = [diff[~test_second], diff[test_second]]
+        if min(len(values) for values in strata) < 2:
+            raise ValueError("Bootstrap requires at least 2 complete subjects in each sequence.")
+        
+        estimate = float(crossover_stats.sequence_means(diff, test_second)["mean"])
+        estimates = bootstrap.stratified_mean_bootstrap(
+            strata, [0.5, 0.5], n_boot=n_boot, seed=seed, n_jobs=n_jobs
+        )
+        return bootstrap.summarize_bootstrap(estimate, estimates, alpha, seed)
+
+    def calculate_influence(self, metric: str = "log_AUC") -> pl.DataFrame:
+        """
+        Leave-one-subject-out sensitivity analysis of the Test/Reference ratio.
+        
+        For every subject with both periods, the exact point estimate and 90% CI
+        (see ``calculate_point_estimate``) are recomputed without that subject by
+        downdating the per-sequence means and sums of squares of the Test -
+        Reference differences, so no model is refitted.
+        
+        Parameters
+        ----------
+        metric : str, default="log_AUC"
+            The log-transformed PK parameter to analyze
+        
+        Returns
+        -------
+        pl.DataFrame
+            One row per left-out subject with its sequence, point_estimate,
+            lower_90ci and upper_90ci (percent) without the subject, change (point
+            estimate minus the full-data estimate, percentage points), the
+            externally studentized residual of its Test - Reference difference and
+            be_criteria_met (80-125% rule)
+        """
+        contrasts = self._subject_contrasts(metric)
+        diff = (contrasts["y_test"] - contrasts["y_ref"]).to_numpy()
+        test_second = contrasts["test_second"].to_numpy()
+        full = crossover_stats.sequence_means(diff, test_second)
+        loo = crossover_stats.sequence_means_leave_one_out(diff, test_second)
+        
+        with np.errstate(invalid="ignore"):
+            t_crit = stats.t.ppf(0.95, loo["df"])
+        lower = np.exp(loo["mean"] - t_crit * loo["se"]) * 100
+        upper = np.exp(loo["mean"] + t_crit * loo["se"]) * 100
+        point_estimate = np.exp(loo["mean"]) * 100
+        results = pl.DataFrame({
+            self._subject_col: contrasts[self._subject_col],
+            self._seq_col: contrasts[self._seq_col],
+            "point_estimate": point_estimate,
+            "lower_90ci": lower,
+            "upper_90ci": upper,
+            "change": point_estimate - np.exp(full["mean"]) * 100,
+            "studentized_residual": loo["studentized"],
+            "be_criteria_met": (lower >= 80) & (upper <= 125),
+        })
+        
+        print(f"Leave-one-subject-out analysis for {metric} ({len(results)} subjects)")
+        print(results.sort(pl.col("studentized_residual").abs(), descending=True, nulls_last=True))
+        return results
+
     def summarize_pk_parameters(self) -> pl.DataFrame:
         """
         Calculate summary statistics for PK parameters by formulation.
@@ -475,12 +737,12 @@ class Crossover2x2:
         summary_rows = []
         
         for param in pk_params:
-            if param not in self._df_params.columns:
+            if param not in self.params_df.columns:
                 continue
                 
             # Group by formulation and calculate statistics
             summary = (
-                self._df_params
+                self.params_df
                 .group_by(self._form_col)
                 .agg([
                     pl.col(param).mean().alias("Mean"),
@@ -520,16 +782,17 @@ class Crossover2x2:
             Path where the CSV file will be saved
         """
         # Ensure we have the most updated parameter data
-        self._df_params.write_csv(file_path)
+        self.params_df.write_csv(file_path)
         print(f"Results exported to {file_path}")
 
-    def get_params_df(self) -> pl.DataFrame:
-        """
-        Get the DataFrame containing all calculated PK parameters.
-        
-        Returns
-        -------
-        pl.DataFrame
-            DataFrame with PK parameters
-        """
-        return self._df_params
+    def _auc_rule(self) -> str:
+        """Trapezoidal rule of the analyzer (``PKDesignMixin`` hook)."""
+        return self._auc_method
+
+    def _params_sort_cols(self) -> List[str]:
+        """Columns the parameter frames are sorted by (``PKDesignMixin`` hook)."""
+        return [self._subject_col, self._form_col, self._period_col]
+
+    def _model_factors(self) -> List[str]:
+        """Factor columns encoded by the model frame (``PKDesignMixin`` hook)."""
+        return [self._subject_col, self._seq_col, self._period_col, self._form_col]
@@ -0,0 +1,255 @@
+"""
+Crossover Statistics Module
+
+This module implements closed-form statistics for the standard 2x2 crossover design, computed
+directly from per-subject arrays instead of fitting a linear model.
+
+Every subject contributes one Test and one Reference observation (of a log-transformed PK
+parameter) and belongs to one of the two sequences, identified by whether Test was given in the
+second period. All sums of squares then follow from the per-subject sums and Test - Reference
+differences (Chow & Liu, Design and Analysis of Bioavailability and Bioequivalence Studies,
+chapter 3), which is valid for balanced and unbalanced sequence sizes.
+
+``sequence_means`` is the one-way layout over sequences (per-sequence means, pooled within-sequence
+variance) behind these statistics. It is shared with the intra-subject contrasts of the replicate
+designs (``bioeq.reference_scaled``), the stratum means of the bootstrap and the leave-one-subject-out
+influence analyses (``sequence_means_leave_one_out``).
+"""
+
+import numpy as np
+from scipy import stats
+from typing import Dict
+
+
+def sequence_means(
+    values: np.ndarray,
+    sequences: np.ndarray,
+) -> Dict[str, np.ndarray]:
+    """
+    Analyse per-subject values as a one-way layout over sequences.
+
+    Missing values (NaN) are excluded per subject.
+
+    Parameters
+    ----------
+    values : np.ndarray
+        Per-subject values of shape (..., n_subjects)
+    sequences : np.ndarray
+        Sequence label of every subject (n_subjects,), e.g. integer codes or
+        the boolean ``test_second`` of a 2x2 design
+
+    Returns
+    -------
+    Dict[str, np.ndarray]
+        mean (unweighted average of the sequence means), variance (pooled
+        within-sequence variance), df, se of the mean, the number of subjects
+        ``n`` used, and the per-sequence ``group_means`` and ``counts`` of shape
+        (..., n_sequences), ordered by the sorted sequence codes
+    """
+    values = np.asarray(values, dtype=np.float64)
+    codes = np.unique(np.asarray(sequences), return_inverse=True)[1].ravel()
+    one_hot = np.eye(codes.max() + 1)[codes]
+    observed = ~np.isnan(values)
+    filled = np.where(observed, values, 0.0)
+
+    counts = observed.astype(np.float64) @ one_hot
+    with np.errstate(divide="ignore", invalid="ignore"):
+        group_means = (filled @ one_hot) / counts
+        present = counts > 0
+        n_groups = present.sum(axis=-1)
+        centered = np.where(observed, filled - (group_means @ one_hot.T), 0.0)
+        n = counts.sum(axis=-1)
+        df = n - n_groups
+        variance = np.sum(centered ** 2, axis=-1) / df
+        mean = np.where(present, group_means, 0.0).sum(axis=-1) / n_groups
+        inverse_counts = np.where(present, 1 / counts, 0.0).sum(axis=-1)
+        se = np.sqrt(variance * inverse_counts) / n_groups
+
+    return {
+        "mean": mean,
+        "variance": variance,
+        "df": df,
+        "se": se,
+        "n": n,
+        "group_means": group_means,
+        "counts": counts,
+    }
+
+
+def sequence_means_leave_one_out(
+    values: np.ndarray,
+    sequences: np.ndarray,
+) -> Dict[str, np.ndarray]:
+    """
+    Recompute ``sequence_means`` with each subject left out, by downdating.
+
+    Removing subject i from its sequence g changes only that sequence's size,
+    mean and sum of squares:
+
+        m_g' = (n_g·m_g - v_i) / (n_g - 1),  SS_g' = SS_g - (v_i - m_g)²·n_g / (n_g - 1)
+
+    so all leave-one-out fits follow from the full-data statistics without
+    refitting. Subjects with a missing value leave the analysis unchanged.
+
+    Parameters
+    ----------
+    values : np.ndarray
+        Per-subject values (n_subjects,)
+    sequences : np.ndarray
+        Integer sequence code of every subject (n_subjects,)
+
+    Returns
+    -------
+    Dict[str, np.ndarray]
+        For every left-out subject: mean, variance, df and se as in
+        ``sequence_means``, and the externally studentized residual of the
+        subject, (v_i - m_g) / (s_(i)·sqrt(1 - 1/n_g)). Fits are NaN where a
+        sequence would lose its only subject.
+    """
+    values = np.asarray(values, dtype=np.float64)
+    codes = np.unique(np.asarray(sequences), return_inverse=True)[1].ravel()
+    full = sequence_means(values, codes)
+    observed = ~np.isnan(values)
+
+    one_hot = np.eye(codes.max() + 1)[codes]
+    counts = observed.astype(np.float64) @ one_hot
+    with np.errstate(divide="ignore", invalid="ignore"):
+        group_means = (np.where(observed, values, 0.0) @ one_hot) / counts
+        n_g = counts[codes]
+        residual = values - group_means[codes]
+        remaining = n_g - 1
+        present = counts > 0
+        n_groups = present.sum()
+        inverse_counts = np.where(present, 1 / counts, 0.0).sum()
+
+        df = full["df"] - 1
+        variance = (full["variance"] * full["df"] - residual ** 2 * n_g / remaining) / df
+        mean = full["mean"] - residual / remaining / n_groups
+        se = np.sqrt(variance * (inverse_counts - 1 / n_g + 1 / remaining)) / n_groups
+        studentized = residual / np.sqrt(variance * (1 - 1 / n_g))
+
+    valid = remaining > 0
+    return {
+        "mean": np.where(observed, np.where(valid, mean, np.nan), full["mean"]),
+        "variance": np.where(observed, np.where(valid, variance, np.nan), full["variance"]),
+        "df": np.where(observed, df, full["df"]),
+        "se": np.where(observed, np.where(valid, se, np.nan), full["se"]),
+        "studentized": np.where(observed & valid, studentized, np.nan),
+    }
+
+
+def anova_2x2(
+    y_test: np.ndarray,
+    y_ref: np.ndarray,
+    test_second: np.ndarray,
+) -> Dict[str, Dict[str, float]]:
+    """
+    Compute the 2x2 crossover ANOVA table from per-subject observations.
+
+    The between-subject stratum is split into sequence and subject(sequence); the
+    within-subject stratum into period, formulation and residual. Sequence is
+    tested against subject(sequence), period and formulation against the residual.
+
+    Parameters
+    ----------
+    y_test : np.ndarray
+        Test observation of every subject
+    y_ref : np.ndarray
+        Reference observation of every subject
+    test_second : np.ndarray
+        Boolean per subject; True when Test was given in the second period (RT sequence)
+
+    Returns
+    -------
+    Dict[str, Dict[str, float]]
+        For each source ("sequence", "subject", "period", "formulation", "residual"):
+        sum_sq, df, mean_sq, F and p_value (F and p_value are NaN for error terms)
+    """
+    y_test = np.asarray(y_test, dtype=np.float64)
+    y_ref = np.asarray(y_ref, dtype=np.float64)
+    test_second = np.asarray(test_second, dtype=bool)
+
+    diff_fit = sequence_means(y_test - y_ref, test_second)
+    mean_fit = sequence_means((y_test + y_ref) / 2, test_second)
+    if diff_fit["counts"].size != 2:
+        raise ValueError("Both sequences need at least one subject with Test and Reference observations.")
+    diff_tr, diff_rt = diff_fit["group_means"]
+    mean_tr, mean_rt = mean_fit["group_means"]
+    n_tr, n_rt = diff_fit["counts"]
+    n = n_tr + n_rt
+    harmonic = 2 * n_tr * n_rt / n
+
+    # Within-subject contrasts: formulation and period effects from the sequence
+    # means of the Test - Reference differences
+    formulation = diff_fit["mean"]
+    period = (diff_rt - diff_tr) / 2
+
+    table = {
+        "sequence": {"sum_sq": harmonic * (mean_tr - mean_rt) ** 2, "df": 1},
+        "subject": {"sum_sq": 2 * mean_fit["variance"] * mean_fit["df"], "df": int(n) - 2},
+        "period": {"sum_sq": harmonic * period ** 2, "df": 1},
+        "formulation": {"sum_sq": harmonic * formulation ** 2, "df": 1},
+        "residual": {"sum_sq": diff_fit["variance"] * diff_fit["df"] / 2, "df": int(n) - 2},
+    }
+    for row in table.values():
+        row["mean_sq"] = row["sum_sq"] / row["df"] if row["df"] > 0 else np.nan
+        row["F"] = np.nan
+        row["p_value"] = np.nan
+
+    for source, error in [("sequence", "subject"), ("period", "residual"), ("formulation", "residual")]:
+        row, denominator = table[source], table[error]
+        if denominator["df"] > 0 and denominator["mean_sq"] > 0:
+            row["F"] = row["mean_sq"] / denominator["mean_sq"]
+            row["p_value"] = stats.f.sf(row["F"], row["df"], denominator["df"])
+
+    return table
+
+
+def point_estimate_2x2(
+    y_test: np.ndarray,
+    y_ref: np.ndarray,
+    test_second: np.ndarray,
+    alpha: float = 0.1,
+) -> Dict[str, np.ndarray]:
+    """
+    Estimate the Test - Reference difference and its exact (1 - alpha) confidence interval.
+
+    The estimate is the average over sequences of the mean Test - Reference
+    difference, which removes the period effect. Its standard error follows from
+    the pooled within-sequence variance of the differences (``sequence_means``), giving the same
+    interval as the 2x2 ANOVA residual mean square with N - 2 degrees of freedom.
+
+    The last axis indexes subjects; leading axes (e.g. simulated studies sharing
+    one sequence allocation) are evaluated together.
+
+    Parameters
+    ----------
+    y_test : np.ndarray
+        Test observations (log scale), shape ``(..., n_subjects)``
+    y_ref : np.ndarray
+        Reference observations (log scale), same shape as ``y_test``
+    test_second : np.ndarray
+        Boolean per subject; True when Test was given in the second period
+    alpha : float, default=0.1
+        Two-sided significance level (0.1 gives the 90% interval used for BE)
+
+    Returns
+    -------
+    Dict[str, np.ndarray]
+        estimate, se, df, lower and upper (log scale)
+    """
+    diff = np.asarray(y_test, dtype=np.float64) - np.asarray(y_ref, dtype=np.float64)
+    fit = sequence_means(diff, np.asarray(test_second, dtype=bool))
+    estimate, se, df = fit["mean"], fit["se"], fit["df"]
+    # Studies stacked on the leading axes share a few distinct df values
+    df_values, inverse = np.unique(df, return_inverse=True)
+    with np.errstate(invalid="ignore"):
+        t_crit = stats.t.ppf(1 - alpha / 2, df_values)[inverse].reshape(np.shape(df))
+
+    return {
+        "estimate": estimate,
+        "se": se,
+        "df": df,
+        "lower": estimate - t_crit * se,
+        "upper": estimate + t_crit * se,
+    }
@@ -0,0 +1,160 @@
+"""
+Design Base Module
+
+This module implements the NCA and parameter-table plumbing shared by the design classes
+(Crossover2x2, ParallelDesign and ReplicateCrossover).
+
+Each design class packs its concentration-time profiles into a ``nca.ProfileSet`` and registers its
+parameter calculators in a ``nca.ParameterTable``. ``PKDesignMixin`` builds on these to provide the
+materialized ``params_df``, per-column parameter frames for lazy analyses, the cached
+``linear_model.ModelFrame`` of a parameter frame, the terminal-phase fit and partial-AUC queries.
+"""
+
+import polars as pl
+import numpy as np
+from abc import ABC, abstractmethod
+from functools import cached_property
+from typing import Dict, List, Optional, Tuple
+
+from . import linear_model, nca
+
+
+class PKDesignMixin(ABC):
+    """
+    Parameter plumbing shared by the design classes.
+
+    Subclasses set ``_profiles`` (``nca.ProfileSet``) and ``_parameters``
+    (``nca.ParameterTable``), call ``_reset_params`` from ``__init__`` and
+    implement the abstract hooks below; a design class missing one fails at
+    instantiation.
+
+    Parameter frames are cached per column set: in lazy mode ``_params_for``
+    returns the same frame for the same columns, and model frames are kept per
+    column set, so repeated analyses of a metric encode its design only once.
+    """
+
+    def _reset_params(self, params: Optional[pl.DataFrame] = None) -> None:
+        """Set the materialized parameter frame (None for lazy) and drop the derived caches."""
+        self._params_df = params
+        self._param_frames: Dict[Tuple[str, ...], pl.DataFrame] = {}
+        self._models: Dict[Tuple[str, ...], linear_model.ModelFrame] = {}
+
+    @abstractmethod
+    def _auc_rule(self) -> str:
+        """Trapezoidal rule of the analyzer, one of ``nca.AUC_METHODS``."""
+
+    @abstractmethod
+    def _params_sort_cols(self) -> List[str]:
+        """Columns the parameter frames are sorted by (none keeps the profile order)."""
+
+    @abstractmethod
+    def _model_factors(self) -> List[str]:
+        """Factor columns encoded by the model frame; the first is the subject column."""
+
+    @abstractmethod
+    def _terminal_window(self) -> np.ndarray:
+        """Boolean mask of the packed samples used for the terminal-phase fit."""
+
+    def _calculate_pk_parameters(self) -> pl.DataFrame:
+        """Calculate the parameters of ``params_df``."""
+        return self._parameters.frame(self._parameters.names)
+
+    def _sort_params(self, frame: pl.DataFrame) -> pl.DataFrame:
+        """Sort a parameter frame for readability."""
+        columns = self._params_sort_cols()
+        return frame.sort(columns) if columns else frame
+
+    @property
+    def params_df(self) -> pl.DataFrame:
+        """DataFrame containing the calculated PK parameters, materialized on first access."""
+        if self._params_df is None:
+            self._params_df = self._sort_params(self._calculate_pk_parameters())
+        return self._params_df
+
+    @params_df.setter
+    def params_df(self, value: pl.DataFrame) -> None:
+        self._reset_params(value)
+
+    def get_params_df(self, columns: Optional[List[str]] = None) -> pl.DataFrame:
+        """
+        Get the DataFrame containing calculated PK parameters.
+
+        Parameters
+        ----------
+        columns : List[str], optional
+            PK parameters to include (e.g., ["log_Cmax"]). Only these are computed
+            when running lazily; all parameters are returned by default.
+
+        Returns
+        -------
+        pl.DataFrame
+            DataFrame with PK parameters
+        """
+        if columns is None:
+            return self.params_df
+        return self._sort_params(self._parameters.frame(columns))
+
+    def _params_for(self, columns: List[str]) -> pl.DataFrame:
+        """Return a parameter frame holding ``columns``, computing only those if not yet materialized."""
+        if self._params_df is not None:
+            return self._params_df
+        key = tuple(col for col in columns if col in self._parameters.names)
+        if key not in self._param_frames:
+            self._param_frames[key] = self.get_params_df(list(key))
+        return self._param_frames[key]
+
+    def _model_frame(self, params: pl.DataFrame) -> linear_model.ModelFrame:
+        """Return the cached numeric model representation of ``params``, keyed on its column set."""
+        key = tuple(params.columns)
+        model = self._models.get(key)
+        if model is None or model.params is not params:
+            factors = self._model_factors()
+            model = self._models[key] = linear_model.ModelFrame(params, factors, subject_col=factors[0])
+        return model
+
+    @cached_property
+    def _lambda_z_fit(self) -> nca.TerminalFit:
+        """Log-linear regression over the terminal window of every profile."""
+        return nca.loglinear_fit(self._profiles, self._terminal_window())
+
+    @cached_property
+    def _cumulative_auc(self) -> np.ndarray:
+        """Running AUC at every packed sample, built once and shared by all partial-AUC queries."""
+        return nca.cumulative_auc(self._profiles, self._auc_rule())
+
+    def calculate_partial_auc(
+        self,
+        windows: List[Tuple[float, float]],
+        names: Optional[List[str]] = None,
+    ) -> pl.DataFrame:
+        """
+        Compute partial AUCs over arbitrary ``[t1, t2]`` time windows.
+
+        Cumulative AUC arrays are built once per analyzer; each window is then
+        answered by a binary search per profile, with the concentration
+        interpolated at the window edges using the configured ``auc_method``.
+        Any number of windows is evaluated in a single vectorized query.
+
+        Parameters
+        ----------
+        windows : List[Tuple[float, float]]
+            Window bounds, e.g. ``[(0, 2), (0, 72)]``
+        names : List[str], optional
+            Column names for the windows; defaults to ``"AUC_{t1}-{t2}"``
+
+        Returns
+        -------
+        pl.DataFrame
+            One row per profile with a partial-AUC column per window (null when a
+            window extends beyond the sampled time range of the profile)
+        """
+        if names is None:
+            names = [f"AUC_{t1:g}-{t2:g}" for t1, t2 in windows]
+        if len(names) != len(windows):
+            raise ValueError("names must have one entry per window")
+        values = nca.partial_auc(
+            self._profiles, windows, self._auc_rule(), cumulative=self._cumulative_auc
+        )
+        return self._sort_params(self._profiles.keys.with_columns(
+            [nca.as_series(name, values[:, i]) for i, name in enumerate(names)]
+        ))
@@ -0,0 +1,303 @@
+"""
+Linear Model Module
+
+This module implements the fixed-effects linear models behind the batch point-estimate analyses of
+the design classes.
+
+The design matrix of a study (treatment-coded subject, period and formulation effects) is the same
+for every PK metric, so it is factorized once with a QR decomposition and every metric is solved as
+one column of a multi-response least-squares problem. Metrics with different missing values are
+grouped by their missingness pattern so that each pattern is factorized only once.
+
+``ModelFrame`` holds the numeric form of a parameter table (integer-coded factors and subject index,
+design matrices and their factorizations) so that the design classes build it once per table
+instead of on every call. The mixed models are fitted on the same cached designs, so no formula is
+parsed per call; only the ``anova_lm`` tables, which need a formula's term structure, use the
+pandas copy.
+"""
+
+import polars as pl
+import numpy as np
+import pandas as pd
+import statsmodels.api as sm
+from functools import cached_property
+from scipy import linalg, stats
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+
+class LinearFit(NamedTuple):
+    """Least-squares estimates for one or more response columns sharing a design."""
+
+    names: List[str]
+    coef: np.ndarray
+    se: np.ndarray
+    df: int
+    sigma2: np.ndarray
+
+
+class LinearModel:
+    """
+    Ordinary least squares with a design factorized once and reused across responses.
+
+    Parameters
+    ----------
+    X : np.ndarray
+        Design matrix of shape (n_observations, n_coefficients)
+    names : List[str]
+        Coefficient names
+    drop_aliased : bool, default=False
+        Drop columns that are linear combinations of earlier columns (e.g. period
+        effects confounded with sequence in a Reference-only model), as linear
+        model software does for aliased effects; otherwise a rank-deficient design
+        raises ValueError
+
+    Attributes
+    ----------
+    aliased : List[str]
+        Names of the dropped columns
+    """
+
+    def __init__(self, X: np.ndarray, names: List[str], drop_aliased: bool = False) -> None:
+        """Factorize the design matrix."""
+        self.q, self.r = np.linalg.qr(X)
+        diagonal = np.abs(np.diag(self.r))
+        dependent = diagonal <= 1e-10 * diagonal.max() if diagonal.size else diagonal.astype(bool)
+        if dependent.any():
+            if not drop_aliased:
+                raise ValueError("Design matrix is rank deficient")
+            X = X[:, ~dependent]
+            self.q, self.r = np.linalg.qr(X)
+        self.names = [name for name, drop in zip(names, dependent) if not drop]
+        self.aliased = [name for name, drop in zip(names, dependent) if drop]
+        self.df_resid = X.shape[0] - X.shape[1]
+        # Unscaled coefficient variances: diag((X'X)^-1) = row norms of R^-1
+        r_inv = linalg.solve_triangular(self.r, np.eye(X.shape[1]))
+        self.unscaled_var = np.sum(r_inv ** 2, axis=1)
+
+    def fit(self, Y: np.ndarray) -> LinearFit:
+        """
+        Solve the least-squares problem for every response column.
+
+        Parameters
+        ----------
+        Y : np.ndarray
+            Responses of shape (n_observations,) or (n_observations, n_responses)
+
+        Returns
+        -------
+        LinearFit
+            Coefficients and standard errors of shape (n_coefficients, n_responses)
+        """
+        Y = np.asarray(Y, dtype=np.float64).reshape(self.q.shape[0], -1)
+        projected = self.q.T @ Y
+        coef = linalg.solve_triangular(self.r, projected)
+        residual = Y - self.q @ projected
+        with np.errstate(divide="ignore", invalid="ignore"):
+            sigma2 = np.sum(residual ** 2, axis=0) / self.df_resid
+        se = np.sqrt(np.outer(self.unscaled_var, sigma2))
+        return LinearFit(names=self.names, coef=coef, se=se, df=self.df_resid, sigma2=sigma2)
+
+
+class ModelFrame:
+    """
+    Numeric model representation of a parameter table, built once and reused.
+    
+    Factors are integer-coded against their sorted levels; design matrices and
+    their QR factorizations are cached per factor list and row subset. The
+    source frame is kept so that owners can detect when it is replaced.
+    
+    Parameters
+    ----------
+    params : pl.DataFrame
+        One row per observation with the factor and metric columns
+    factors : List[str]
+        Factor columns to encode
+    subject_col : str
+        Subject column, encoded as well and exposed as ``subject_index``
+    
+    Attributes
+    ----------
+    params : pl.DataFrame
+        The source frame
+    levels : Dict[str, np.ndarray]
+        Sorted levels of every factor
+    codes : Dict[str, np.ndarray]
+        Integer code (index into ``levels``) of every row, per factor
+    """
+
+    def __init__(self, params: pl.DataFrame, factors: List[str], subject_col: str) -> None:
+        """Encode the factors and subjects of ``params``."""
+        self.params = params
+        self.subject_col = subject_col
+        self.levels: Dict[str, np.ndarray] = {}
+        self.codes: Dict[str, np.ndarray] = {}
+        for column in dict.fromkeys([subject_col, *factors]):
+            self.levels[column], codes = np.unique(params[column].to_numpy(), return_inverse=True)
+            self.codes[column] = codes.ravel()
+        self._designs: Dict[tuple, Tuple[np.ndarray, List[str]]] = {}
+        self._models: Dict[tuple, LinearModel] = {}
+
+    @property
+    def subject_index(self) -> np.ndarray:
+        """Integer subject code of every row, used as the mixed-model groups."""
+        return self.codes[self.subject_col]
+
+    @cached_property
+    def pandas(self) -> pd.DataFrame:
+        """The source frame converted to pandas once, for the formula-based ``anova_lm`` tables."""
+        return self.params.to_pandas()
+
+    def observed(self, metric: str) -> np.ndarray:
+        """Boolean mask of the rows where ``metric`` is not null."""
+        return self.params[metric].is_not_null().to_numpy()
+
+    def design(self, factors: List[str], rows: Optional[np.ndarray] = None) -> Tuple[np.ndarray, List[str]]:
+        """
+        Build (or reuse) the intercept plus treatment-coded design for ``factors``.
+        
+        Parameters
+        ----------
+        factors : List[str]
+            Encoded factor columns, in model order
+        rows : np.ndarray, optional
+            Boolean mask of the rows to use (all rows by default); levels absent
+            from the subset are dropped, as when coding the subset on its own
+        
+        Returns
+        -------
+        Tuple[np.ndarray, List[str]]
+            Design matrix and column names (``C(factor)[T.level]`` with the first
+            sorted level as the baseline, as in statsmodels formulas)
+        """
+        key = (tuple(factors), None if rows is None else rows.tobytes())
+        if key not in self._designs:
+            n = len(self.params) if rows is None else int(np.count_nonzero(rows))
+            blocks = [np.ones((n, 1))]
+            names = ["Intercept"]
+            for factor in factors:
+                codes = self.codes[factor] if rows is None else self.codes[factor][rows]
+                present, codes = np.unique(codes, return_inverse=True)
+                dummies = np.zeros((n, len(present) - 1))
+                shifted = np.flatnonzero(codes > 0)
+                dummies[shifted, codes[shifted] - 1] = 1.0
+                blocks.append(dummies)
+                names += [f"C({factor})[T.{level}]" for level in self.levels[factor][present[1:]]]
+            self._designs[key] = (np.hstack(blocks), names)
+        return self._designs[key]
+
+    def least_squares(
+        self,
+        factors: List[str],
+        rows: Optional[np.ndarray] = None,
+        drop_aliased: bool = False,
+    ) -> LinearModel:
+        """Return the (cached) factorized linear model of ``design(factors, rows)``."""
+        key = (tuple(factors), None if rows is None else rows.tobytes(), drop_aliased)
+        if key not in self._models:
+            X, names = self.design(factors, rows)
+            self._models[key] = LinearModel(X, names, drop_aliased=drop_aliased)
+        return self._models[key]
+
+    def mixed_model(self, metric: str, factors: List[str]) -> sm.MixedLM:
+        """
+        Build the random-subject-intercept model of ``metric`` on the cached design.
+        
+        The rows where ``metric`` is observed are modelled with an intercept and
+        the treatment-coded ``factors`` (named as in statsmodels formulas), grouped
+        by ``subject_index``. This is the model of
+        ``smf.mixedlm("metric ~ C(f1) + ...", groups=subject)`` without parsing a
+        formula.
+        
+        Parameters
+        ----------
+        metric : str
+            Response column
+        factors : List[str]
+            Encoded factor columns, in model order
+        
+        Returns
+        -------
+        sm.MixedLM
+            The unfitted model
+        """
+        rows = self.observed(metric)
+        X, names = self.design(factors, rows)
+        endog = pd.Series(self.params[metric].to_numpy()[rows], name=metric)
+        return sm.MixedLM(endog, pd.DataFrame(X, columns=names), groups=self.subject_index[rows])
+
+    def formulation_effects(self, metrics: List[str], factors: List[str], form_col: str) -> pl.DataFrame:
+        """
+        Estimate the Test - Reference effect of several metrics with one shared model.
+        
+        The model holds an intercept, ``factors`` and the formulation, all
+        treatment-coded; the effect is the ``C(form_col)[T.test]`` coefficient. Each metric uses the rows where it is observed; metrics
+        observed on the same rows share one factorization of the design and are
+        solved together.
+        
+        Parameters
+        ----------
+        metrics : List[str]
+            Log-transformed metrics to analyze
+        factors : List[str]
+            Nuisance factors of the model (e.g. subject and period)
+        form_col : str
+            Formulation column; its first level (sorted) is the reference
+        
+        Returns
+        -------
+        pl.DataFrame
+            One row per metric with n, df, estimate, se (log scale), point_estimate,
+            lower_90ci, upper_90ci (percent) and be_criteria_met (80-125% rule)
+        
+        Raises
+        ------
+        ValueError
+            If ``form_col`` does not have exactly 2 levels, or a metric's observed
+            rows do not estimate the Test - Reference effect (e.g. they cover a
+            single formulation)
+        """
+        levels = self.levels[form_col]
+        if len(levels) != 2:
+            raise ValueError(f"Exactly 2 formulation levels required, but found {len(levels)}.")
+        term = f"C({form_col})[T.{levels[1]}]"
+        
+        observed = self.params.select([pl.col(metric).is_not_null() for metric in metrics]).to_numpy()
+        groups = {}
+        for k, metric in enumerate(metrics):
+            groups.setdefault(observed[:, k].tobytes(), []).append(k)
+
+        rows = {}
+        for columns in groups.values():
+            mask = observed[:, columns[0]]
+            group_metrics = [metrics[k] for k in columns]
+            model = self.least_squares(factors + [form_col], mask)
+            fit = model.fit(self.params.filter(pl.Series(mask)).select(group_metrics).to_numpy())
+            if term not in fit.names:
+                raise ValueError(
+                    f"No {form_col} effect can be estimated for {', '.join(group_metrics)}: "
+                    f"{term} is not in the design of the observed rows."
+                )
+            for j, metric in enumerate(group_metrics):
+                rows[metric] = _effect_row(metric, int(mask.sum()), fit, fit.names.index(term), j)
+
+        return pl.DataFrame([rows[metric] for metric in metrics])
+
+
+def _effect_row(metric: str, n: int, fit: LinearFit, coef_index: int, column: int) -> dict:
+    """Summarize the formulation coefficient of one response column with its 90% CI."""
+    estimate = fit.coef[coef_index, column]
+    se = fit.se[coef_index, column]
+    t_crit = stats.t.ppf(0.95, fit.df) if fit.df > 0 else np.nan
+    lower = np.exp(estimate - t_crit * se) * 100
+    upper = np.exp(estimate + t_crit * se) * 100
+    return {
+        "metric": metric,
+        "n": n,
+        "df": fit.df,
+        "estimate": estimate,
+        "se": se,
+        "point_estimate": np.exp(estimate) * 100,
+        "lower_90ci": lower,
+        "upper_90ci": upper,
+        "be_criteria_met": bool(80 <= lower and upper <= 125),
+    }
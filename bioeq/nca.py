@@ -0,0 +1,707 @@
+"""
+NCA Module
+
+This module implements the non-compartmental analysis (NCA) kernels shared by the design classes
+(Crossover2x2, ParallelDesign and ReplicateCrossover).
+
+Concentration-time data are converted once into contiguous NumPy arrays sorted by profile and time,
+using a CSR-style layout: profile ``i`` occupies ``times[offsets[i]:offsets[i + 1]]`` and
+``concs[offsets[i]:offsets[i + 1]]``. Every kernel evaluates all profiles at once with vectorized
+segment reductions, so the cost grows with the number of samples rather than with the number of
+Python-level iterations over profiles.
+"""
+
+import polars as pl
+import numpy as np
+from typing import Callable, Dict, List, NamedTuple, Optional, Tuple, Union
+
+# Trapezoidal rules for AUC
+AUC_METHODS = ("linear", "linear_up_log_down")
+
+# Terminal-phase selection rules for lambda_z
+LAMBDA_Z_METHODS = ("last_3", "best_fit")
+
+
+class ProfileSet:
+    """
+    Concentration-time profiles packed into contiguous, time-sorted arrays.
+
+    Parameters
+    ----------
+    times : np.ndarray
+        Sampling times of all profiles, sorted by time within each profile
+    concs : np.ndarray
+        Concentrations aligned with ``times``
+    offsets : np.ndarray
+        Profile boundaries of length ``n_profiles + 1``; profile ``i`` spans
+        ``offsets[i]:offsets[i + 1]``
+    keys : pl.DataFrame, optional
+        One row per profile identifying it (e.g. subject, period, formulation)
+
+    Attributes
+    ----------
+    n_profiles : int
+        Number of profiles
+    sizes : np.ndarray
+        Number of samples in each profile
+    segment_ids : np.ndarray
+        Profile index of every sample
+    positions : np.ndarray
+        Position of every sample within its profile
+    time_dtype, conc_dtype : pl.DataType
+        Polars dtypes of the source time and concentration columns
+    """
+
+    def __init__(
+        self,
+        times: np.ndarray,
+        concs: np.ndarray,
+        offsets: np.ndarray,
+        keys: Optional[pl.DataFrame] = None,
+    ) -> None:
+        """Initialize the profile set from CSR-style arrays."""
+        self.times = np.ascontiguousarray(times, dtype=np.float64)
+        self.concs = np.ascontiguousarray(concs, dtype=np.float64)
+        self.offsets = np.asarray(offsets, dtype=np.int64)
+        self.keys = keys
+        self.time_dtype = pl.Float64
+        self.conc_dtype = pl.Float64
+
+        self.n_profiles = len(self.offsets) - 1
+        self.sizes = np.diff(self.offsets)
+        self.segment_ids = np.repeat(np.arange(self.n_profiles), self.sizes)
+        self.positions = np.arange(len(self.times)) - self.offsets[self.segment_ids]
+
+    @classmethod
+    def from_frame(
+        cls,
+        data: Union[pl.DataFrame, pl.LazyFrame],
+        group_cols: List[str],
+        time_col: str,
+        conc_col: str,
+        carry_cols: Optional[List[str]] = None,
+        filters: Optional[pl.Expr] = None,
+    ) -> "ProfileSet":
+        """
+        Build a profile set from a long-format concentration-time frame.
+
+        The column projection, optional filters and the sort by profile and
+        time run as one query on the Polars streaming engine, so a
+        ``pl.LazyFrame`` source (e.g. ``pl.scan_parquet``) is only read for
+        the needed columns and rows.
+
+        Parameters
+        ----------
+        data : pl.DataFrame or pl.LazyFrame
+            Concentration-time data with one row per sample
+        group_cols : List[str]
+            Columns identifying a profile
+        time_col : str
+            Column name for time points
+        conc_col : str
+            Column name for concentration measurements
+        carry_cols : List[str], optional
+            Additional columns that are constant within a profile; the first
+            value of each profile is kept in ``keys``
+        filters : pl.Expr, optional
+            Row filter (e.g. on analyte or study) applied before the projection
+
+        Returns
+        -------
+        ProfileSet
+            Profiles sorted by ``group_cols`` and time
+        """
+        carry_cols = carry_cols or []
+        sorted_df = (
+            scan_columns(data, group_cols + carry_cols + [time_col, conc_col], filters)
+            .sort(group_cols + [time_col])
+            .collect(engine="streaming")
+        )
+
+        run_ids = sorted_df.select(pl.struct(group_cols).rle_id()).to_series().to_numpy()
+        starts = np.flatnonzero(np.diff(run_ids, prepend=-1))
+        offsets = np.append(starts, len(sorted_df))
+
+        profiles = cls(
+            times=sorted_df[time_col].cast(pl.Float64).to_numpy(),
+            concs=sorted_df[conc_col].cast(pl.Float64).to_numpy(),
+            offsets=offsets,
+            keys=sorted_df.select(group_cols + carry_cols)[starts],
+        )
+        profiles.time_dtype = sorted_df.schema[time_col]
+        profiles.conc_dtype = sorted_df.schema[conc_col]
+        return profiles
+
+    def segment_sum(self, values: np.ndarray) -> np.ndarray:
+        """Sum per-sample ``values`` within each profile."""
+        return np.bincount(self.segment_ids, weights=values, minlength=self.n_profiles)
+
+    def count(self, mask: np.ndarray) -> np.ndarray:
+        """Count the samples selected by ``mask`` within each profile."""
+        return np.bincount(self.segment_ids[mask], minlength=self.n_profiles)
+
+    def suffix_sum(self, values: np.ndarray) -> np.ndarray:
+        """Sum per-sample ``values`` from each position to the end of its profile."""
+        totals = np.append(np.cumsum(values[::-1])[::-1], 0)
+        return totals[:-1] - totals[self.offsets[1:]][self.segment_ids]
+
+
+def column_names(data: Union[pl.DataFrame, pl.LazyFrame]) -> List[str]:
+    """Return the column names of a frame or lazy query without collecting it."""
+    return data.collect_schema().names()
+
+
+def scan_columns(
+    data: Union[pl.DataFrame, pl.LazyFrame],
+    columns: List[str],
+    filters: Optional[pl.Expr] = None,
+) -> pl.LazyFrame:
+    """
+    Build a lazy query reading only ``columns`` (and the rows matching ``filters``).
+
+    The filter is applied before the projection so it may reference columns
+    that are not part of the analysis (e.g. an analyte or study identifier);
+    Polars pushes both down into ``scan_*`` sources.
+
+    Parameters
+    ----------
+    data : pl.DataFrame or pl.LazyFrame
+        Source data
+    columns : List[str]
+        Columns to keep
+    filters : pl.Expr, optional
+        Row filter to apply
+
+    Returns
+    -------
+    pl.LazyFrame
+        Lazy query over the requested columns
+    """
+    query = data.lazy()
+    if filters is not None:
+        query = query.filter(filters)
+    return query.select(columns)
+
+
+def interval_areas(profiles: ProfileSet, method: str = "linear") -> np.ndarray:
+    """
+    Compute the area of every sampling interval.
+
+    Parameters
+    ----------
+    profiles : ProfileSet
+        Profiles to evaluate
+    method : str, default="linear"
+        "linear" for the linear trapezoidal rule, or "linear_up_log_down" to
+        apply the logarithmic trapezoidal rule to intervals where the
+        concentration declines between two positive values
+
+    Returns
+    -------
+    np.ndarray
+        Area of the interval ending at each sample (``len(times) - 1`` values);
+        intervals spanning two profiles have zero area
+    """
+    if method not in AUC_METHODS:
+        raise ValueError(f"auc_method must be one of: {', '.join(AUC_METHODS)}")
+    t, c, seg = profiles.times, profiles.concs, profiles.segment_ids
+    dt = np.diff(t)
+    c1, c2 = c[:-1], c[1:]
+    area = dt * (c1 + c2) * 0.5
+    if method == "linear_up_log_down":
+        declining = (c2 < c1) & (c2 > 0)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            log_area = dt * (c1 - c2) / np.log(c1 / c2)
+        area = np.where(declining, log_area, area)
+    return np.where(seg[1:] == seg[:-1], area, 0.0)
+
+
+def auc(profiles: ProfileSet, method: str = "linear") -> np.ndarray:
+    """
+    Compute AUC from the first to the last sample of every profile.
+
+    Parameters
+    ----------
+    profiles : ProfileSet
+        Profiles to evaluate
+    method : str, default="linear"
+        Trapezoidal rule, see ``interval_areas``
+
+    Returns
+    -------
+    np.ndarray
+        AUC of every profile
+    """
+    area = interval_areas(profiles, method)
+    return np.bincount(profiles.segment_ids[1:], weights=area, minlength=profiles.n_profiles)
+
+
+def cumulative_auc(profiles: ProfileSet, method: str = "linear") -> np.ndarray:
+    """
+    Compute the running AUC from the first sample of each profile to every sample.
+
+    Parameters
+    ----------
+    profiles : ProfileSet
+        Profiles to evaluate
+    method : str, default="linear"
+        Trapezoidal rule, see ``interval_areas``
+
+    Returns
+    -------
+    np.ndarray
+        Cumulative AUC at every sample (0 at the first sample of each profile)
+    """
+    running = np.concatenate([[0.0], np.cumsum(interval_areas(profiles, method))])
+    return running - running[profiles.offsets[:-1]][profiles.segment_ids]
+
+
+def _segment_search(profiles: ProfileSet, query: np.ndarray) -> np.ndarray:
+    """
+    Find, per profile, the number of samples at or before each query time.
+
+    ``query`` has one row per profile. Times are replaced by their integer rank
+    among the distinct sample times and offset by the profile index, which makes
+    the packed samples globally sorted so that a single binary search
+    (``np.searchsorted``) answers every query exactly.
+    """
+    distinct = np.unique(profiles.times)
+    stride = len(distinct) + 1
+    sample_keys = profiles.segment_ids * stride + np.searchsorted(distinct, profiles.times)
+    query_rank = np.searchsorted(distinct, query, side="right") - 1
+    query_keys = np.arange(profiles.n_profiles)[:, None] * stride + query_rank
+    found = np.searchsorted(sample_keys, query_keys.ravel(), side="right").reshape(query.shape)
+    return found - profiles.offsets[:-1, None]
+
+
+def auc_to(
+    profiles: ProfileSet,
+    query: np.ndarray,
+    method: str = "linear",
+    cumulative: Optional[np.ndarray] = None,
+) -> np.ndarray:
+    """
+    Compute AUC from the first sample of each profile up to arbitrary times.
+
+    Query times falling between two samples are handled by interpolating the
+    concentration at the query time (log-linearly on declining segments when
+    ``method="linear_up_log_down"``) and adding the partial interval area.
+
+    Parameters
+    ----------
+    profiles : ProfileSet
+        Profiles to evaluate
+    query : np.ndarray
+        Query times, one row per profile (shape ``(n_profiles, n_queries)``)
+    method : str, default="linear"
+        Trapezoidal rule, see ``interval_areas``
+    cumulative : np.ndarray, optional
+        Precomputed ``cumulative_auc(profiles, method)``
+
+    Returns
+    -------
+    np.ndarray
+        AUC up to each query time; NaN outside the sampled time range of the profile
+    """
+    if cumulative is None:
+        cumulative = cumulative_auc(profiles, method)
+    query = np.asarray(query, dtype=np.float64)
+    starts = profiles.offsets[:-1, None]
+    ends = profiles.offsets[1:, None] - 1
+    rank = _segment_search(profiles, query)
+    inside = (rank > 0) & (query <= profiles.times[ends])
+    # Interval [t_j, t_next] holding each query time
+    j = starts + np.maximum(rank - 1, 0)
+    nxt = np.minimum(j + 1, ends)
+    t_j, t_next = profiles.times[j], profiles.times[nxt]
+    c_j, c_next = profiles.concs[j], profiles.concs[nxt]
+    dt = query - t_j
+    with np.errstate(divide="ignore", invalid="ignore"):
+        fraction = np.where(t_next > t_j, dt / (t_next - t_j), 0.0)
+        c_query = c_j + (c_next - c_j) * fraction
+        area = dt * (c_j + c_query) * 0.5
+        if method == "linear_up_log_down":
+            declining = (c_next < c_j) & (c_next > 0)
+            c_log = c_j * (c_next / c_j) ** fraction
+            log_area = np.where(dt > 0, dt * (c_j - c_log) / np.log(c_j / c_log), 0.0)
+            area = np.where(declining, log_area, area)
+    return np.where(inside, cumulative[j] + area, np.nan)
+
+
+def partial_auc(
+    profiles: ProfileSet,
+    windows: np.ndarray,
+    method: str = "linear",
+    cumulative: Optional[np.ndarray] = None,
+) -> np.ndarray:
+    """
+    Compute partial AUCs over ``[t1, t2]`` windows for every profile.
+
+    Parameters
+    ----------
+    profiles : ProfileSet
+        Profiles to evaluate
+    windows : np.ndarray
+        Window bounds of shape ``(n_windows, 2)`` shared by all profiles, or
+        ``(n_profiles, n_windows, 2)`` for profile-specific windows
+    method : str, default="linear"
+        Trapezoidal rule, see ``interval_areas``
+    cumulative : np.ndarray, optional
+        Precomputed ``cumulative_auc(profiles, method)``, reused across calls
+
+    Returns
+    -------
+    np.ndarray
+        Partial AUCs of shape ``(n_profiles, n_windows)``; NaN when a window
+        extends beyond the sampled time range of a profile
+    """
+    windows = np.asarray(windows, dtype=np.float64)
+    if np.any(windows[..., 1] <= windows[..., 0]):
+        raise ValueError("Partial AUC windows must satisfy t1 < t2")
+    if cumulative is None:
+        cumulative = cumulative_auc(profiles, method)
+    if windows.ndim == 2:
+        # Shared windows: evaluate each distinct edge once for all profiles
+        edges, inverse = np.unique(windows, return_inverse=True)
+        query = np.broadcast_to(edges, (profiles.n_profiles, len(edges)))
+        bounds = auc_to(profiles, query, method, cumulative)[:, inverse.reshape(windows.shape)]
+    else:
+        query = windows.reshape(profiles.n_profiles, -1)
+        bounds = auc_to(profiles, query, method, cumulative).reshape(windows.shape)
+    return bounds[..., 1] - bounds[..., 0]
+
+
+def cmax(profiles: ProfileSet) -> np.ndarray:
+    """
+    Compute the maximum observed concentration of every profile.
+
+    Missing (NaN) concentrations are ignored.
+    """
+    return np.fmax.reduceat(profiles.concs, profiles.offsets[:-1])
+
+
+def tmax(profiles: ProfileSet, cmax_values: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Compute the first time at which the maximum concentration is observed.
+
+    Parameters
+    ----------
+    profiles : ProfileSet
+        Profiles to evaluate
+    cmax_values : np.ndarray, optional
+        Precomputed Cmax values; computed when not given
+
+    Returns
+    -------
+    np.ndarray
+        Tmax of every profile
+    """
+    if cmax_values is None:
+        cmax_values = cmax(profiles)
+    index = np.arange(len(profiles.concs))
+    at_max = profiles.concs == cmax_values[profiles.segment_ids]
+    first = np.minimum.reduceat(np.where(at_max, index, len(index)), profiles.offsets[:-1])
+    return profiles.times[np.minimum(first, len(index) - 1)]
+
+
+def clast(profiles: ProfileSet, positive_only: bool = True) -> np.ndarray:
+    """
+    Return the last concentration of every profile.
+
+    Parameters
+    ----------
+    profiles : ProfileSet
+        Profiles to evaluate
+    positive_only : bool, default=True
+        Return the last positive concentration (C_last in the NCA sense)
+        rather than the last observed one; NaN when a profile has none
+
+    Returns
+    -------
+    np.ndarray
+        Last concentration of every profile
+    """
+    if not positive_only:
+        return profiles.concs[profiles.offsets[1:] - 1]
+    index = np.where(profiles.concs > 0, np.arange(len(profiles.concs)), -1)
+    last = np.maximum.reduceat(index, profiles.offsets[:-1])
+    return np.where(last >= 0, profiles.concs[np.maximum(last, 0)], np.nan)
+
+
+def terminal_window(
+    profiles: ProfileSet,
+    n_points: int = 3,
+    eligible: Optional[np.ndarray] = None,
+) -> np.ndarray:
+    """
+    Select the last ``n_points`` eligible samples of every profile.
+
+    Parameters
+    ----------
+    profiles : ProfileSet
+        Profiles to evaluate
+    n_points : int, default=3
+        Number of trailing samples to select
+    eligible : np.ndarray, optional
+        Boolean mask of samples that may be selected; all samples by default
+
+    Returns
+    -------
+    np.ndarray
+        Boolean mask of the selected samples
+    """
+    if eligible is None:
+        eligible = np.ones(len(profiles.times), dtype=bool)
+    # Number of eligible samples at or after each position within its profile
+    rank_from_end = profiles.suffix_sum(eligible.astype(np.int64))
+    return eligible & (rank_from_end <= n_points)
+
+
+class TerminalFit(NamedTuple):
+    """Per-profile log-linear regression over a terminal-phase window."""
+
+    slope: np.ndarray
+    adj_r2: np.ndarray
+    n_points: np.ndarray
+    start: np.ndarray
+    end: np.ndarray
+
+    @property
+    def lambda_z(self) -> np.ndarray:
+        """Terminal elimination rate constant; NaN unless the slope is negative."""
+        return np.where(self.slope < 0, -self.slope, np.nan)
+
+
+def _adjusted_r2(n: np.ndarray, sxx: np.ndarray, syy: np.ndarray, sxy: np.ndarray) -> np.ndarray:
+    """Adjusted R² of a simple regression from its centered sums of squares."""
+    with np.errstate(divide="ignore", invalid="ignore"):
+        r2 = np.where(syy > 0, sxy ** 2 / (sxx * syy), 1.0)
+        return np.where(n > 2, 1 - (1 - r2) * (n - 1) / (n - 2), np.nan)
+
+
+def _centered(profiles: ProfileSet, mask: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Center time and log(concentration) on their per-profile means over ``mask``.
+
+    Shifting each profile by a constant leaves slopes and R² unchanged but keeps
+    the grouped sums of squares well conditioned.
+    """
+    with np.errstate(divide="ignore", invalid="ignore"):
+        y = np.where(mask, np.log(profiles.concs), 0.0)
+        n = np.maximum(profiles.count(mask), 1)
+        t_mean = profiles.segment_sum(np.where(mask, profiles.times, 0.0)) / n
+        y_mean = profiles.segment_sum(y) / n
+    t = np.where(mask, profiles.times - t_mean[profiles.segment_ids], 0.0)
+    y = np.where(mask, y - y_mean[profiles.segment_ids], 0.0)
+    return t, y
+
+
+def loglinear_fit(profiles: ProfileSet, mask: np.ndarray) -> TerminalFit:
+    """
+    Fit log(concentration) against time over the masked samples and report fit statistics.
+
+    Parameters
+    ----------
+    profiles : ProfileSet
+        Profiles to evaluate
+    mask : np.ndarray
+        Boolean mask of the samples to include in each regression
+
+    Returns
+    -------
+    TerminalFit
+        Slope, adjusted R², number of points and first/last time of every window
+        (NaN where the window cannot define a slope)
+    """
+    t, y = _centered(profiles, mask)
+    n = profiles.count(mask)
+    sxx = profiles.segment_sum(t * t)
+    syy = profiles.segment_sum(y * y)
+    sxy = profiles.segment_sum(t * y)
+    valid = (n >= 2) & (sxx > 0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        slope = np.where(valid, sxy / sxx, np.nan)
+    index = np.arange(len(profiles.times))
+    selected = np.where(mask, index, -1)
+    last = np.maximum.reduceat(selected, profiles.offsets[:-1])
+    first = np.minimum.reduceat(np.where(mask, index, len(index)), profiles.offsets[:-1])
+    return TerminalFit(
+        slope=slope,
+        adj_r2=np.where(valid, _adjusted_r2(n, sxx, syy, sxy), np.nan),
+        n_points=n,
+        start=np.where(n > 0, profiles.times[np.minimum(first, len(index) - 1)], np.nan),
+        end=np.where(n > 0, profiles.times[np.maximum(last, 0)], np.nan),
+    )
+
+
+def best_fit_window(
+    profiles: ProfileSet,
+    eligible: np.ndarray,
+    min_points: int = 3,
+    tolerance: float = 1e-4,
+) -> np.ndarray:
+    """
+    Select the terminal window with the best adjusted R² for every profile.
+
+    Candidate windows are the last ``k`` eligible samples for every
+    ``k >= min_points``. Each candidate is scored from suffix sums of the
+    centered time and log(concentration), so all windows of all profiles are
+    evaluated in a single pass over the samples. Among the candidates with a
+    negative slope, the window with the most points whose adjusted R² is within
+    ``tolerance`` of the best one is selected.
+
+    Parameters
+    ----------
+    profiles : ProfileSet
+        Profiles to evaluate
+    eligible : np.ndarray
+        Boolean mask of samples that may enter the terminal phase (typically
+        positive concentrations after Tmax)
+    min_points : int, default=3
+        Minimum number of points in a window
+    tolerance : float, default=1e-4
+        Adjusted R² tolerance within which longer windows are preferred
+
+    Returns
+    -------
+    np.ndarray
+        Boolean mask of the selected samples; profiles without a valid window
+        have no samples selected
+    """
+    t, y = _centered(profiles, eligible)
+    # Window statistics for the window starting at each eligible sample
+    n = profiles.suffix_sum(eligible.astype(np.int64))
+    st = profiles.suffix_sum(t)
+    sy = profiles.suffix_sum(y)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        sxx = profiles.suffix_sum(t * t) - st ** 2 / n
+        syy = profiles.suffix_sum(y * y) - sy ** 2 / n
+        sxy = profiles.suffix_sum(t * y) - st * sy / n
+        slope = sxy / sxx
+    candidate = eligible & (n >= min_points) & (sxx > 0) & (slope < 0)
+    score = np.where(candidate, _adjusted_r2(n, sxx, syy, sxy), -np.inf)
+    best = np.maximum.reduceat(score, profiles.offsets[:-1])
+    accepted = candidate & (score >= best[profiles.segment_ids] - tolerance)
+    chosen = np.maximum.reduceat(np.where(accepted, n, 0), profiles.offsets[:-1])
+    return eligible & (n <= chosen[profiles.segment_ids])
+
+
+def lambda_z_calculators(fit: Callable[[], TerminalFit]) -> Dict[str, Callable[[], pl.Series]]:
+    """
+    Build ``ParameterTable`` calculators reporting a terminal-phase fit.
+
+    Parameters
+    ----------
+    fit : Callable[[], TerminalFit]
+        Returns the (memoized) terminal fit of the profiles
+
+    Returns
+    -------
+    Dict[str, Callable[[], pl.Series]]
+        Calculators for lambda_z, the window bounds, adjusted R² and the number of points
+    """
+    return {
+        "lambda_z": lambda: as_series("lambda_z", fit().lambda_z),
+        "lambda_z_start": lambda: as_series("lambda_z_start", fit().start),
+        "lambda_z_end": lambda: as_series("lambda_z_end", fit().end),
+        "lambda_z_adj_r2": lambda: as_series("lambda_z_adj_r2", fit().adj_r2),
+        "lambda_z_n_points": lambda: as_series("lambda_z_n_points", fit().n_points, pl.Int64),
+    }
+
+
+def half_life(slope: np.ndarray) -> np.ndarray:
+    """Convert terminal slopes to half-lives; NaN unless the slope is negative."""
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(slope < 0, np.log(2) / -slope, np.nan)
+
+
+def auc_inf(auc_last: np.ndarray, c_last: np.ndarray, t_half: np.ndarray) -> np.ndarray:
+    """
+    Extrapolate AUC to infinity: AUC_inf = AUC_last + C_last / lambda_z.
+
+    lambda_z is obtained from the half-life as ln(2) / t_half; profiles without
+    a valid half-life yield NaN.
+    """
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return auc_last + c_last / (np.log(2) / t_half)
+
+
+def as_series(name: str, values: np.ndarray, dtype: Optional[pl.DataType] = None) -> pl.Series:
+    """
+    Wrap a kernel result as a Polars Series, mapping NaN to null.
+
+    Parameters
+    ----------
+    name : str
+        Name of the resulting column
+    values : np.ndarray
+        Per-profile values returned by a kernel
+    dtype : pl.DataType, optional
+        Cast the result to this dtype (e.g. the dtype of the source column)
+
+    Returns
+    -------
+    pl.Series
+        Series with missing results as nulls
+    """
+    series = pl.Series(name, values, nan_to_null=True)
+    return series.cast(dtype) if dtype is not None else series
+
+
+class ParameterTable:
+    """
+    Per-profile PK parameters computed on demand and memoized.
+
+    Each parameter is produced by a calculator that returns one value per
+    profile (aligned with ``keys``). Calculators may read other parameters
+    from the table, so dependencies (e.g. AUC_inf on AUC and t_half) are
+    resolved lazily and every parameter is computed at most once.
+
+    Parameters
+    ----------
+    keys : pl.DataFrame
+        One row per profile identifying it
+    calculators : Dict[str, Callable[[], pl.Series]]
+        Mapping from parameter name to the function computing it
+    """
+
+    def __init__(self, keys: pl.DataFrame, calculators: Dict[str, Callable[[], pl.Series]]) -> None:
+        """Initialize the table without computing any parameter."""
+        self.keys = keys
+        self._calculators = calculators
+        self._values: Dict[str, pl.Series] = {}
+
+    @property
+    def names(self) -> List[str]:
+        """Names of all parameters the table can compute."""
+        return list(self._calculators)
+
+    def is_computed(self, name: str) -> bool:
+        """Check whether ``name`` has already been materialized."""
+        return name in self._values
+
+    def __getitem__(self, name: str) -> pl.Series:
+        """Return parameter ``name``, computing it on first access."""
+        if name not in self._values:
+            if name not in self._calculators:
+                raise ValueError(
+                    f"Unknown PK parameter '{name}'. Available parameters: {', '.join(self.names)}"
+                )
+            self._values[name] = self._calculators[name]().alias(name)
+        return self._values[name]
+
+    def frame(self, columns: List[str]) -> pl.DataFrame:
+        """
+        Materialize the requested parameters next to the profile keys.
+
+        Parameters
+        ----------
+        columns : List[str]
+            Parameters to include; only these (and their dependencies) are computed
+
+        Returns
+        -------
+        pl.DataFrame
+            DataFrame with the key columns followed by the requested parameters
+        """
+        return self.keys.with_columns([self[name] for name in columns])
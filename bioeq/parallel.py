@@ -2,11 +2,14 @@ import polars as pl
 import numpy as np
 import statsmodels.api as sm
 import statsmodels.formula.api as smf
-from typing import Dict, List, Optional, Union
+from typing import Dict, List, Optional, Tuple, Union
 from scipy import stats
 
+from .design_base import PKDesignMixin
+from . import bootstrap, nca
 
-class ParallelDesign:
+
+class ParallelDesign(PKDesignMixin):
     """
     Analyze a parallel design study to compute bioequivalence (BE) metrics and statistical analyses.
     
@@ -21,8 +24,9 @@ class ParallelDesign:
     
     Parameters
     ----------
-    data : pl.DataFrame
-        Input dataset containing concentration-time profiles
+    data : pl.DataFrame or pl.LazyFrame
+        Input dataset containing concentration-time profiles. A ``pl.LazyFrame``
+        (e.g. from ``pl.scan_parquet``) is read only for the configured columns
     subject_col : str
         Column name for subject identifiers
     time_col : str
@@ -31,6 +35,19 @@ class ParallelDesign:
         Column name for concentration measurements
     form_col : str
         Column name for formulation information (Test vs Reference)
+    lazy : bool, default=False
+        If True, the constructor only validates and indexes the data; PK
+        parameters are computed on first use and only for the requested columns
+        (see ``get_params_df``)
+    filters : pl.Expr, optional
+        Row filter (e.g. on analyte or study) pushed down into the data scan
+    auc_method : str, default="linear"
+        Trapezoidal rule for AUC: "linear", or "linear_up_log_down" to use the
+        logarithmic rule on declining segments
+    lambda_z_method : str, default="last_3"
+        Terminal-phase selection for lambda_z: "last_3" uses the last three
+        samples, "best_fit" picks the window (at least three positive samples
+        after Tmax) with the best adjusted R², preferring more points within 1e-4
     
     Attributes
     ----------
@@ -40,11 +57,15 @@ class ParallelDesign:
 
     def __init__(
         self,
-        data: pl.DataFrame,
+        data: Union[pl.DataFrame, pl.LazyFrame],
         subject_col: str,
         time_col: str,
         conc_col: str,
         form_col: str,
+        lazy: bool = False,
+        filters: Optional[pl.Expr] = None,
+        auc_method: str = "linear",
+        lambda_z_method: str = "last_3",
     ) -> None:
         """Initialize the ParallelDesign analyzer with study data and column specifications."""
 
@@ -53,27 +74,46 @@ class ParallelDesign:
         self._time_col = time_col
         self._conc_col = conc_col
         self._form_col = form_col
+        self._auc_method = auc_method
+        self._lambda_z_method = lambda_z_method
 
         self._validate_data()
         self._validate_colvals()
 
-        # Calculate all PK parameters
-        self._df_params = self._calculate_auc()
-        self._df_params = self._calculate_cmax()
-        self._df_params = self._calculate_tmax()
-        self._df_params = self._calculate_log_transform()
-        self._df_params = self._calculate_half_life()
-        self._df_params = self._calculate_auc_extrapolated()
+        # Pack the concentration-time profiles once for the shared NCA kernels
+        self._profiles = nca.ProfileSet.from_frame(
+            self._data,
+            [self._subject_col, self._form_col],
+            self._time_col,
+            self._conc_col,
+            filters=filters,
+        )
 
-        # Sort the dataframe for better readability
-        self.params_df = self._df_params.sort(
-            [self._subject_col, self._form_col]
+        # PK parameters are computed on demand and memoized per column
+        self._parameters = nca.ParameterTable(
+            self._profiles.keys,
+            {
+                "AUC": self._calculate_auc,
+                "Cmax": self._calculate_cmax,
+                "Tmax": self._calculate_tmax,
+                "log_AUC": lambda: self._calculate_log_transform("AUC"),
+                "log_Cmax": lambda: self._calculate_log_transform("Cmax"),
+                "t_half": self._calculate_half_life,
+                "AUC_inf": self._calculate_auc_extrapolated,
+                "log_AUC_inf": lambda: self._calculate_log_transform("AUC_inf"),
+                **nca.lambda_z_calculators(lambda: self._lambda_z_fit),
+            },
         )
+        self._reset_params()
+
+        # Calculate all PK parameters unless running lazily
+        if not lazy:
+            self._params_df = self.params_df
 
     def _validate_data(self) -> None:
-        """Check that data is a Polars DataFrame."""
-        if not isinstance(self._data, pl.DataFrame):
-            raise TypeError("Data must be a Polars DataFrame")
+        """Check that data is a Polars DataFrame or LazyFrame."""
+        if not isinstance(self._data, (pl.DataFrame, pl.LazyFrame)):
+            raise TypeError("Data must be a Polars DataFrame or LazyFrame")
 
     def _validate_colvals(self) -> None:
         """Ensure all required columns exist in the dataset."""
@@ -83,150 +123,102 @@ class ParallelDesign:
             self._conc_col,
             self._form_col,
         ]
-        missing = [col for col in required if col not in self._data.columns]
+        missing = [col for col in required if col not in nca.column_names(self._data)]
         if missing:
             raise ValueError(
                 f"Required column(s) not found in dataset: {', '.join(missing)}"
             )
+        if self._auc_method not in nca.AUC_METHODS:
+            raise ValueError(f"auc_method must be one of: {', '.join(nca.AUC_METHODS)}")
+        if self._lambda_z_method not in nca.LAMBDA_Z_METHODS:
+            raise ValueError(
+                f"lambda_z_method must be one of: {', '.join(nca.LAMBDA_Z_METHODS)}"
+            )
 
-    def _calculate_auc(self) -> pl.DataFrame:
+    def _calculate_auc(self) -> pl.Series:
         """
-        Compute AUC (Area Under the Curve) using the trapezoidal rule.
+        Compute AUC (Area Under the Curve) using the configured trapezoidal rule.
         
         Returns
         -------
-        pl.DataFrame
-            DataFrame with AUC values added
+        pl.Series
+            AUC of every profile
         """
-        grouped_df = self._data.group_by(
-            [self._subject_col, self._form_col]
-        ).agg([pl.col(self._time_col), pl.col(self._conc_col)])
-        auc_vals = [
-            np.trapezoid(row[self._conc_col], row[self._time_col])
-            for row in grouped_df.to_dicts()
-        ]
-        return grouped_df.with_columns(pl.Series("AUC", auc_vals))
+        return nca.as_series("AUC", nca.auc(self._profiles, self._auc_method))
 
-    def _calculate_cmax(self) -> pl.DataFrame:
+    def _calculate_cmax(self) -> pl.Series:
         """
         Compute Cmax (maximum concentration).
         
         Returns
         -------
-        pl.DataFrame
-            DataFrame with Cmax values added
+        pl.Series
+            Cmax of every profile
         """
-        cmax_df = self._data.group_by(
-            [self._subject_col, self._form_col]
-        ).agg(pl.col(self._conc_col).max().alias("Cmax"))
-        return self._df_params.join(
-            cmax_df, on=[self._subject_col, self._form_col]
-        )
+        return nca.as_series("Cmax", nca.cmax(self._profiles), self._profiles.conc_dtype)
 
-    def _calculate_tmax(self) -> pl.DataFrame:
+    def _calculate_tmax(self) -> pl.Series:
         """
         Compute Tmax (time when Cmax occurs).
         
         Returns
         -------
-        pl.DataFrame
-            DataFrame with Tmax values added
+        pl.Series
+            Tmax of every profile
         """
-        tmax_df = (
-            self._data.filter(
-                pl.col(self._conc_col)
-                == pl.col(self._conc_col)
-                .max()
-                .over([self._subject_col, self._form_col])
-            )
-            .group_by([self._subject_col, self._form_col])
-            .agg(pl.col(self._time_col).min().alias("Tmax"))
-        )
-        return self._df_params.join(
-            tmax_df, on=[self._subject_col, self._form_col]
-        )
+        cmax = self._parameters["Cmax"].cast(pl.Float64).to_numpy()
+        return nca.as_series("Tmax", nca.tmax(self._profiles, cmax), self._profiles.time_dtype)
 
-    def _calculate_log_transform(self) -> pl.DataFrame:
+    def _calculate_log_transform(self, parameter: str) -> pl.Series:
         """
-        Compute log-transformed AUC and Cmax.
+        Compute a log-transformed PK parameter (log_AUC or log_Cmax).
+        
+        Parameters
+        ----------
+        parameter : str
+            The PK parameter to transform (e.g., "AUC", "Cmax")
         
         Returns
         -------
-        pl.DataFrame
-            DataFrame with log-transformed values added
+        pl.Series
+            Log-transformed values of every profile
         """
-        return self._df_params.with_columns(
-            [
-                pl.col("AUC").log().alias("log_AUC"),
-                pl.col("Cmax").log().alias("log_Cmax"),
-            ]
-        )
+        return self._parameters[parameter].log().alias(f"log_{parameter}")
 
-    def _calculate_half_life(self) -> pl.DataFrame:
+    def _terminal_window(self) -> np.ndarray:
         """
-        Estimate elimination half-life using log-linear regression on terminal phase.
+        Select the terminal-phase samples used to estimate lambda_z.
         
-        This is a simplified estimation using the last 3 time points.
+        With ``lambda_z_method="last_3"`` this is a simplified selection of the last
+        3 time points (all points after the first when fewer than 4 are available),
+        ignoring non-positive concentrations. With ``"best_fit"`` the window is
+        chosen by adjusted R² among the positive samples after Tmax.
         
         Returns
         -------
-        pl.DataFrame
-            DataFrame with half-life estimates added
+        np.ndarray
+            Boolean mask over the packed samples
         """
-        half_lives = []
-        for row in self._df_params.to_dicts():
-            subject = row[self._subject_col]
-            formulation = row[self._form_col]
-            
-            # Get concentration-time data for this subject/formulation
-            subject_data = self._data.filter(
-                (pl.col(self._subject_col) == subject) &
-                (pl.col(self._form_col) == formulation)
-            ).sort(self._time_col)
-            
-            times = subject_data[self._time_col].to_numpy()
-            concs = subject_data[self._conc_col].to_numpy()
-            
-            # Use last 3 time points if available, otherwise use all time points except t=0
-            if len(times) >= 4:  # At least 4 points (including t=0)
-                terminal_times = times[-3:]
-                terminal_concs = concs[-3:]
-            else:
-                terminal_times = times[1:] if len(times) > 1 else times
-                terminal_concs = concs[1:] if len(concs) > 1 else concs
-            
-            # Skip if all concentrations are zero or less than 3 points
-            if np.all(terminal_concs <= 0) or len(terminal_times) < 2:
-                half_lives.append(None)
-                continue
-                
-            # Remove any zero concentrations
-            valid_indices = terminal_concs > 0
-            if np.sum(valid_indices) < 2:
-                half_lives.append(None)
-                continue
-                
-            valid_times = terminal_times[valid_indices]
-            valid_concs = terminal_concs[valid_indices]
-            
-            # Linear regression on log-transformed concentrations
-            log_concs = np.log(valid_concs)
-            X = sm.add_constant(valid_times)
-            model = sm.OLS(log_concs, X).fit()
-            
-            # Calculate half-life (t1/2 = ln(2)/ke, where ke is the slope)
-            slope = model.params[1]
-            if slope >= 0:  # Invalid slope (should be negative)
-                half_lives.append(None)
-            else:
-                half_life = np.log(2) / (-slope)
-                half_lives.append(half_life)
-                
-        return self._df_params.with_columns(
-            pl.Series("t_half", half_lives).alias("t_half")
-        )
+        profiles = self._profiles
+        if self._lambda_z_method == "best_fit":
+            tmax = self._parameters["Tmax"].cast(pl.Float64).to_numpy()
+            eligible = (profiles.concs > 0) & (profiles.times > tmax[profiles.segment_ids])
+            return nca.best_fit_window(profiles, eligible)
+        window = nca.terminal_window(profiles, n_points=3, eligible=profiles.positions > 0)
+        return window & (profiles.concs > 0)
 
-    def _calculate_auc_extrapolated(self) -> pl.DataFrame:
+    def _calculate_half_life(self) -> pl.Series:
+        """
+        Estimate elimination half-life using log-linear regression on terminal phase.
+        
+        Returns
+        -------
+        pl.Series
+            Half-life estimates of every profile
+        """
+        return nca.as_series("t_half", nca.half_life(self._lambda_z_fit.slope))
+
+    def _calculate_auc_extrapolated(self) -> pl.Series:
         """
         Calculate AUC extrapolated to infinity using the terminal elimination rate constant.
         
@@ -234,44 +226,15 @@ class ParallelDesign:
         
         Returns
         -------
-        pl.DataFrame
-            DataFrame with AUC_inf values added
+        pl.Series
+            AUC_inf of every profile
         """
-        auc_inf_values = []
-        
-        for row in self._df_params.to_dicts():
-            subject = row[self._subject_col]
-            formulation = row[self._form_col]
-            t_half = row.get("t_half")
-            
-            if t_half is None or t_half <= 0:
-                auc_inf_values.append(None)
-                continue
-            
-            # Get concentration-time data for this subject/formulation
-            subject_data = self._data.filter(
-                (pl.col(self._subject_col) == subject) &
-                (pl.col(self._form_col) == formulation)
-            ).sort(self._time_col)
-            
-            # Get the last concentration
-            if len(subject_data) > 0:
-                last_time = subject_data[self._time_col][-1]
-                last_conc = subject_data[self._conc_col][-1]
-                
-                # Calculate terminal elimination rate constant
-                ke = np.log(2) / t_half
-                
-                # Calculate extrapolated AUC
-                auc_extrapolated = last_conc / ke if ke > 0 else 0
-                auc_inf = row["AUC"] + auc_extrapolated
-                auc_inf_values.append(auc_inf)
-            else:
-                auc_inf_values.append(None)
-        
-        return self._df_params.with_columns(
-            pl.Series("AUC_inf", auc_inf_values).alias("AUC_inf")
+        auc_inf = nca.auc_inf(
+            self._parameters["AUC"].to_numpy(),
+            nca.clast(self._profiles, positive_only=False),
+            self._parameters["t_half"].to_numpy(),
         )
+        return nca.as_series("AUC_inf", auc_inf)
 
     def run_anova(self, metric: str) -> Dict[str, any]:
         """
@@ -291,7 +254,7 @@ class ParallelDesign:
         -----
         The function performs validation checks and prints ANOVA results.
         """
-        df = self._df_params.to_pandas()
+        df = self._model_frame(self._params_for([metric])).pandas
         unique_form = df[self._form_col].unique()
 
         print("Formulation levels:", unique_form)
@@ -331,8 +294,8 @@ class ParallelDesign:
         -----
         The function performs validation checks and prints t-test results.
         """
-        df = self._df_params.to_pandas()
-        unique_form = df[self._form_col].unique()
+        params = self._params_for([metric])
+        unique_form = params[self._form_col].unique(maintain_order=True).to_list()
 
         print("Formulation levels:", unique_form)
 
@@ -342,8 +305,8 @@ class ParallelDesign:
             return {"error": error_msg}
 
         # Split data by formulation
-        group1 = df[df[self._form_col] == unique_form[0]][metric].dropna()
-        group2 = df[df[self._form_col] == unique_form[1]][metric].dropna()
+        group1 = params.filter(pl.col(self._form_col) == unique_form[0])[metric].drop_nulls().to_numpy()
+        group2 = params.filter(pl.col(self._form_col) == unique_form[1])[metric].drop_nulls().to_numpy()
         
         # Perform t-test - using scipy stats instead of statsmodels
         t_stat, p_value = stats.ttest_ind(group1, group2, equal_var=False)
@@ -377,38 +340,19 @@ class ParallelDesign:
         if not metric.startswith("log_"):
             print(f"Warning: {metric} may not be log-transformed. Point estimates are valid for log-transformed metrics.")
         
-        df = self._df_params.to_pandas()
-        unique_form = df[self._form_col].unique()
-        
-        if len(unique_form) != 2:
-            return {"error": f"Exactly 2 formulation levels required, but found {len(unique_form)}."}
-        
-        # Filter out rows with missing values
-        df_valid = df.dropna(subset=[metric])
-        
-        # Fit model with formulation as the only factor
-        formula = f"{metric} ~ C({self._form_col})"
-        model = smf.ols(formula, data=df_valid).fit()
-        
-        # Extract coefficient for Test formulation
-        coef_index = model.params.index[model.params.index.str.contains(self._form_col)]
-        if len(coef_index) == 0:
-            return {"error": f"Could not find coefficient for {self._form_col}"}
-            
-        test_ref_diff = model.params[coef_index[0]]
-        
-        # Calculate confidence intervals
-        conf_int = model.conf_int(alpha=0.1)  # 90% CI for bioequivalence
-        lower_ci = conf_int.loc[coef_index[0], 0]
-        upper_ci = conf_int.loc[coef_index[0], 1]
+        model = self._model_frame(self._params_for([metric]))
+        n_forms = len(model.levels[self._form_col])
         
-        # Convert from log scale to ratio
-        point_estimate = np.exp(test_ref_diff) * 100  # as percentage
-        lower_ci_ratio = np.exp(lower_ci) * 100       # as percentage
-        upper_ci_ratio = np.exp(upper_ci) * 100       # as percentage
+        if n_forms != 2:
+            return {"error": f"Exactly 2 formulation levels required, but found {n_forms}."}
         
-        # Check if bioequivalence criteria are met (80-125% rule)
-        be_criteria_met = 80 <= lower_ci_ratio and upper_ci_ratio <= 125
+        # Least-squares fit with formulation as the only factor (rows with missing
+        # values are excluded), reusing the cached design
+        effect = model.formulation_effects([metric], [], self._form_col).row(0, named=True)
+        point_estimate = effect["point_estimate"]
+        lower_ci_ratio = effect["lower_90ci"]
+        upper_ci_ratio = effect["upper_90ci"]
+        be_criteria_met = effect["be_criteria_met"]
         
         results = {
             "point_estimate": point_estimate,
@@ -426,6 +370,96 @@ class ParallelDesign:
             
         return results
         
+    def calculate_point_estimates(self, metrics: Optional[List[str]] = None) -> pl.DataFrame:
+        """
+        Calculate Test/Reference point estimates and 90% CIs for several metrics at once.
+        
+        All metrics share one linear model with formulation as the only factor.
+        Its design matrix is factorized once (QR) and every metric is solved as one
+        response column; metrics with different missing values are grouped by the
+        rows they are observed on.
+        
+        Parameters
+        ----------
+        metrics : List[str], optional
+            Log-transformed PK parameters to analyze (default: ["log_AUC", "log_Cmax"],
+            e.g. also "log_AUC_inf")
+        
+        Returns
+        -------
+        pl.DataFrame
+            One row per metric with n, df, estimate and se (log scale), point_estimate,
+            lower_90ci and upper_90ci (percent) and be_criteria_met (80-125% rule)
+        """
+        if metrics is None:
+            metrics = ["log_AUC", "log_Cmax"]
+        params = self._params_for(metrics)
+        n_forms = params[self._form_col].n_unique()
+        if n_forms != 2:
+            raise ValueError(f"Exactly 2 formulation levels required, but found {n_forms}.")
+        
+        results = self._model_frame(params).formulation_effects(metrics, [], self._form_col)
+        print("Point Estimates (Test/Reference):")
+        print(results.select(
+            ["metric", "point_estimate", "lower_90ci", "upper_90ci", "be_criteria_met"]
+        ))
+        return results
+
+    def bootstrap_point_estimate(
+        self,
+        metric: str = "log_AUC",
+        n_boot: int = 10000,
+        seed: Optional[int] = None,
+        alpha: float = 0.1,
+        n_jobs: int = 1,
+    ) -> Dict[str, any]:
+        """
+        Bootstrap the Test/Reference ratio by resampling subjects within treatment arms.
+        
+        Each replicate resamples the subjects of every arm with replacement and
+        re-evaluates the difference of the arm means. Replicates are evaluated in
+        batches from integer index matrices; subjects with a missing value are
+        excluded.
+        
+        Parameters
+        ----------
+        metric : str, default="log_AUC"
+            The log-transformed PK parameter to analyze
+        n_boot : int, default=10000
+            Number of bootstrap replicates
+        seed : int, optional
+            Seed of the ``SeedSequence`` the replicate streams are spawned from;
+            results for a given seed do not depend on ``n_jobs``
+        alpha : float, default=0.1
+            Two-sided significance level (0.1 gives the 90% percentile interval)
+        n_jobs : int, default=1
+            Number of worker processes
+        
+        Returns
+        -------
+        Dict
+            point_estimate, lower_ci and upper_ci (percent, percentile interval),
+            standard_error (log scale), n_boot, seed and the log-scale replicate
+            ``estimates``
+        """
+        params = self._params_for([metric]).drop_nulls(metric)
+        levels = sorted(params[self._form_col].unique().to_list())
+        if len(levels) != 2:
+            raise ValueError(f"Exactly 2 formulation levels required, but found {len(levels)}.")
+        reference, test = levels
+        strata = [
+            params.filter(pl.col(self._form_col) == test)[metric].to_numpy(),
+            params.filter(pl.col(self._form_col) == reference)[metric].to_numpy(),
+        ]
+        if min(len(values) for values in strata) < 2:
+            raise ValueError("Bootstrap requires at least 2 subjects in each treatment arm.")
+        
+        estimate = strata[0].mean() - strata[1].mean()
+        estimates = bootstrap.stratified_mean_bootstrap(
+            strata, [1.0, -1.0], n_boot=n_boot, seed=seed, n_jobs=n_jobs
+        )
+        return bootstrap.summarize_bootstrap(estimate, estimates, alpha, seed)
+
     def summarize_pk_parameters(self) -> pl.DataFrame:
         """
         Calculate summary statistics for PK parameters by formulation.
@@ -442,12 +476,12 @@ class ParallelDesign:
         summary_rows = []
         
         for param in pk_params:
-            if param not in self._df_params.columns:
+            if param not in self.params_df.columns:
                 continue
                 
             # Group by formulation and calculate statistics
             summary = (
-                self._df_params
+                self.params_df
                 .group_by(self._form_col)
                 .agg([
                     pl.col(param).mean().alias("Mean"),
@@ -487,16 +521,17 @@ class ParallelDesign:
             Path where the CSV file will be saved
         """
         # Ensure we have the most updated parameter data
-        self._df_params.write_csv(file_path)
+        self.params_df.write_csv(file_path)
         print(f"Results exported to {file_path}")
 
-    def get_params_df(self) -> pl.DataFrame:
-        """
-        Get the DataFrame containing all calculated PK parameters.
-        
-        Returns
-        -------
-        pl.DataFrame
-            DataFrame with PK parameters
-        """
-        return self._df_params 
\ No newline at end of file
+    def _auc_rule(self) -> str:
+        """Trapezoidal rule of the analyzer (``PKDesignMixin`` hook)."""
+        return self._auc_method
+
+    def _params_sort_cols(self) -> List[str]:
+        """Columns the parameter frames are sorted by (``PKDesignMixin`` hook)."""
+        return [self._subject_col, self._form_col]
+
+    def _model_factors(self) -> List[str]:
+        """Factor columns encoded by the model frame (``PKDesignMixin`` hook)."""
+        return [self._subject_col, self._form_col]
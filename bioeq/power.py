@@ -0,0 +1,259 @@
+"""
+Power Module
+
+This module implements power and sample-size calculations for average bioequivalence assessed by
+the two one-sided tests procedure (TOST) on the log scale, for the designs analysed by ``bioeq``.
+
+Power is computed exactly from Owen's Q function, i.e. the bivariate noncentral t distribution of
+the two test statistics (Phillips, 1990). Owen's Q is evaluated by Gauss-Legendre quadrature over
+the bulk of the chi distribution of the standard error, with the same nodes for every scenario, so
+grids of CV, GMR and sample size are evaluated as one array computation.
+
+Designs are described by the residual degrees of freedom as a function of the total number of
+subjects n and the design constant bk, with the standard error of the Test - Reference difference
+equal to s_w·sqrt(bk / n):
+
+=========  ==================================  ========  ======
+design     layout                              df        bk
+=========  ==================================  ========  ======
+parallel   two groups                          n - 2     4
+2x2        2-sequence 2-period crossover       n - 2     2
+2x2x3      full replicate, 3 periods (TRT)     2n - 3    1.5
+2x3x3      partial replicate (TRR, RTR, RRT)   2n - 3    1.5
+2x2x4      full replicate, 4 periods (TRTR)    3n - 4    1
+=========  ==================================  ========  ======
+
+References
+----------
+Phillips, K. F. (1990). Power of the two one-sided tests procedure in bioequivalence.
+J Pharmacokinet Biopharm, 18(2), 137-144.
+Owen, D. B. (1965). A special case of a bivariate non-central t-distribution. Biometrika, 52, 437-446.
+"""
+
+import numpy as np
+from scipy import special, stats
+from typing import Dict, Tuple, Union
+
+ArrayLike = Union[float, np.ndarray]
+
+# (df slope, df offset, bk, number of sequences) of every design
+DESIGNS: Dict[str, Tuple[int, int, float, int]] = {
+    "parallel": (1, -2, 4.0, 2),
+    "2x2": (1, -2, 2.0, 2),
+    "2x2x3": (2, -3, 1.5, 2),
+    "2x3x3": (2, -3, 1.5, 3),
+    "2x2x4": (3, -4, 1.0, 2),
+}
+
+# Gauss-Legendre nodes and weights on [-1, 1] shared by all Owen's Q evaluations
+_NODES, _WEIGHTS = np.polynomial.legendre.leggauss(48)
+
+# Half-width of the chi(df) integration window around sqrt(df); the chi
+# distribution has a standard deviation of at most 1 (df = 1), so the
+# truncated mass is below 1e-14
+_CHI_HALF_WIDTH = 8.0
+
+
+def _design(design: str) -> Tuple[int, int, float, int]:
+    """Look up the constants of a design, raising ValueError for unknown names."""
+    if design not in DESIGNS:
+        raise ValueError(f"design must be one of {list(DESIGNS)}")
+    return DESIGNS[design]
+
+
+def cv_to_sigma(cv: ArrayLike) -> np.ndarray:
+    """Convert a coefficient of variation (ratio, e.g. 0.3) to the log-scale standard deviation."""
+    return np.sqrt(np.log1p(np.asarray(cv, dtype=np.float64) ** 2))
+
+
+def owens_q(df: ArrayLike, t: ArrayLike, delta: ArrayLike, b: ArrayLike) -> np.ndarray:
+    """
+    Evaluate Owen's Q function Q(df, t, delta; 0, b).
+
+    Q is the integral over x in [0, b] of Φ(t·x/sqrt(df) - delta) times the
+    density of the chi distribution with ``df`` degrees of freedom. The range is
+    clipped to the window where that density is non-negligible and integrated
+    with fixed Gauss-Legendre nodes. All arguments broadcast.
+
+    Parameters
+    ----------
+    df : ArrayLike
+        Degrees of freedom
+    t : ArrayLike
+        Critical value
+    delta : ArrayLike
+        Noncentrality parameter
+    b : ArrayLike
+        Upper integration limit
+
+    Returns
+    -------
+    np.ndarray
+        Values of Q
+    """
+    df, t, delta, b = np.broadcast_arrays(
+        *[np.asarray(arg, dtype=np.float64) for arg in (df, t, delta, b)]
+    )
+    center = np.sqrt(df)
+    lower = np.maximum(center - _CHI_HALF_WIDTH, 0.0)
+    upper = np.maximum(np.minimum(b, center + _CHI_HALF_WIDTH), lower)
+
+    half = ((upper - lower) / 2)[..., None]
+    x = lower[..., None] + half * (_NODES + 1)
+    # Log of the chi density: (df - 1)·log(x) - x²/2 - log(2^(df/2 - 1)·Γ(df/2))
+    log_norm = (df / 2 - 1) * np.log(2) + special.gammaln(df / 2)
+    log_density = (df - 1)[..., None] * np.log(x) - x ** 2 / 2 - log_norm[..., None]
+    integrand = special.ndtr((t / center)[..., None] * x - delta[..., None]) * np.exp(log_density)
+    return np.sum(half * _WEIGHTS * integrand, axis=-1)
+
+
+def power_tost(
+    cv: ArrayLike,
+    gmr: ArrayLike = 0.95,
+    n: ArrayLike = 24,
+    design: str = "2x2",
+    alpha: float = 0.05,
+    theta1: float = 0.8,
+    theta2: float = 1.25,
+) -> np.ndarray:
+    """
+    Compute the exact power of the TOST procedure for average bioequivalence.
+
+    ``cv``, ``gmr`` and ``n`` broadcast against each other, so whole planning
+    grids are evaluated in one call.
+
+    Parameters
+    ----------
+    cv : ArrayLike
+        Within-subject CV (total CV for the parallel design), as a ratio (0.3 = 30%)
+    gmr : ArrayLike, default=0.95
+        True Test/Reference geometric mean ratio
+    n : ArrayLike, default=24
+        Total number of subjects (balanced sequences or groups)
+    design : str, default="2x2"
+        One of ``DESIGNS``
+    alpha : float, default=0.05
+        Level of each one-sided test (0.05 gives the 90% CI procedure)
+    theta1, theta2 : float, default=0.8, 1.25
+        Acceptance limits for the ratio
+
+    Returns
+    -------
+    np.ndarray
+        Probability of concluding bioequivalence (0 where df < 1)
+    """
+    slope, offset, bk, _ = _design(design)
+    sigma = cv_to_sigma(cv)
+    gmr = np.asarray(gmr, dtype=np.float64)
+    n = np.asarray(n, dtype=np.float64)
+    df = slope * n + offset
+    valid = df >= 1
+    df = np.where(valid, df, 1.0)
+
+    se = sigma * np.sqrt(bk / n)
+    # Degrees of freedom take few distinct values across a grid
+    unique_df, inverse = np.unique(df, return_inverse=True)
+    t_crit = stats.t.ppf(1 - alpha, unique_df)[inverse].reshape(df.shape)
+    delta1 = (np.log(gmr) - np.log(theta1)) / se
+    delta2 = (np.log(gmr) - np.log(theta2)) / se
+    r = (delta1 - delta2) * np.sqrt(df) / (2 * t_crit)
+
+    power = owens_q(df, -t_crit, delta2, r) - owens_q(df, t_crit, delta1, r)
+    return np.where(valid, np.clip(power, 0.0, 1.0), 0.0)
+
+
+def sample_size_tost(
+    cv: ArrayLike,
+    gmr: ArrayLike = 0.95,
+    target_power: float = 0.8,
+    design: str = "2x2",
+    alpha: float = 0.05,
+    theta1: float = 0.8,
+    theta2: float = 1.25,
+    n_max: int = 10000,
+) -> np.ndarray:
+    """
+    Find the smallest balanced total sample size reaching the target TOST power.
+
+    Sample sizes are multiples of the number of sequences (groups) of the
+    design. All scenarios are searched together: starting from the
+    large-sample normal approximation, the bracket around the answer is widened
+    by doubling steps and then bisected, and each step evaluates
+    ``power_tost`` only for the scenarios still unresolved.
+
+    Parameters
+    ----------
+    cv : ArrayLike
+        Within-subject CV (total CV for the parallel design), as a ratio
+    gmr : ArrayLike, default=0.95
+        True Test/Reference geometric mean ratio
+    target_power : float, default=0.8
+        Required power
+    design : str, default="2x2"
+        One of ``DESIGNS``
+    alpha : float, default=0.05
+        Level of each one-sided test
+    theta1, theta2 : float, default=0.8, 1.25
+        Acceptance limits for the ratio
+    n_max : int, default=10000
+        Largest total sample size considered
+
+    Returns
+    -------
+    np.ndarray
+        Total sample sizes (float; NaN where even ``n_max`` does not reach the target,
+        e.g. a GMR outside the acceptance limits)
+    """
+    slope, offset, bk, n_sequences = _design(design)
+    cv, gmr = np.broadcast_arrays(np.asarray(cv, dtype=np.float64), np.asarray(gmr, dtype=np.float64))
+    shape = cv.shape
+    cv, gmr = cv.ravel(), gmr.ravel()
+
+    def enough(k: np.ndarray, idx: np.ndarray) -> np.ndarray:
+        """Whether k·n_sequences subjects reach the target for the scenarios ``idx``."""
+        n = k * n_sequences
+        return power_tost(cv[idx], gmr[idx], n, design, alpha, theta1, theta2) >= target_power
+
+    # Smallest size with at least 2 residual degrees of freedom
+    k_min = int(np.ceil(max((2 - offset) / slope, 2) / n_sequences))
+    k_max = n_max // n_sequences
+    everything = np.arange(cv.size)
+    reached = enough(np.full(cv.size, k_max), everything)
+
+    # Start from the large-sample (normal) approximation of the sample size
+    margin = np.minimum(np.log(theta2) - np.log(gmr), np.log(gmr) - np.log(theta1))
+    beta = np.where(np.isclose(gmr, 1.0), (1 - target_power) / 2, 1 - target_power)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        z = stats.norm.ppf(1 - alpha) + stats.norm.ppf(1 - beta)
+        n_approx = bk * (cv_to_sigma(cv) * z / margin) ** 2
+    k0 = np.clip(np.ceil(np.nan_to_num(n_approx, nan=n_max, posinf=n_max) / n_sequences), k_min, k_max)
+    k0 = k0.astype(np.int64)
+
+    # Gallop outwards until power(lo) < target <= power(hi), where lo = k_min - 1
+    # stands for "too small"; then bisect. Only unresolved scenarios are evaluated.
+    start_ok = enough(k0, everything)
+    hi = np.where(start_ok, k0, np.minimum(k0 + 1, k_max))
+    lo = np.where(start_ok, k0 - 1, k0)
+    hi[~reached], lo[~reached] = k_max, k_max - 1
+    step = 1
+    pending = np.flatnonzero(reached)
+    while pending.size:
+        lo_ok = np.zeros(pending.size, dtype=bool)
+        valid_lo = lo[pending] >= k_min
+        lo_ok[valid_lo] = enough(lo[pending][valid_lo], pending[valid_lo])
+        hi_ok = enough(hi[pending], pending)
+        step *= 2
+        # Bracket too high: move it down; bracket too low: move it up
+        down, up = pending[lo_ok], pending[~hi_ok]
+        hi[down], lo[down] = lo[down], np.maximum(lo[down] - step, k_min - 1)
+        lo[up], hi[up] = hi[up], np.minimum(hi[up] + step, k_max)
+        pending = pending[lo_ok | ~hi_ok]
+
+    pending = np.flatnonzero(hi - lo > 1)
+    while pending.size:
+        mid = (lo[pending] + hi[pending]) // 2
+        ok = enough(mid, pending)
+        hi[pending[ok]] = mid[ok]
+        lo[pending[~ok]] = mid[~ok]
+        pending = pending[hi[pending] - lo[pending] > 1]
+    return np.where(reached, hi * n_sequences, np.nan).reshape(shape)
@@ -0,0 +1,198 @@
+"""
+Reference-Scaled Module
+
+This module implements the closed-form statistics behind reference-scaled bioequivalence for
+replicate designs, computed from per-subject intra-subject contrasts instead of mixed models.
+
+For every subject the FDA procedure uses:
+
+- I = mean(Test) - mean(Reference), whose sequence-adjusted mean estimates the Test - Reference
+  difference, and
+- D = R1 - R2, the difference of the two Reference administrations, whose pooled within-sequence
+  variance estimates 2·s²WR.
+
+Both are analysed as one-way layouts over sequences (``crossover_stats.sequence_means``), so every
+quantity is a grouped mean or a pooled variance. All functions take subjects on the last axis and evaluate any leading axes (e.g.
+thousands of simulated trials sharing a sequence allocation) together.
+
+The EMA expanded limits for average bioequivalence with expanding limits (ABEL) are also
+provided here; the ABEL ANOVA itself is solved with ``bioeq.linear_model``.
+
+References
+----------
+FDA Draft Guidance on Progesterone (2011), recommended SAS procedure for RSABE.
+Howe, W. G. (1974). Approximate confidence limits on the mean of X + Y where X and Y are two
+tabled independent random variables. JASA, 69(347), 789-794.
+EMA Guideline on the Investigation of Bioequivalence, CPMP/EWP/QWP/1401/98 Rev. 1 (2010).
+"""
+
+import numpy as np
+from scipy import stats
+from typing import Dict, Tuple
+
+from .crossover_stats import sequence_means
+
+# FDA regulatory constant: (ln(1.25) / sigma_W0)² with sigma_W0 = 0.25
+FDA_THETA = (np.log(1.25) / 0.25) ** 2
+
+# Reference within-subject SD at which the FDA switches from ABE to scaled BE (CVwR ≈ 30%)
+FDA_SWR_CUTOFF = 0.294
+
+# EMA ABEL regulatory constant and CVwR range (%) over which the limits are widened
+EMA_K = 0.760
+EMA_CV_LOWER = 30.0
+EMA_CV_CAP = 50.0
+
+
+def rsabe_fda(
+    i_contrast: np.ndarray,
+    d_contrast: np.ndarray,
+    sequences: np.ndarray,
+    theta: float = FDA_THETA,
+    alpha: float = 0.05,
+) -> Dict[str, np.ndarray]:
+    """
+    Compute the FDA linearized RSABE criterion and its Howe upper confidence bound.
+
+    The criterion is (μT - μR)² - θ·s²WR. Its (1 - alpha) upper bound combines
+    the bound of the squared difference, from the t-interval of I, with the
+    bound of -θ·s²WR, from the chi-square distribution of the D variance
+    (Howe's method).
+
+    Parameters
+    ----------
+    i_contrast : np.ndarray
+        Per-subject mean(Test) - mean(Reference), shape (..., n_subjects)
+    d_contrast : np.ndarray
+        Per-subject R1 - R2 (NaN for subjects with a single Reference), same shape
+    sequences : np.ndarray
+        Integer sequence code of every subject (n_subjects,)
+    theta : float, default=FDA_THETA
+        Regulatory constant
+    alpha : float, default=0.05
+        One-sided level of the upper bound
+
+    Returns
+    -------
+    Dict[str, np.ndarray]
+        estimate, se and df of the Test - Reference difference; s2wr, swr and
+        df_wr; criterion and upper_bound; the (1 - 2·alpha) ABE interval
+        (lower, upper) of the difference
+    """
+    i_fit = sequence_means(i_contrast, sequences)
+    d_fit = sequence_means(d_contrast, sequences)
+
+    estimate = i_fit["mean"]
+    s2wr = d_fit["variance"] / 2
+    df_i, df_wr = i_fit["df"], d_fit["df"]
+
+    t_crit = stats.t.ppf(1 - alpha, df_i)
+    chi2_crit = stats.chi2.ppf(1 - alpha, df_wr)
+
+    point_term = estimate ** 2
+    scale_term = -theta * s2wr
+    point_bound = (np.abs(estimate) + t_crit * i_fit["se"]) ** 2
+    scale_bound = scale_term * df_wr / chi2_crit
+    criterion = point_term + scale_term
+    upper_bound = criterion + np.sqrt((point_bound - point_term) ** 2 + (scale_bound - scale_term) ** 2)
+
+    return {
+        "estimate": estimate,
+        "se": i_fit["se"],
+        "df": df_i,
+        "s2wr": s2wr,
+        "swr": np.sqrt(s2wr),
+        "df_wr": df_wr,
+        "criterion": criterion,
+        "upper_bound": upper_bound,
+        "lower": estimate - t_crit * i_fit["se"],
+        "upper": estimate + t_crit * i_fit["se"],
+    }
+
+
+def rsabe_fda_conclusion(result: Dict[str, np.ndarray]) -> np.ndarray:
+    """
+    Apply the FDA RSABE decision rule to the output of ``rsabe_fda``.
+
+    When sWR ≥ ``FDA_SWR_CUTOFF`` bioequivalence requires the criterion's
+    upper bound to be ≤ 0 and the point estimate to lie within 80-125%;
+    otherwise the unscaled ABE interval must lie within 80-125%.
+
+    Parameters
+    ----------
+    result : Dict[str, np.ndarray]
+        Output of ``rsabe_fda`` (any leading shape)
+
+    Returns
+    -------
+    np.ndarray
+        Boolean bioequivalence conclusion per analysis
+    """
+    point_estimate = np.exp(result["estimate"]) * 100
+    scaled_met = (result["upper_bound"] <= 0) & (80 <= point_estimate) & (point_estimate <= 125)
+    abe_met = (80 <= np.exp(result["lower"]) * 100) & (np.exp(result["upper"]) * 100 <= 125)
+    return np.where(result["swr"] >= FDA_SWR_CUTOFF, scaled_met, abe_met)
+
+
+def cv_from_variance(variance: np.ndarray) -> np.ndarray:
+    """Convert a log-scale variance to a coefficient of variation in percent."""
+    return np.sqrt(np.exp(variance) - 1) * 100
+
+
+def variance_interval(
+    variance: np.ndarray,
+    df: np.ndarray,
+    alpha: float = 0.05,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Compute the chi-square (1 - alpha) confidence interval of a variance.
+
+    Parameters
+    ----------
+    variance : np.ndarray
+        Variance estimate(s)
+    df : np.ndarray
+        Degrees of freedom of the estimate(s)
+    alpha : float, default=0.05
+        Two-sided significance level
+
+    Returns
+    -------
+    Tuple[np.ndarray, np.ndarray]
+        Lower and upper confidence limits (NaN where df is 0)
+    """
+    variance = np.asarray(variance, dtype=np.float64)
+    df = np.asarray(df, dtype=np.float64)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        positive = df > 0
+        lower = np.where(positive, df * variance / stats.chi2.ppf(1 - alpha / 2, df), np.nan)
+        upper = np.where(positive, df * variance / stats.chi2.ppf(alpha / 2, df), np.nan)
+    return lower, upper
+
+
+def abel_limits(cvwr: np.ndarray) -> Dict[str, np.ndarray]:
+    """
+    Compute the EMA expanded acceptance limits for a given CVwR.
+
+    The limits are 80.00-125.00% up to CVwR = 30% and exp(∓k·sWR) above, with
+    k = 0.760 and the expansion capped at CVwR = 50% (69.84-143.19%).
+
+    Parameters
+    ----------
+    cvwr : np.ndarray
+        Within-subject CV of the reference in percent
+
+    Returns
+    -------
+    Dict[str, np.ndarray]
+        lower and upper limits in percent and whether they were expanded (scaled)
+    """
+    cvwr = np.asarray(cvwr, dtype=np.float64)
+    capped = np.minimum(cvwr, EMA_CV_CAP) / 100
+    swr = np.sqrt(np.log(capped ** 2 + 1))
+    scaled = cvwr > EMA_CV_LOWER
+    return {
+        "lower": np.where(scaled, np.exp(-EMA_K * swr) * 100, 80.0),
+        "upper": np.where(scaled, np.exp(EMA_K * swr) * 100, 125.0),
+        "scaled": scaled,
+    }
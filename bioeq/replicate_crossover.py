@@ -16,12 +16,15 @@ bioequivalence calculations.
 import polars as pl
 import numpy as np
 import statsmodels.api as sm
-import statsmodels.formula.api as smf
+from functools import cached_property
 from typing import Dict, List, Optional, Tuple, Union
 from scipy import stats
 
+from .design_base import PKDesignMixin
+from . import crossover_stats, nca, reference_scaled
 
-class ReplicateCrossover:
+
+class ReplicateCrossover(PKDesignMixin):
     """
     A class for analyzing replicate crossover bioequivalence studies.
     
@@ -40,9 +43,11 @@ class ReplicateCrossover:
     
     Parameters
     ----------
-    data : pl.DataFrame
+    data : pl.DataFrame or pl.LazyFrame
         DataFrame containing the concentration-time data with columns for subject ID,
-        sequence, period, time, concentration, and formulation.
+        sequence, period, time, concentration, and formulation. A ``pl.LazyFrame``
+        (e.g. from ``pl.scan_parquet``) is kept lazy and read only for the configured
+        columns.
     design_type : str
         Type of replicate design: "partial" for 3-way or "full" for 4-way.
     subject_col : str
@@ -57,11 +62,24 @@ class ReplicateCrossover:
         Name of the column containing concentration measurements.
     form_col : str
         Name of the column containing formulation information.
+    lazy : bool, default=False
+        If True, the constructor only validates and indexes the data; PK parameters
+        are computed on first use and only for the requested columns.
+    filters : pl.Expr, optional
+        Row filter (e.g. on analyte or study) applied while reading the data.
+    auc_method : str, default="linear"
+        Trapezoidal rule for AUC: "linear", or "linear_up_log_down" to use the
+        logarithmic rule on declining segments.
+    lambda_z_method : str, default="last_3"
+        Terminal-phase selection for lambda_z: "last_3" uses the last three non-zero
+        samples, "best_fit" picks the window (at least three positive samples after
+        Tmax) with the best adjusted R², preferring more points within 1e-4.
     
     Attributes
     ----------
     data : pl.DataFrame
-        The input data.
+        The input data (projected to the configured columns when read from a
+        ``pl.LazyFrame`` or filtered).
     design_type : str
         The type of replicate design ("partial" or "full").
     subject_col : str
@@ -76,6 +94,10 @@ class ReplicateCrossover:
         Column name for concentration measurements.
     form_col : str
         Column name for formulation information.
+    auc_method : str
+        Trapezoidal rule used for AUC.
+    lambda_z_method : str
+        Terminal-phase selection rule used for lambda_z.
     half_life_df : pl.DataFrame or None
         DataFrame containing calculated half-life values.
     params_df : pl.DataFrame
@@ -103,12 +125,12 @@ class ReplicateCrossover:
     >>> print(f"Within-subject CV for AUC: {cv_results['cv_percent']:.2f}%")
     >>> # Run reference-scaled average bioequivalence assessment
     >>> rsabe_results = analyzer.run_rsabe("log_AUC")
-    >>> print(f"RSABE criterion met: {rsabe_results['rsabe_criterion_met']}")
+    >>> print(f"Bioequivalence concluded: {rsabe_results['be_conclusion']}")
     """
 
     def __init__(
         self,
-        data: pl.DataFrame,
+        data: Union[pl.DataFrame, pl.LazyFrame],
         design_type: str,
         subject_col: str,
         seq_col: str,
@@ -116,13 +138,17 @@ class ReplicateCrossover:
         time_col: str,
         conc_col: str,
         form_col: str,
+        lazy: bool = False,
+        filters: Optional[pl.Expr] = None,
+        auc_method: str = "linear",
+        lambda_z_method: str = "last_3",
     ) -> None:
         """
         Initialize ReplicateCrossover class.
         
         Parameters
         ----------
-        data : pl.DataFrame
+        data : pl.DataFrame or pl.LazyFrame
             Concentration-time data
         design_type : str
             Type of replicate design: "partial" (3-way) or "full" (4-way)
@@ -138,6 +164,14 @@ class ReplicateCrossover:
             Name of column containing concentration measurements
         form_col : str
             Name of column containing formulation information
+        lazy : bool, default=False
+            Defer PK parameter calculation until the parameters are requested
+        filters : pl.Expr, optional
+            Row filter applied before the column projection
+        auc_method : str, default="linear"
+            Trapezoidal rule for AUC: "linear" or "linear_up_log_down"
+        lambda_z_method : str, default="last_3"
+            Terminal-phase selection for lambda_z: "last_3" or "best_fit"
         """
         self.data = data
         self.design_type = design_type
@@ -147,26 +181,67 @@ class ReplicateCrossover:
         self.time_col = time_col
         self.conc_col = conc_col
         self.form_col = form_col
+        self.auc_method = auc_method
+        self.lambda_z_method = lambda_z_method
         
         # Validate inputs
         self._validate_data()
+        
+        # Pack the concentration-time profiles once for the shared NCA kernels;
+        # lazy sources are read only for the configured columns and filtered rows
+        self._profiles = nca.ProfileSet.from_frame(
+            self.data,
+            [self.subject_col, self.period_col],
+            self.time_col,
+            self.conc_col,
+            carry_cols=[self.seq_col, self.form_col],
+            filters=filters,
+        )
+        
         self._validate_colvals()
         
-        # Calculate half-life first (needed for AUC_inf)
-        self.half_life_df = self._calculate_half_life()
+        # The NCA stages form a small dependency graph (e.g. AUC_inf depends on
+        # AUC, C_last and t_half); each parameter is computed on demand, exactly
+        # once per instance
+        self._parameters = nca.ParameterTable(
+            self._profiles.keys,
+            {
+                "AUC": self._calculate_auc,
+                "Cmax": self._calculate_cmax,
+                "Tmax": self._calculate_tmax,
+                "log_AUC": lambda: self._calculate_log_transform("AUC"),
+                "log_Cmax": lambda: self._calculate_log_transform("Cmax"),
+                "t_half": self._estimate_half_life,
+                "C_last": lambda: nca.as_series("C_last", nca.clast(self._profiles)),
+                "AUC_inf": self._calculate_auc_extrapolated,
+                "log_AUC_inf": lambda: self._calculate_log_transform("AUC_inf"),
+                **nca.lambda_z_calculators(lambda: self._lambda_z_fit),
+                "AUC_last": self._calculate_auc_last,
+                "pct_extrap": lambda: (
+                    (self._parameters["AUC_inf"] - self._parameters["AUC_last"])
+                    / self._parameters["AUC_inf"] * 100
+                ),
+            },
+        )
+        self._reset_params()
         
-        # Calculate all PK parameters
-        self.params_df = self._calculate_pk_parameters()
+        # Calculate all PK parameters unless running lazily
+        if not lazy:
+            self._params_df = self.params_df
         
     def _validate_data(self) -> None:
-        """Validate that the input data has the required columns."""
+        """Validate that the input data is a Polars frame with the required columns."""
+        if not isinstance(self.data, (pl.DataFrame, pl.LazyFrame)):
+            raise TypeError("Data must be a Polars DataFrame or LazyFrame")
+        
+        columns = nca.column_names(self.data)
         required_cols = [
             self.subject_col, self.seq_col, self.period_col, 
             self.time_col, self.conc_col, self.form_col
         ]
         
         for col in required_cols:
-            if col not in self.data.columns:
+            if col not in columns:
                 raise ValueError(f"Required column '{col}' not found in the input data")
     
     def _validate_colvals(self) -> None:
@@ -178,13 +253,19 @@ class ReplicateCrossover:
         # Standardize design_type
         self.design_type = self.design_type.lower()
         
-        # Check formulation values
-        unique_forms = self.data[self.form_col].unique().to_list()
+        if self.auc_method not in nca.AUC_METHODS:
+            raise ValueError(f"auc_method must be one of: {', '.join(nca.AUC_METHODS)}")
+        if self.lambda_z_method not in nca.LAMBDA_Z_METHODS:
+            raise ValueError(f"lambda_z_method must be one of: {', '.join(nca.LAMBDA_Z_METHODS)}")
+        
+        # Check formulation values (constant within a profile, so read from the profile keys)
+        keys = self._profiles.keys
+        unique_forms = keys[self.form_col].unique().to_list()
         if len(unique_forms) != 2 or "Test" not in unique_forms or "Reference" not in unique_forms:
             raise ValueError("data must contain exactly two formulations: 'Test' and 'Reference'")
             
         # Check sequence values according to design type
-        unique_seqs = self.data[self.seq_col].unique().to_list()
+        unique_seqs = keys[self.seq_col].unique().to_list()
         if self.design_type == "partial":
             valid_seqs = ["TRR", "RTR", "RRT"]
             if not all(seq in valid_seqs for seq in unique_seqs):
@@ -195,202 +276,111 @@ class ReplicateCrossover:
                 raise ValueError("Full replicate design sequences must be TRTR or RTRT")
                 
         # Check periods according to design type
-        unique_periods = self.data[self.period_col].unique().to_list()
+        unique_periods = keys[self.period_col].unique().to_list()
         if self.design_type == "partial" and max(unique_periods) > 3:
             raise ValueError("Partial replicate design should have at most 3 periods")
         elif self.design_type == "full" and max(unique_periods) > 4:
             raise ValueError("Full replicate design should have at most 4 periods")
         
+    @cached_property
+    def half_life_df(self) -> Optional[pl.DataFrame]:
+        """DataFrame containing calculated half-life values (computed on first access)."""
+        return self._calculate_half_life()
+        
     def _calculate_pk_parameters(self) -> pl.DataFrame:
         """Calculate all PK parameters and return a dataframe with results."""
-        # Calculate individual PK parameters
-        auc_df = self._calculate_auc()
-        cmax_df = self._calculate_cmax()
-        tmax_df = self._calculate_tmax()
-        half_life_df = self._calculate_half_life()
-        auc_inf_df = self._calculate_auc_extrapolated()
-        
-        # Combine basic parameters for log transformation
-        base_df = auc_df.join(
-            cmax_df, 
-            on=[self.subject_col, self.period_col, self.seq_col, self.form_col],
-            how="inner"
-        )
-        
-        # Calculate log-transformed parameters
-        log_df = self._calculate_log_transform(base_df)
-        
-        # Combine all parameters into one dataframe
-        result_dfs = [auc_df, cmax_df, tmax_df, log_df]
+        columns = ["AUC", "Cmax", "Tmax", "log_AUC", "log_Cmax"]
         
         # Add half-life and AUC_inf if available
-        if half_life_df is not None:
-            result_dfs.append(half_life_df)
-            
-        if auc_inf_df is not None:
-            result_dfs.append(auc_inf_df)
-        
-        # Join all dataframes
-        result = auc_df
-        for df in result_dfs[1:]:
-            result = result.join(
-                df,
-                on=[self.subject_col, self.period_col, self.seq_col, self.form_col],
-                how="left"
-            )
+        if self.half_life_df is not None:
+            columns += ["t_half", "AUC_inf", "log_AUC_inf", "AUC_last", "pct_extrap",
+                        "lambda_z", "lambda_z_start", "lambda_z_end",
+                        "lambda_z_adj_r2", "lambda_z_n_points"]
             
-        return result
+        return self._parameters.frame(columns)
         
-    def _calculate_auc(self) -> pl.DataFrame:
+    def _calculate_auc(self) -> pl.Series:
         """
-        Calculate AUC for each subject/period using the trapezoidal rule.
+        Calculate AUC for each subject/period using the configured trapezoidal rule.
         
         Returns
         -------
-        pl.DataFrame
-            DataFrame containing AUC values for each subject/period/formulation
+        pl.Series
+            AUC values for each subject/period
         """
-        # Get unique subjects and periods
-        unique_subjects = self.data[self.subject_col].unique().to_list()
-        
-        result = []
+        return nca.as_series("AUC", nca.auc(self._profiles, self.auc_method))
         
-        for subject in unique_subjects:
-            # Get data for this subject
-            subject_data = self.data.filter(pl.col(self.subject_col) == subject)
-            
-            # Get unique periods for this subject
-            periods = subject_data[self.period_col].unique().sort().to_list()
-            
-            for period in periods:
-                # Get data for this period
-                period_data = subject_data.filter(pl.col(self.period_col) == period)
-                
-                # Sort by time
-                period_data = period_data.sort(self.time_col)
-                
-                # Calculate AUC using trapezoidal rule
-                times = period_data[self.time_col].to_numpy()
-                concs = period_data[self.conc_col].to_numpy()
-                auc = np.trapezoid(concs, times)
-                
-                # Get sequence and formulation
-                sequence = period_data[self.seq_col].unique()[0]
-                formulation = period_data[self.form_col].unique()[0]
-                
-                # Add to results
-                result.append({
-                    self.subject_col: subject,
-                    self.period_col: period,
-                    self.seq_col: sequence,
-                    self.form_col: formulation,
-                    "AUC": auc
-                })
-        
-        return pl.DataFrame(result)
-        
-    def _calculate_cmax(self) -> pl.DataFrame:
+    def _calculate_cmax(self) -> pl.Series:
         """
         Calculate the maximum concentration (Cmax) for each subject/period/formulation.
         
         Returns
         -------
-        pl.DataFrame
-            DataFrame containing Cmax values for each subject/period/formulation
+        pl.Series
+            Cmax values for each subject/period
         """
-        result = []
+        return nca.as_series("Cmax", nca.cmax(self._profiles), self._profiles.conc_dtype)
         
-        for subject in self.data[self.subject_col].unique():
-            for period in self.data[self.period_col].unique():
-                # Filter data for the current subject and period
-                subject_data = self.data.filter(
-                    (pl.col(self.subject_col) == subject) & 
-                    (pl.col(self.period_col) == period)
-                )
-                
-                if len(subject_data) == 0:
-                    continue
-                    
-                # Get the formulation and sequence for this subject/period
-                formulation = subject_data[self.form_col].unique()[0]
-                sequence = subject_data[self.seq_col].unique()[0]
-                
-                # Find maximum concentration
-                cmax = subject_data[self.conc_col].max()
-                
-                result.append({
-                    self.subject_col: subject,
-                    self.period_col: period,
-                    self.form_col: formulation,
-                    self.seq_col: sequence,
-                    "Cmax": cmax
-                })
-                
-        return pl.DataFrame(result)
-        
-    def _calculate_tmax(self) -> pl.DataFrame:
+    def _calculate_tmax(self) -> pl.Series:
         """
         Calculate the time to maximum concentration (Tmax) for each subject/period/formulation.
         
         Returns
         -------
-        pl.DataFrame
-            DataFrame containing Tmax values for each subject/period/formulation
+        pl.Series
+            Tmax values for each subject/period
         """
-        result = []
-        
-        for subject in self.data[self.subject_col].unique():
-            for period in self.data[self.period_col].unique():
-                # Filter data for the current subject and period
-                subject_data = self.data.filter(
-                    (pl.col(self.subject_col) == subject) & 
-                    (pl.col(self.period_col) == period)
-                )
-                
-                if len(subject_data) == 0:
-                    continue
-                    
-                # Get the formulation and sequence for this subject/period
-                formulation = subject_data[self.form_col].unique()[0]
-                sequence = subject_data[self.seq_col].unique()[0]
-                
-                # Find time of maximum concentration
-                max_conc_idx = subject_data[self.conc_col].arg_max()
-                tmax = subject_data[self.time_col][max_conc_idx]
-                
-                result.append({
-                    self.subject_col: subject,
-                    self.period_col: period,
-                    self.form_col: formulation,
-                    self.seq_col: sequence,
-                    "Tmax": tmax
-                })
-                
-        return pl.DataFrame(result)
+        cmax = self._parameters["Cmax"].cast(pl.Float64).to_numpy()
+        return nca.as_series("Tmax", nca.tmax(self._profiles, cmax), self._profiles.time_dtype)
         
-    def _calculate_log_transform(self, base_df: pl.DataFrame) -> pl.DataFrame:
+    def _calculate_log_transform(self, parameter: str) -> pl.Series:
         """
-        Calculate log-transformed PK parameters (log_AUC, log_Cmax).
+        Calculate a log-transformed PK parameter (log_AUC, log_Cmax).
         
         Parameters
         ----------
-        base_df : pl.DataFrame
-            DataFrame containing AUC and Cmax values
+        parameter : str
+            The PK parameter to transform (e.g., "AUC", "Cmax")
             
         Returns
         -------
-        pl.DataFrame
-            DataFrame containing log-transformed values for each subject/period/formulation
-        """
-        # Add log-transformed columns
-        log_df = base_df.with_columns([
-            pl.col("AUC").log().alias("log_AUC"),
-            pl.col("Cmax").log().alias("log_Cmax")
-        ]).select([
-            self.subject_col, self.period_col, self.seq_col, self.form_col, "log_AUC", "log_Cmax"
-        ])
+        pl.Series
+            Log-transformed values for each subject/period
+        """
+        return self._parameters[parameter].log().alias(f"log_{parameter}")
+        
+    def _terminal_window(self) -> np.ndarray:
+        """
+        Select the terminal-phase samples used to estimate lambda_z.
+        
+        With ``lambda_z_method="last_3"`` the last 3 non-zero concentration points are
+        used (profiles with fewer are not estimated). With ``"best_fit"`` the window is
+        chosen by adjusted R² among the positive samples after Tmax.
+        
+        Returns
+        -------
+        np.ndarray
+            Boolean mask over the packed samples
+        """
+        profiles = self._profiles
+        if self.lambda_z_method == "best_fit":
+            tmax = self._parameters["Tmax"].cast(pl.Float64).to_numpy()
+            eligible = (profiles.concs > 0) & (profiles.times > tmax[profiles.segment_ids])
+            return nca.best_fit_window(profiles, eligible)
+        non_zero = profiles.concs != 0
+        window = nca.terminal_window(profiles, n_points=3, eligible=non_zero)
+        return window & (profiles.count(non_zero) >= 3)[profiles.segment_ids]
+        
+    def _estimate_half_life(self) -> pl.Series:
+        """
+        Estimate the elimination half-life of every profile from its terminal phase.
         
-        return log_df
+        Returns
+        -------
+        pl.Series
+            Half-life values for each subject/period (null where estimation failed)
+        """
+        return nca.as_series("t_half", nca.half_life(self._lambda_z_fit.slope))
         
     def _calculate_half_life(self) -> Optional[pl.DataFrame]:
         """
@@ -401,180 +391,86 @@ class ReplicateCrossover:
         Optional[pl.DataFrame]
             DataFrame containing half-life values, or None if calculation is not possible
         """
-        result = []
+        result = (
+            self._parameters.frame(["t_half"])
+            .filter(pl.col("t_half").is_not_null())
+            .select([self.subject_col, self.period_col, self.form_col, self.seq_col, "t_half"])
+        )
         
-        for subject in self.data[self.subject_col].unique():
-            for period in self.data[self.period_col].unique():
-                # Filter data for the current subject and period
-                subject_data = self.data.filter(
-                    (pl.col(self.subject_col) == subject) & 
-                    (pl.col(self.period_col) == period)
-                )
-                
-                if len(subject_data) == 0:
-                    continue
-                    
-                # Get the formulation and sequence for this subject/period
-                formulation = subject_data[self.form_col].unique()[0]
-                sequence = subject_data[self.seq_col].unique()[0]
-                
-                # Sort by time
-                subject_data = subject_data.sort(self.time_col)
-                times = subject_data[self.time_col].to_numpy()
-                concs = subject_data[self.conc_col].to_numpy()
-                
-                # Need at least 3 non-zero points for terminal elimination rate
-                if len(times) >= 3 and np.count_nonzero(concs) >= 3:
-                    # Use the last 3 non-zero concentration points for half-life estimation
-                    # (This is a simplified approach, a more sophisticated algorithm would be better)
-                    non_zero_indices = np.nonzero(concs)[0]
-                    
-                    if len(non_zero_indices) >= 3:
-                        terminal_indices = non_zero_indices[-3:]
-                        terminal_times = times[terminal_indices]
-                        terminal_concs = concs[terminal_indices]
-                        
-                        # Log-transform concentrations for linear regression
-                        log_concs = np.log(terminal_concs)
-                        
-                        # Simple linear regression to get elimination rate constant
-                        slope, intercept, r_value, p_value, std_err = stats.linregress(
-                            terminal_times, log_concs
-                        )
-                        
-                        # Negative slope gives elimination rate constant
-                        ke = -slope
-                        
-                        # Calculate half-life
-                        if ke > 0:
-                            half_life = np.log(2) / ke
-                            
-                            result.append({
-                                self.subject_col: subject,
-                                self.period_col: period,
-                                self.form_col: formulation,
-                                self.seq_col: sequence,
-                                "t_half": half_life
-                            })
-        
-        if result:
-            return pl.DataFrame(result)
+        if len(result) > 0:
+            return result
         else:
             return None
             
-    def _calculate_auc_extrapolated(self) -> Optional[pl.DataFrame]:
+    def _calculate_auc_last(self) -> pl.Series:
         """
-        Calculate AUC extrapolated to infinity (AUC_inf) for each subject/period.
+        Report AUC up to the last time point for the profiles that can be extrapolated.
         
         Returns
         -------
-        pl.DataFrame or None
-            DataFrame containing AUC_inf values for each subject/period/formulation,
-            or None if half-life calculation was not successful
+        pl.Series
+            AUC_last values for each subject/period (null where half-life is unavailable)
         """
-        if not hasattr(self, 'half_life_df') or self.half_life_df is None:
-            return None
-            
-        # Get unique subjects and periods
-        unique_subjects = self.data[self.subject_col].unique().to_list()
+        has_half_life = self._parameters["t_half"].is_not_null().to_numpy()
+        return nca.as_series(
+            "AUC_last", np.where(has_half_life, self._parameters["AUC"].to_numpy(), np.nan)
+        )
         
-        result = []
+    def _calculate_auc_extrapolated(self) -> pl.Series:
+        """
+        Calculate AUC extrapolated to infinity (AUC_inf) for each subject/period.
         
-        for subject in unique_subjects:
-            # Get data for this subject
-            subject_data = self.data.filter(pl.col(self.subject_col) == subject)
-            
-            # Get unique periods for this subject
-            periods = subject_data[self.period_col].unique().sort().to_list()
-            
-            for period in periods:
-                # Get period data
-                period_data = subject_data.filter(pl.col(self.period_col) == period)
-                
-                if len(period_data) == 0:
-                    continue
-                
-                # Get the formulation for this subject/period
-                formulation = period_data[self.form_col].unique()[0]
-                sequence = period_data[self.seq_col].unique()[0]
-                
-                # Sort by time and get last non-zero concentration
-                period_data = period_data.sort(self.time_col)
-                last_conc = period_data.filter(pl.col(self.conc_col) > 0).slice(-1)[self.conc_col].item()
-                
-                # Get half-life data for this subject/period
-                lambda_z_entry = self.half_life_df.filter(
-                    (pl.col(self.subject_col) == subject) & 
-                    (pl.col(self.period_col) == period)
-                )
-                
-                # Check if we have t_half for this subject/period
-                if len(lambda_z_entry) == 0 or "t_half" not in lambda_z_entry.columns:
-                    continue
-                    
-                # Check if t_half value is valid
-                if lambda_z_entry["t_half"].is_null().any():
-                    continue
-                
-                # Get elimination rate constant from half-life (ke = ln(2)/t_half)
-                t_half = lambda_z_entry["t_half"].item()
-                lambda_z = np.log(2) / t_half
-                
-                # Calculate AUC up to the last time point
-                times = period_data[self.time_col].to_numpy()
-                concs = period_data[self.conc_col].to_numpy()
-                auc_last = np.trapezoid(concs, times)
-                
-                # Calculate extrapolated portion
-                auc_extra = last_conc / lambda_z
-                
-                # Total AUC
-                auc_inf = auc_last + auc_extra
-                
-                # Calculate percent extrapolated
-                pct_extrap = (auc_extra / auc_inf) * 100
-                
-                result.append({
-                    self.subject_col: subject,
-                    self.period_col: period,
-                    self.form_col: formulation,
-                    self.seq_col: sequence,
-                    "AUC_inf": auc_inf,
-                    "AUC_last": auc_last,
-                    "pct_extrap": pct_extrap
-                })
+        AUC_inf = AUC_last + C_last/lambda_z, where lambda_z = ln(2)/t_half.
         
-        if result:
-            return pl.DataFrame(result)
-        else:
-            return None
+        Returns
+        -------
+        pl.Series
+            AUC_inf values for each subject/period (null where half-life is unavailable)
+        """
+        auc_inf = nca.auc_inf(
+            self._parameters["AUC"].to_numpy(),
+            self._parameters["C_last"].to_numpy(),
+            self._parameters["t_half"].to_numpy(),
+        )
+        return nca.as_series("AUC_inf", auc_inf)
             
-    def calculate_within_subject_cv(self, parameter: str = "log_AUC") -> Dict[str, float]:
+    def calculate_within_subject_cv(
+        self,
+        parameter: Union[str, List[str]] = "log_AUC",
+        alpha: float = 0.05,
+    ) -> Union[Dict[str, float], pl.DataFrame]:
         """
-        Calculate the within-subject coefficient of variation (CV) for the reference product.
+        Calculate the within-subject coefficient of variation (CV) of the replicated formulations.
         
-        This method calculates the within-subject variability for the reference product
-        based on the replicate administrations in the study design. This is a key calculation
-        for reference-scaled average bioequivalence (RSABE) approaches.
+        This method calculates the within-subject variability from the replicate
+        administrations in the study design. This is a key calculation for
+        reference-scaled average bioequivalence (RSABE) approaches.
         
         For partial replicate designs, subjects receive the reference product twice.
         For full replicate designs, subjects receive both test and reference products twice.
         
         The CV is calculated using the formula:
-            CV% = sqrt(exp(s²_WR) - 1) × 100
+            CV% = sqrt(exp(s²_W) - 1) × 100
         
-        where s²_WR is the within-subject variance for the reference product.
+        where s²_W is the within-subject variance pooled over subjects, with one
+        degree of freedom less than the number of administrations per subject.
+        
+        All requested parameters and both formulations are summarized by a single
+        grouped aggregation over subject and formulation.
         
         Parameters
         ----------
-        parameter : str, default="log_AUC"
-            The log-transformed PK parameter to use for CV calculation.
+        parameter : str or List[str], default="log_AUC"
+            The log-transformed PK parameter(s) to use for CV calculation.
             Typically "log_AUC" or "log_Cmax".
+        alpha : float, default=0.05
+            Two-sided significance level of the chi-square confidence intervals
+            (list input only)
             
         Returns
         -------
-        Dict[str, float]
-            Dictionary containing:
+        Dict[str, float] or pl.DataFrame
+            For a single parameter name, a dictionary containing:
             - 'within_subject_variance': The calculated within-subject variance
             - 'cv_percent': The calculated coefficient of variation as a percentage
             - 'within_subject_cv': The calculated coefficient of variation as a percentage (alias for backward compatibility)
@@ -582,40 +478,76 @@ class ReplicateCrossover:
             - 'n_subjects': Number of subjects included in the calculation
             - 'mse': The calculated within-subject variance (alias for backward compatibility)
             
+            For a list of parameters, a DataFrame with one row per parameter and,
+            for the Reference (wr) and Test (wt) formulations, the variance
+            (s2_wr, s2_wt), CV (cv_wr, cv_wt), degrees of freedom (df_wr, df_wt)
+            and the (1 - alpha) confidence limits of the CV (cv_wr_lower,
+            cv_wr_upper, cv_wt_lower, cv_wt_upper). CVwT is NaN when Test is not
+            replicated (partial designs).
+            
         Notes
         -----
         The FDA considers a drug highly variable if the within-subject CV for the
         reference product is ≥ 30%. For highly variable drugs, reference-scaled
         approaches to bioequivalence may be appropriate.
         """
-        # Ensure we have a valid parameter
-        if parameter not in self.params_df.columns:
-            raise ValueError(f"Parameter '{parameter}' not found in the parameter dataframe")
-            
-        # For replicate designs, we need repeated Reference measurements to calculate within-subject CV
-        reference_data = self.params_df.filter(pl.col(self.form_col) == "Reference")
-        
-        # Group by subject and calculate variance
-        subject_variances = reference_data.group_by(self.subject_col).agg(
-            pl.col(parameter).var().alias("variance")
+        parameters = [parameter] if isinstance(parameter, str) else list(parameter)
+        
+        # Ensure we have valid parameters
+        params_df = self._params_for(parameters)
+        missing = [p for p in parameters if p not in params_df.columns]
+        if missing:
+            raise ValueError(f"Parameter '{missing[0]}' not found in the parameter dataframe")
+        
+        # Per subject and formulation: sum of squared deviations and degrees of freedom
+        # of every parameter, pooled over subjects per formulation
+        centered = [pl.col(p) - pl.col(p).mean() for p in parameters]
+        pooled = (
+            params_df.filter(pl.col(self.form_col).is_in(["Test", "Reference"]))
+            .group_by([self.form_col, self.subject_col])
+            .agg(
+                [(c ** 2).sum().alias(f"ss_{k}") for k, c in enumerate(centered)]
+                + [(pl.col(p).count() - 1).clip(0).alias(f"df_{k}") for k, p in enumerate(parameters)]
+            )
+            .group_by(self.form_col)
+            .agg(
+                [pl.col(f"ss_{k}").filter(pl.col(f"df_{k}") > 0).sum() for k in range(len(parameters))]
+                + [pl.col(f"df_{k}").sum() for k in range(len(parameters))]
+                + [pl.len().alias("n_subjects")]
+            )
         )
         
-        # Mean within-subject variance (MSE)
-        mse = subject_variances["variance"].mean()
-        
-        # Calculate CV
-        cv = np.sqrt(np.exp(mse) - 1) * 100
-        
+        summary = {"parameter": parameters}
+        for form, suffix in [("Reference", "wr"), ("Test", "wt")]:
+            row = pooled.filter(pl.col(self.form_col) == form)
+            ss = np.array([row[f"ss_{k}"].item() if len(row) else 0.0 for k in range(len(parameters))])
+            df = np.array([row[f"df_{k}"].item() if len(row) else 0 for k in range(len(parameters))])
+            with np.errstate(divide="ignore", invalid="ignore"):
+                variance = np.where(df > 0, ss / df, np.nan)
+            lower, upper = reference_scaled.variance_interval(variance, df, alpha)
+            summary[f"n_subjects_{suffix}"] = [row["n_subjects"].item() if len(row) else 0] * len(parameters)
+            summary[f"s2_{suffix}"] = variance
+            summary[f"cv_{suffix}"] = reference_scaled.cv_from_variance(variance)
+            summary[f"df_{suffix}"] = df
+            summary[f"cv_{suffix}_lower"] = reference_scaled.cv_from_variance(lower)
+            summary[f"cv_{suffix}_upper"] = reference_scaled.cv_from_variance(upper)
+        results = pl.DataFrame(summary)
+        
+        if not isinstance(parameter, str):
+            return results
+        
+        mse = results["s2_wr"].item()
+        cv = results["cv_wr"].item()
         return {
             "within_subject_variance": mse,
             "cv_percent": cv,
             "within_subject_cv": cv,
             "parameter": parameter,
-            "n_subjects": len(subject_variances),
+            "n_subjects": results["n_subjects_wr"].item(),
             "mse": mse
         }
         
-    def run_rsabe(self, parameter: str = "log_AUC") -> Dict[str, any]:
+    def run_rsabe(self, parameter: str = "log_AUC", engine: str = "native") -> Dict[str, any]:
         """
         Perform reference-scaled average bioequivalence (RSABE) analysis.
         
@@ -623,37 +555,52 @@ class ReplicateCrossover:
         for highly variable drugs. RSABE adjusts the bioequivalence limits based on the
         within-subject variability of the reference product.
         
-        The method uses a mixed effects model to estimate the test-reference difference
-        and constructs a linearized criterion for assessing bioequivalence:
+        The method constructs a linearized criterion for assessing bioequivalence:
         
             (μT - μR)² - θ·s²WR ≤ 0
         
         where:
         - μT and μR are the means for test and reference products
         - s²WR is the within-subject variance for the reference product
-        - θ is a constant (0.893 for FDA approach, corresponding to the standard BE limits)
+        - θ is the regulatory constant (ln(1.25)/0.25)² ≈ 0.797
+        
+        The native engine follows the FDA procedure: the Test - Reference difference is
+        estimated from the per-subject contrasts I = mean(T) - mean(R) and s²WR from the
+        Reference replicate differences D = R1 - R2, each analysed over sequences in
+        closed form. Bioequivalence requires the 95% upper bound of the criterion (Howe's
+        approximation) to be ≤ 0 and the point estimate to lie within 80-125%; when
+        sWR < 0.294 (CVwR below about 30%) the unscaled 90% CI is used instead.
+        The "statsmodels" engine estimates the difference with a mixed effects model.
         
         Parameters
         ----------
         parameter : str, default="log_AUC"
             The log-transformed PK parameter to use for RSABE assessment.
             Typically "log_AUC" or "log_Cmax".
+        engine : str, default="native"
+            "native" for the closed-form FDA procedure, or "statsmodels" for the
+            mixed effects model.
             
         Returns
         -------
         Dict[str, any]
             Dictionary containing:
-            - 'model_summary': Summary of the mixed effects model
+            - 'model_summary': Summary of the analysis (mixed model summary for statsmodels)
             - 'test_ref_diff': Estimated test-reference difference
             - 'within_subject_variance': Within-subject variance for reference product
             - 'within_subject_cv': Within-subject coefficient of variation for reference product
             - 'rsabe_criterion': Value of the linearized RSABE criterion
-            - 'rsabe_criterion_met': Boolean indicating if bioequivalence is established
-            - 'be_conclusion': Boolean indicating if bioequivalence is established (alias for backward compatibility)
+            - 'rsabe_criterion_met': Boolean indicating if the 95% upper bound of the scaled
+              criterion is ≤ 0. This is only one part of the decision and only applies when
+              sWR ≥ 0.294 (native engine); use 'be_conclusion' for the overall result
+            - 'be_conclusion': Boolean indicating if bioequivalence is established (FDA rule:
+              scaled criterion and 80-125% point estimate constraint, or the unscaled 90% CI
+              when sWR < 0.294)
             - 'expanded_limits': Expanded BE limits based on reference variability
             - 'point_estimate': Test/Reference ratio as a percentage
             - 'upper_scaled_limit': Upper expanded limit as a percentage
             - 'lower_scaled_limit': Lower expanded limit as a percentage
+            - 'rsabe_upper_bound': 95% upper confidence bound of the criterion (native engine)
             
         Notes
         -----
@@ -667,6 +614,207 @@ class ReplicateCrossover:
         Davit, B. M., et al. (2012). Highly Variable Drugs: Observations from Bioequivalence
         Data Submitted to the FDA for New Generic Drug Applications. The AAPS Journal, 14(1), 148-158.
         """
+        if engine not in ("native", "statsmodels"):
+            raise ValueError("engine must be either 'native' or 'statsmodels'")
+        if engine == "statsmodels":
+            return self._run_rsabe_mixedlm(parameter)
+        
+        contrasts = self._intra_subject_contrasts(parameter)
+        result = reference_scaled.rsabe_fda(
+            contrasts["I"].to_numpy(),
+            contrasts["D"].to_numpy(),
+            contrasts[self.seq_col].to_numpy(),
+        )
+        theta = reference_scaled.FDA_THETA
+        swr = float(result["swr"])
+        within_subject_variance = float(result["s2wr"])
+        within_subject_cv = float(reference_scaled.cv_from_variance(within_subject_variance))
+        form_effect = float(result["estimate"])
+        point_estimate = np.exp(form_effect) * 100
+        criterion = float(result["criterion"])
+        ucb = float(result["upper_bound"])
+        rsabe_criterion_met = bool(ucb <= 0)
+        be_conclusion = bool(reference_scaled.rsabe_fda_conclusion(result))
+        
+        if swr >= reference_scaled.FDA_SWR_CUTOFF:
+            # Scaled BE: criterion bound and point estimate constraint
+            lower_limit = np.exp(-np.sqrt(theta) * swr) * 100
+            upper_limit = np.exp(np.sqrt(theta) * swr) * 100
+        else:
+            # Low variability: unscaled average BE with the 90% CI
+            lower_limit = 80
+            upper_limit = 125
+        
+        formula = (
+            f"I = mean({self.form_col}=Test) - mean({self.form_col}=Reference) ~ C({self.seq_col}); "
+            f"D = Reference difference between {self.period_col}s ~ C({self.seq_col})"
+        )
+        model_summary = "\n".join([
+            f"RSABE (FDA intra-subject contrasts) for {parameter}",
+            f"  T-R difference: {form_effect:.4f} (SE {float(result['se']):.4f}, df {int(result['df'])})",
+            f"  s2WR: {within_subject_variance:.4f} (sWR {swr:.4f}, df {int(result['df_wr'])})",
+            f"  Criterion: {criterion:.4f}, 95% upper bound: {ucb:.4f}",
+        ])
+        
+        return {
+            "model_summary": model_summary,
+            "test_ref_diff": form_effect,
+            "within_subject_variance": within_subject_variance,
+            "within_subject_cv": within_subject_cv,
+            "rsabe_criterion": criterion,
+            "rsabe_upper_bound": ucb,
+            "rsabe_criterion_met": rsabe_criterion_met,
+            "be_conclusion": be_conclusion,
+            "expanded_limits": [lower_limit, upper_limit],
+            "point_estimate": point_estimate,
+            "upper_scaled_limit": upper_limit,
+            "lower_scaled_limit": lower_limit,
+            "reference_scaled_method": "RSABE",
+            "formula": formula
+        }
+        
+    def run_abel(self, parameter: str = "log_AUC") -> Dict[str, any]:
+        """
+        Perform average bioequivalence with expanding limits (ABEL, EMA).
+        
+        Following the EMA ANOVA approach (method A), all effects are fixed:
+        
+        - the Test/Reference ratio and its 90% CI come from a linear model with
+          subject (nested in sequence), period and formulation on all data;
+        - s²WR is the residual mean square of a model with subject and period
+          fitted to the Reference administrations only (period effects aliased
+          with sequence are dropped).
+        
+        Both models are solved in closed form by QR least squares. When CVwR > 30%
+        the acceptance limits widen to exp(∓0.760·sWR), capped at CVwR = 50%
+        (69.84-143.19%), and the point estimate must also lie within 80.00-125.00%.
+        
+        Parameters
+        ----------
+        parameter : str, default="log_AUC"
+            The log-transformed PK parameter to assess. Typically "log_AUC" or "log_Cmax".
+            
+        Returns
+        -------
+        Dict[str, any]
+            Dictionary containing:
+            - 'within_subject_variance': s²WR from the Reference-only ANOVA
+            - 'within_subject_cv': CVwR as a percentage
+            - 'df_wr': Degrees of freedom of s²WR
+            - 'point_estimate': Test/Reference ratio as a percentage
+            - 'lower_90ci', 'upper_90ci': 90% confidence interval as percentages
+            - 'expanded_limits': Acceptance limits as percentages
+            - 'lower_scaled_limit', 'upper_scaled_limit': The same limits
+            - 'limits_expanded': Whether CVwR > 30% widened the limits
+            - 'gmr_constraint_met': Whether the point estimate lies within 80.00-125.00%
+            - 'be_conclusion': Whether bioequivalence is established
+            - 'reference_scaled_method': "ABEL"
+            - 'formula': Description of the model
+            
+        References
+        ----------
+        EMA Guideline on the Investigation of Bioequivalence, CPMP/EWP/QWP/1401/98 Rev. 1, 2010.
+        EMA Questions & Answers: positions on specific questions addressed to the
+        Pharmacokinetics Working Party, EMA/618604/2008 (method A).
+        """
+        params_df = self._params_for([parameter])
+        if parameter not in params_df.columns:
+            raise ValueError(f"Parameter '{parameter}' not found in the parameter dataframe")
+        model = self._model_frame(params_df)
+        observed = model.observed(parameter)
+        values = params_df[parameter].to_numpy()
+        
+        # Test - Reference difference from the all-data fixed-effects ANOVA
+        fit = model.least_squares(
+            [self.subject_col, self.period_col, self.form_col], observed
+        ).fit(values[observed])
+        form_effect = float(fit.coef[-1, 0])
+        t_crit = stats.t.ppf(0.95, fit.df)
+        lower_ci = form_effect - t_crit * float(fit.se[-1, 0])
+        upper_ci = form_effect + t_crit * float(fit.se[-1, 0])
+        
+        # s²WR from the Reference-only ANOVA
+        reference = observed & (params_df[self.form_col] == "Reference").to_numpy()
+        fit_ref = model.least_squares(
+            [self.subject_col, self.period_col], reference, drop_aliased=True
+        ).fit(values[reference])
+        within_subject_variance = float(fit_ref.sigma2[0])
+        cvwr = float(reference_scaled.cv_from_variance(within_subject_variance))
+        
+        limits = reference_scaled.abel_limits(cvwr)
+        lower_limit = float(limits["lower"])
+        upper_limit = float(limits["upper"])
+        point_estimate = np.exp(form_effect) * 100
+        lower_90ci = np.exp(lower_ci) * 100
+        upper_90ci = np.exp(upper_ci) * 100
+        gmr_constraint_met = bool(80 <= point_estimate <= 125)
+        be_conclusion = bool(
+            lower_limit <= lower_90ci and upper_90ci <= upper_limit and gmr_constraint_met
+        )
+        
+        formula = (
+            f"{parameter} ~ C({self.seq_col}) + C({self.subject_col}):C({self.seq_col})"
+            f" + C({self.period_col}) + C({self.form_col})"
+        )
+        
+        return {
+            "within_subject_variance": within_subject_variance,
+            "within_subject_cv": cvwr,
+            "df_wr": fit_ref.df,
+            "test_ref_diff": form_effect,
+            "point_estimate": point_estimate,
+            "lower_90ci": lower_90ci,
+            "upper_90ci": upper_90ci,
+            "expanded_limits": [lower_limit, upper_limit],
+            "lower_scaled_limit": lower_limit,
+            "upper_scaled_limit": upper_limit,
+            "limits_expanded": bool(limits["scaled"]),
+            "gmr_constraint_met": gmr_constraint_met,
+            "be_conclusion": be_conclusion,
+            "reference_scaled_method": "ABEL",
+            "formula": formula
+        }
+        
+    def _intra_subject_contrasts(self, parameter: str) -> pl.DataFrame:
+        """
+        Compute the per-subject contrasts used by the reference-scaled analyses.
+        
+        Parameters
+        ----------
+        parameter : str
+            The log-transformed PK parameter
+            
+        Returns
+        -------
+        pl.DataFrame
+            One row per subject with its sequence, I = mean(Test) - mean(Reference)
+            and D = difference of the two Reference administrations (in period order,
+            null for subjects without two Reference values)
+        """
+        params_df = self._params_for([parameter])
+        if parameter not in params_df.columns:
+            raise ValueError(f"Parameter '{parameter}' not found in the parameter dataframe")
+        
+        value = pl.col(parameter)
+        is_test = pl.col(self.form_col) == "Test"
+        is_ref = pl.col(self.form_col) == "Reference"
+        return (
+            params_df.drop_nulls(parameter)
+            .sort([self.subject_col, self.period_col])
+            .group_by(self.subject_col, maintain_order=True)
+            .agg([
+                pl.col(self.seq_col).first(),
+                (value.filter(is_test).mean() - value.filter(is_ref).mean()).alias("I"),
+                pl.when(value.filter(is_ref).len() == 2)
+                .then(value.filter(is_ref).first() - value.filter(is_ref).last())
+                .alias("D"),
+            ])
+            .drop_nulls("I")
+            .with_columns(pl.col("D").fill_null(np.nan))
+        )
+        
+    def _run_rsabe_mixedlm(self, parameter: str) -> Dict[str, any]:
+        """Perform the RSABE analysis with a mixed effects model (see ``run_rsabe``)."""
         # Calculate within-subject CV
         cv_results = self.calculate_within_subject_cv(parameter)
         within_subject_variance = cv_results["within_subject_variance"]
@@ -674,16 +822,9 @@ class ReplicateCrossover:
         # Create model formula for mixed effects model
         formula = f"{parameter} ~ C({self.form_col}) + C({self.seq_col}) + C({self.period_col})"
         
-        # Filter data to include only needed columns
-        model_data = self.params_df.select([
-            self.subject_col, self.seq_col, self.period_col, self.form_col, parameter
-        ]).to_pandas()
-        
-        # Fit mixed effects model with subject as random effect
-        model = smf.mixedlm(
-            formula, 
-            model_data,
-            groups=model_data[self.subject_col]
+        # Fit mixed effects model with subject as random effect on the cached design
+        model = self._model_frame(self._params_for([parameter])).mixed_model(
+            parameter, [self.form_col, self.seq_col, self.period_col]
         )
         
         model_fit = model.fit()
@@ -749,6 +890,94 @@ class ReplicateCrossover:
         
         return results
         
+    def calculate_influence(self, parameter: str = "log_AUC") -> pl.DataFrame:
+        """
+        Leave-one-subject-out sensitivity analysis of the Test/Reference ratio and CVwR.
+        
+        Uses the intra-subject contrasts of the FDA analysis (see ``run_rsabe``):
+        for every subject, the Test - Reference estimate with its 90% CI and s²WR
+        are recomputed without that subject by downdating the per-sequence means
+        and sums of squares of I and D, so no model is refitted.
+        
+        Parameters
+        ----------
+        parameter : str, default="log_AUC"
+            The log-transformed PK parameter to analyze
+            
+        Returns
+        -------
+        pl.DataFrame
+            One row per left-out subject with its sequence, point_estimate,
+            lower_90ci and upper_90ci (percent) without the subject, change (point
+            estimate minus the full-data estimate, percentage points),
+            within_subject_cv (CVwR without the subject), the externally
+            studentized residual of its I contrast and be_criteria_met (80-125% rule)
+        """
+        contrasts = self._intra_subject_contrasts(parameter)
+        sequences = contrasts[self.seq_col].to_numpy()
+        i_contrast = contrasts["I"].to_numpy()
+        full = crossover_stats.sequence_means(i_contrast, sequences)
+        loo = crossover_stats.sequence_means_leave_one_out(i_contrast, sequences)
+        loo_d = crossover_stats.sequence_means_leave_one_out(contrasts["D"].to_numpy(), sequences)
+        
+        with np.errstate(invalid="ignore"):
+            t_crit = stats.t.ppf(0.95, loo["df"])
+        lower = np.exp(loo["mean"] - t_crit * loo["se"]) * 100
+        upper = np.exp(loo["mean"] + t_crit * loo["se"]) * 100
+        point_estimate = np.exp(loo["mean"]) * 100
+        results = pl.DataFrame({
+            self.subject_col: contrasts[self.subject_col],
+            self.seq_col: contrasts[self.seq_col],
+            "point_estimate": point_estimate,
+            "lower_90ci": lower,
+            "upper_90ci": upper,
+            "change": point_estimate - np.exp(full["mean"]) * 100,
+            "within_subject_cv": reference_scaled.cv_from_variance(loo_d["variance"] / 2),
+            "studentized_residual": loo["studentized"],
+            "be_criteria_met": (lower >= 80) & (upper <= 125),
+        })
+        
+        print(f"Leave-one-subject-out analysis for {parameter} ({len(results)} subjects)")
+        print(results.sort(pl.col("studentized_residual").abs(), descending=True, nulls_last=True))
+        return results
+        
+    def calculate_point_estimates(self, metrics: Optional[List[str]] = None) -> pl.DataFrame:
+        """
+        Calculate Test/Reference point estimates and 90% CIs for several metrics at once.
+        
+        All metrics share one fixed-effects model with subject, period and
+        formulation effects. Its design matrix is factorized once (QR) and every
+        metric is solved as one response column; metrics with different missing
+        values are grouped by the rows they are observed on.
+        
+        Parameters
+        ----------
+        metrics : List[str], optional
+            Log-transformed PK parameters to analyze (default: ["log_AUC", "log_Cmax"],
+            e.g. also "log_AUC_inf")
+        
+        Returns
+        -------
+        pl.DataFrame
+            One row per metric with n, df, estimate and se (log scale), point_estimate,
+            lower_90ci and upper_90ci (percent) and be_criteria_met (80-125% rule)
+        """
+        if metrics is None:
+            metrics = ["log_AUC", "log_Cmax"]
+        params = self._params_for(metrics)
+        n_forms = params[self.form_col].n_unique()
+        if n_forms != 2:
+            raise ValueError(f"Exactly 2 formulation levels required, but found {n_forms}.")
+        
+        results = self._model_frame(params).formulation_effects(
+            metrics, [self.subject_col, self.period_col], self.form_col
+        )
+        print("Point Estimates (Test/Reference):")
+        print(results.select(
+            ["metric", "point_estimate", "lower_90ci", "upper_90ci", "be_criteria_met"]
+        ))
+        return results
+        
     def summarize_pk_parameters(self) -> pl.DataFrame:
         """
         Generate summary statistics for all PK parameters by formulation.
@@ -840,13 +1069,14 @@ class ReplicateCrossover:
         # Export the PK parameters
         self.params_df.write_csv(file_path)
         
-    def get_params_df(self) -> pl.DataFrame:
-        """
-        Get the calculated PK parameters dataframe.
+    def _auc_rule(self) -> str:
+        """Trapezoidal rule of the analyzer (``PKDesignMixin`` hook)."""
+        return self.auc_method
         
-        Returns
-        -------
-        pl.DataFrame
-            DataFrame containing all calculated PK parameters
-        """
-        return self.params_df.clone() 
\ No newline at end of file
+    def _params_sort_cols(self) -> List[str]:
+        """Columns the parameter frames are sorted by (``PKDesignMixin`` hook)."""
+        return []
+        
+    def _model_factors(self) -> List[str]:
+        """Factor columns encoded by the model frame (``PKDesignMixin`` hook)."""
+        return [self.subject_col, self.seq_col, self.period_col, self.form_col]
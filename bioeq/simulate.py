@@ -0,0 +1,469 @@
+"""
+Simulate Module
+
+This module implements a Monte Carlo engine that estimates the pass rate of average bioequivalence
+studies (power, or type I error when the true ratio lies on an acceptance limit) by simulating many
+trials at once.
+
+Trials follow the concentration-time model of ``simdata/simulation_data_generator.py``: a
+one-compartment model with first-order absorption, a log-normal subject effect, a log-normal
+within-subject effect per period (crossover only) and a log-normal residual error per sample.
+
+A block of trials is held as stacked arrays of shape (trials, subjects, periods, times). The
+profiles are packed into one ``nca.ProfileSet`` so that AUC and Cmax come from the same NCA
+kernels as the design classes, and the BE decision for all trials of the block is taken in one
+batched computation (``crossover_stats.point_estimate_2x2`` for the 2x2 design, a pooled two-sample
+t-interval for the parallel design). Blocks draw from child ``SeedSequence`` streams, so results
+depend only on the seed and not on the number of worker processes.
+
+For the type I error of reference-scaled bioequivalence (``rsabe_type1_error``) the concentration
+curves are skipped: replicate trials are simulated directly as per-subject log-scale values and
+reduced to the intra-subject contrasts I and D, which are invariant to subject and period
+effects. The FDA procedure of ``ReplicateCrossover.run_rsabe`` is then applied to whole blocks
+with ``reference_scaled.rsabe_fda``. All true GMRs of a CV share the simulated errors (common
+random numbers), so the surface is smooth across GMRs.
+"""
+
+import numpy as np
+import polars as pl
+from concurrent.futures import ProcessPoolExecutor
+from scipy import stats
+from typing import Dict, Optional, Sequence, Tuple, Union
+
+from . import crossover_stats, nca, reference_scaled
+
+DESIGNS = ("2x2", "parallel")
+
+METRICS = ("AUC", "Cmax")
+
+# Trials per block; every block has its own random stream
+BLOCK_SIZE = 500
+
+# Sequences of the replicate designs of ``rsabe_type1_error`` (names as in ``power.DESIGNS``)
+REPLICATE_SEQUENCES = {
+    "2x3x3": ("TRR", "RTR", "RRT"),
+    "2x2x3": ("TRT", "RTR"),
+    "2x2x4": ("TRTR", "RTRT"),
+}
+
+# Parameter-level trials per block of ``rsabe_type1_error``
+RSABE_BLOCK_SIZE = 5000
+
+# PK model of the simulation data generators
+KA = 1.0  # Absorption rate constant
+KE = 0.1  # Elimination rate constant
+DOSE = 100  # Nominal dose
+VD = 10  # Volume of distribution
+
+DEFAULT_TIME_POINTS = (0, 0.5, 1, 2, 4, 6, 8, 12, 24)
+
+
+def concentration_model(times: np.ndarray, formulation_effect: np.ndarray) -> np.ndarray:
+    """
+    Evaluate the one-compartment oral model without random effects.
+
+    Parameters
+    ----------
+    times : np.ndarray
+        Sampling times (n_times,)
+    formulation_effect : np.ndarray
+        Relative bioavailability of every profile (any shape)
+
+    Returns
+    -------
+    np.ndarray
+        Concentrations of shape ``formulation_effect.shape + (n_times,)``
+    """
+    times = np.asarray(times, dtype=np.float64)
+    shape = (DOSE / VD) * (KA / (KA - KE)) * (np.exp(-KE * times) - np.exp(-KA * times))
+    return np.asarray(formulation_effect, dtype=np.float64)[..., None] * np.where(times == 0, 0.0, shape)
+
+
+def _profile_metrics(
+    concs: np.ndarray,
+    times: np.ndarray,
+    metrics: Sequence[str],
+    auc_method: str,
+) -> Dict[str, np.ndarray]:
+    """Compute log AUC / log Cmax of stacked profiles (..., n_times) with the NCA kernels."""
+    n_times = concs.shape[-1]
+    flat = concs.reshape(-1, n_times)
+    profiles = nca.ProfileSet(
+        times=np.tile(times, len(flat)),
+        concs=flat.ravel(),
+        offsets=np.arange(len(flat) + 1) * n_times,
+    )
+    values = {
+        "AUC": lambda: nca.auc(profiles, auc_method),
+        "Cmax": lambda: nca.cmax(profiles),
+    }
+    with np.errstate(divide="ignore"):
+        return {metric: np.log(values[metric]()).reshape(concs.shape[:-1]) for metric in metrics}
+
+
+def _simulate_concentrations(
+    rng: np.random.Generator,
+    n_trials: int,
+    design: str,
+    n_subjects: int,
+    gmr: float,
+    inter_subject_cv: float,
+    intra_subject_cv: float,
+    residual_error: float,
+    times: np.ndarray,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Simulate the concentrations of a block of trials.
+
+    Returns the concentrations (n_trials, n_subjects, n_periods, n_times) and the
+    Test indicator of every subject and period (n_subjects, n_periods). In the
+    2x2 design subjects alternate between TR (Test first) and RT; in the
+    parallel design (one period) the second half of the subjects receives Test.
+    """
+    subject_effect = rng.normal(0, inter_subject_cv, (n_trials, n_subjects))
+    if design == "2x2":
+        test_second = np.arange(n_subjects) % 2 == 1
+        is_test = np.stack([~test_second, test_second], axis=-1)
+        effects = subject_effect[..., None] + rng.normal(0, intra_subject_cv, (n_trials, n_subjects, 2))
+    else:
+        is_test = (np.arange(n_subjects) >= n_subjects // 2)[:, None]
+        effects = subject_effect[..., None]
+
+    base = concentration_model(times, np.where(is_test, gmr, 1.0))
+    errors = rng.normal(0, residual_error, effects.shape + (len(times),))
+    return np.maximum(0, base * np.exp(effects)[..., None] * np.exp(errors)), is_test
+
+
+def _be_decisions(
+    concs: np.ndarray,
+    is_test: np.ndarray,
+    times: np.ndarray,
+    metrics: Sequence[str],
+    auc_method: str,
+    alpha: float,
+    theta1: float,
+    theta2: float,
+) -> np.ndarray:
+    """Run NCA and the BE decision for stacked trials; returns pass flags (n_trials, n_metrics)."""
+    log_values = _profile_metrics(concs, times, metrics, auc_method)
+    passed = np.empty((concs.shape[0], len(metrics)), dtype=bool)
+    for k, metric in enumerate(metrics):
+        y = log_values[metric]
+        if is_test.shape[1] == 2:
+            y_test = np.where(is_test, y, 0.0).sum(axis=-1)
+            y_ref = np.where(is_test, 0.0, y).sum(axis=-1)
+            result = crossover_stats.point_estimate_2x2(y_test, y_ref, is_test[:, 1], alpha=2 * alpha)
+            lower, upper = result["lower"], result["upper"]
+        else:
+            lower, upper = _two_sample_interval(y[..., 0], is_test[:, 0], alpha)
+        passed[:, k] = (lower >= np.log(theta1)) & (upper <= np.log(theta2))
+    return passed
+
+
+def _simulate_block(
+    n_trials: int,
+    seed: np.random.SeedSequence,
+    design: str,
+    n_subjects: int,
+    gmr: float,
+    inter_subject_cv: float,
+    intra_subject_cv: float,
+    residual_error: float,
+    times: np.ndarray,
+    metrics: Sequence[str],
+    auc_method: str,
+    alpha: float,
+    theta1: float,
+    theta2: float,
+) -> np.ndarray:
+    """Simulate and analyse one block of trials; returns pass flags (n_trials, n_metrics)."""
+    concs, is_test = _simulate_concentrations(
+        np.random.default_rng(seed), n_trials, design, n_subjects, gmr,
+        inter_subject_cv, intra_subject_cv, residual_error, times,
+    )
+    return _be_decisions(concs, is_test, times, metrics, auc_method, alpha, theta1, theta2)
+
+
+def _two_sample_interval(y: np.ndarray, is_test: np.ndarray, alpha: float) -> Tuple[np.ndarray, np.ndarray]:
+    """Pooled-variance (1 - 2·alpha) interval of mean(Test) - mean(Reference) over the last axis."""
+    n_test = np.count_nonzero(is_test)
+    n_ref = is_test.size - n_test
+    mean_test = y[..., is_test].mean(axis=-1)
+    mean_ref = y[..., ~is_test].mean(axis=-1)
+    df = n_test + n_ref - 2
+    ss = ((y[..., is_test] - mean_test[..., None]) ** 2).sum(axis=-1) + (
+        (y[..., ~is_test] - mean_ref[..., None]) ** 2
+    ).sum(axis=-1)
+    se = np.sqrt(ss / df * (1 / n_test + 1 / n_ref))
+    t_crit = stats.t.ppf(1 - alpha, df)
+    estimate = mean_test - mean_ref
+    return estimate - t_crit * se, estimate + t_crit * se
+
+
+def monte_carlo_se(rate: np.ndarray, n_trials: int) -> np.ndarray:
+    """Binomial Monte Carlo standard error of an estimated rate."""
+    return np.sqrt(rate * (1 - rate) / n_trials)
+
+
+def simulate_be_trials(
+    n_trials: int = 10000,
+    n_subjects: int = 24,
+    design: str = "2x2",
+    gmr: float = 0.95,
+    inter_subject_cv: float = 0.2,
+    intra_subject_cv: float = 0.15,
+    residual_error: float = 0.1,
+    time_points: Optional[Sequence[float]] = None,
+    metrics: Sequence[str] = METRICS,
+    auc_method: str = "linear",
+    alpha: float = 0.05,
+    theta1: float = 0.8,
+    theta2: float = 1.25,
+    seed: Optional[int] = None,
+    n_jobs: int = 1,
+) -> Dict[str, any]:
+    """
+    Estimate the bioequivalence pass rate of simulated trials.
+
+    Every trial simulates the concentration-time profiles of ``n_subjects``
+    subjects, computes log AUC and log Cmax and concludes BE when the
+    (1 - 2·alpha) confidence interval of the Test/Reference ratio lies within
+    [theta1, theta2] for every metric.
+
+    Parameters
+    ----------
+    n_trials : int, default=10000
+        Number of simulated trials
+    n_subjects : int, default=24
+        Total subjects per trial (alternating TR/RT sequences for "2x2", two equal
+        arms for "parallel")
+    design : str, default="2x2"
+        "2x2" crossover or "parallel"
+    gmr : float, default=0.95
+        True Test/Reference ratio (set to theta1 or theta2 to estimate the type I error)
+    inter_subject_cv : float, default=0.2
+        Between-subject variability (log-scale SD)
+    intra_subject_cv : float, default=0.15
+        Within-subject variability per period (log-scale SD, crossover only)
+    residual_error : float, default=0.1
+        Residual variability per sample (log-scale SD)
+    time_points : Sequence[float], optional
+        Sampling times (default: 0, 0.5, 1, 2, 4, 6, 8, 12, 24 h)
+    metrics : Sequence[str], default=("AUC", "Cmax")
+        Metrics that must all pass
+    auc_method : str, default="linear"
+        Trapezoidal rule for AUC, see ``nca.AUC_METHODS``
+    alpha : float, default=0.05
+        Level of each one-sided test (0.05 gives the 90% CI)
+    theta1, theta2 : float, default=0.8, 1.25
+        Acceptance limits for the ratio
+    seed : int, optional
+        Seed of the ``SeedSequence`` the block streams are spawned from
+    n_jobs : int, default=1
+        Number of worker processes; blocks are simulated in a process pool when > 1
+
+    Returns
+    -------
+    Dict
+        n_trials, pass_rate and mcse (all metrics passing), per-metric
+        ``metric_pass_rates`` and ``metric_mcse``, and the per-trial ``passed``
+        flags of shape (n_trials, n_metrics)
+    """
+    if design not in DESIGNS:
+        raise ValueError(f"design must be one of: {', '.join(DESIGNS)}")
+    if auc_method not in nca.AUC_METHODS:
+        raise ValueError(f"auc_method must be one of: {', '.join(nca.AUC_METHODS)}")
+    unknown = [metric for metric in metrics if metric not in METRICS]
+    if unknown:
+        raise ValueError(f"metrics must be among: {', '.join(METRICS)}")
+    if n_subjects < 4 or n_subjects % 2:
+        raise ValueError("n_subjects must be an even number of at least 4")
+
+    times = np.asarray(DEFAULT_TIME_POINTS if time_points is None else time_points, dtype=np.float64)
+    metrics = list(metrics)
+    sizes = [BLOCK_SIZE] * (n_trials // BLOCK_SIZE)
+    if n_trials % BLOCK_SIZE:
+        sizes.append(n_trials % BLOCK_SIZE)
+    streams = np.random.SeedSequence(seed).spawn(len(sizes))
+    settings = (
+        design, n_subjects, gmr, inter_subject_cv, intra_subject_cv, residual_error,
+        times, metrics, auc_method, alpha, theta1, theta2,
+    )
+
+    if n_jobs > 1 and len(sizes) > 1:
+        with ProcessPoolExecutor(max_workers=n_jobs) as pool:
+            futures = [pool.submit(_simulate_block, size, stream, *settings) for size, stream in zip(sizes, streams)]
+            blocks = [future.result() for future in futures]
+    else:
+        blocks = [_simulate_block(size, stream, *settings) for size, stream in zip(sizes, streams)]
+    passed = np.concatenate(blocks)
+
+    overall = passed.all(axis=1)
+    rates = passed.mean(axis=0)
+    return {
+        "n_trials": n_trials,
+        "pass_rate": float(overall.mean()),
+        "mcse": float(monte_carlo_se(overall.mean(), n_trials)),
+        "metric_pass_rates": dict(zip(metrics, rates.tolist())),
+        "metric_mcse": dict(zip(metrics, monte_carlo_se(rates, n_trials).tolist())),
+        "passed": passed,
+    }
+
+
+def _replicate_contrasts(
+    rng: np.random.Generator,
+    n_trials: int,
+    sequences: Sequence[str],
+    n_subjects: int,
+    sigma_wt: float,
+    sigma_wr: float,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Simulate the intra-subject contrasts of replicate trials with a true GMR of 1.
+
+    Subjects cycle through ``sequences``. Returns I = mean(T) - mean(R) and
+    D = R1 - R2 (NaN for subjects with a single Reference), both of shape
+    (n_trials, n_subjects), and the sequence code of every subject.
+    """
+    codes = np.arange(n_subjects) % len(sequences)
+    is_test = np.array([[letter == "T" for letter in sequences[code]] for code in codes])
+    errors = rng.standard_normal((n_trials,) + is_test.shape) * np.where(is_test, sigma_wt, sigma_wr)
+
+    n_test = is_test.sum(axis=1)
+    n_ref = (~is_test).sum(axis=1)
+    i_contrast = np.where(is_test, errors / n_test[:, None], -errors / n_ref[:, None]).sum(axis=-1)
+
+    # Positions of the first two Reference periods of every subject
+    ref_order = np.argsort(is_test, axis=1, kind="stable")
+    subjects = np.arange(n_subjects)
+    d_contrast = errors[:, subjects, ref_order[:, 0]] - errors[:, subjects, ref_order[:, 1]]
+    d_contrast = np.where(n_ref >= 2, d_contrast, np.nan)
+    return i_contrast, d_contrast, codes
+
+
+def _rsabe_block(
+    n_trials: int,
+    seed: np.random.SeedSequence,
+    design: str,
+    n_subjects: int,
+    sigma_wt: float,
+    sigma_wr: float,
+    log_gmrs: np.ndarray,
+    alpha: float,
+) -> np.ndarray:
+    """Simulate one block of replicate trials; returns the number of BE conclusions per GMR."""
+    i_contrast, d_contrast, codes = _replicate_contrasts(
+        np.random.default_rng(seed), n_trials, REPLICATE_SEQUENCES[design], n_subjects, sigma_wt, sigma_wr
+    )
+    # The GMR only shifts I; evaluate every GMR on the same errors
+    result = reference_scaled.rsabe_fda(
+        i_contrast[None] + log_gmrs[:, None, None], d_contrast, codes, alpha=alpha
+    )
+    return reference_scaled.rsabe_fda_conclusion(result).sum(axis=1)
+
+
+def fda_implied_limit(cvwr: np.ndarray) -> np.ndarray:
+    """
+    Upper limit of the GMR implied by the FDA RSABE procedure.
+
+    exp(sqrt(θ)·sWR) when sWR ≥ ``reference_scaled.FDA_SWR_CUTOFF``, otherwise
+    1.25 (the lower limit is the reciprocal). A true GMR on or beyond these
+    limits is bioinequivalent, so its pass rate is a type I error.
+    """
+    swr = np.sqrt(np.log1p(np.asarray(cvwr, dtype=np.float64) ** 2))
+    scaled = np.exp(np.sqrt(reference_scaled.FDA_THETA) * swr)
+    return np.where(swr >= reference_scaled.FDA_SWR_CUTOFF, scaled, 1.25)
+
+
+def rsabe_type1_error(
+    cvwr: Union[float, Sequence[float]] = (0.2, 0.25, 0.3, 0.35, 0.4, 0.5),
+    gmr: Optional[Sequence[float]] = None,
+    n_subjects: int = 24,
+    design: str = "2x3x3",
+    cvwt: Optional[float] = None,
+    n_trials: int = 100000,
+    alpha: float = 0.05,
+    seed: Optional[int] = None,
+    n_jobs: int = 1,
+) -> pl.DataFrame:
+    """
+    Estimate the pass rate surface of the FDA RSABE procedure over true CVwR and GMR.
+
+    Trials are simulated at the parameter level and analysed like the native
+    engine of ``ReplicateCrossover.run_rsabe``. Evaluated at GMRs on or beyond
+    the implied limits (``fda_implied_limit``), the pass rate is the type I
+    error, and its excess over ``alpha`` is the inflation.
+
+    Parameters
+    ----------
+    cvwr : float or Sequence[float], default=(0.2, 0.25, 0.3, 0.35, 0.4, 0.5)
+        True within-subject CVs of the Reference, as ratios
+    gmr : Sequence[float], optional
+        True Test/Reference ratios evaluated at every CV (default: the upper
+        implied limit of each CV, i.e. the type I error curve)
+    n_subjects : int, default=24
+        Total subjects per trial, cycling through the sequences of the design
+    design : str, default="2x3x3"
+        One of ``REPLICATE_SEQUENCES``
+    cvwt : float, optional
+        True within-subject CV of the Test (default: equal to ``cvwr``)
+    n_trials : int, default=100000
+        Simulated trials per CV (shared by all GMRs of that CV)
+    alpha : float, default=0.05
+        Nominal level (95% upper bound of the criterion, 90% CI for ABE)
+    seed : int, optional
+        Seed of the ``SeedSequence`` the block streams are spawned from
+    n_jobs : int, default=1
+        Number of worker processes; blocks are simulated in a process pool when > 1
+
+    Returns
+    -------
+    pl.DataFrame
+        One row per CV and GMR with cvwr, gmr, implied_limit, null (whether
+        the GMR lies on or beyond the implied limits), n_trials, pass_rate,
+        mcse and inflation (pass_rate - alpha for null rows, null otherwise)
+    """
+    if design not in REPLICATE_SEQUENCES:
+        raise ValueError(f"design must be one of: {', '.join(REPLICATE_SEQUENCES)}")
+    sequences = REPLICATE_SEQUENCES[design]
+    if n_subjects < 2 * len(sequences):
+        raise ValueError(f"n_subjects must be at least {2 * len(sequences)} for the {design} design")
+
+    cvwr = np.atleast_1d(np.asarray(cvwr, dtype=np.float64))
+    limits = fda_implied_limit(cvwr)
+    if gmr is None:
+        gmrs = limits[:, None]
+    else:
+        gmrs = np.broadcast_to(np.asarray(gmr, dtype=np.float64), (len(cvwr), len(gmr)))
+
+    sizes = [RSABE_BLOCK_SIZE] * (n_trials // RSABE_BLOCK_SIZE)
+    if n_trials % RSABE_BLOCK_SIZE:
+        sizes.append(n_trials % RSABE_BLOCK_SIZE)
+    tasks = []
+    for k, cv_stream in enumerate(np.random.SeedSequence(seed).spawn(len(cvwr))):
+        sigma_wr = np.sqrt(np.log1p(cvwr[k] ** 2))
+        sigma_wt = sigma_wr if cvwt is None else np.sqrt(np.log1p(cvwt ** 2))
+        settings = (design, n_subjects, sigma_wt, sigma_wr, np.log(gmrs[k]), alpha)
+        tasks += [(size, stream) + settings for size, stream in zip(sizes, cv_stream.spawn(len(sizes)))]
+
+    if n_jobs > 1 and len(tasks) > 1:
+        with ProcessPoolExecutor(max_workers=n_jobs) as pool:
+            futures = [pool.submit(_rsabe_block, *task) for task in tasks]
+            counts = [future.result() for future in futures]
+    else:
+        counts = [_rsabe_block(*task) for task in tasks]
+    passes = np.stack(counts).reshape(len(cvwr), len(sizes), -1).sum(axis=1)
+
+    rates = passes / n_trials
+    null = (gmrs >= limits[:, None] * (1 - 1e-12)) | (gmrs <= (1 + 1e-12) / limits[:, None])
+    return pl.DataFrame({
+        "cvwr": np.repeat(cvwr, gmrs.shape[1]),
+        "gmr": gmrs.ravel(),
+        "implied_limit": np.repeat(limits, gmrs.shape[1]),
+        "null": null.ravel(),
+        "n_trials": np.full(gmrs.size, n_trials),
+        "pass_rate": rates.ravel(),
+        "mcse": monte_carlo_se(rates, n_trials).ravel(),
+    }).with_columns(
+        pl.when(pl.col("null")).then(pl.col("pass_rate") - alpha).alias("inflation")
+    )
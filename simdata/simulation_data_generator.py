@@ -1,3 +1,5 @@
+import json
+import os
 import numpy as np
 import polars as pl
 from pathlib import Path
@@ -49,71 +51,63 @@ def generate_crossover_data(
     if time_points is None:
         time_points = [0, 0.5, 1, 2, 4, 6, 8, 12, 24]
 
-    np.random.seed(seed)
-
-    sequences = ["TR", "RT"]
-    formulations = ["Reference", "Test"]
+    # The whole subjects x periods x times grid is generated with array operations.
+    # Draws are taken from the legacy generator in the original per-subject order
+    # (period effects, then residual errors), so a seed reproduces earlier datasets.
+    rng = np.random.RandomState(seed)
+    times = np.asarray(time_points, dtype=np.float64)
+    n_times = len(times)
 
     # Between-subject variability
-    subject_effects = np.random.normal(0, inter_subject_cv, n_subjects)
-
-    data = []
-
-    for subject_idx, subject in enumerate(range(1, n_subjects + 1)):
-        # Assign sequence alternating between TR and RT
-        sequence = sequences[subject_idx % 2]
-        
-        # Within-subject variability per period
-        period_effects = np.random.normal(0, intra_subject_cv, periods)
-
-        for period in range(1, periods + 1):
-            if (sequence == "TR" and period == 1) or (sequence == "RT" and period == 2):
-                formulation = formulations[0]  # Reference
-                formulation_effect = 1.0
-            else:
-                formulation = formulations[1]  # Test
-                formulation_effect = test_reference_ratio
-
-            for time in time_points:
-                # Base PK model with first-order absorption and elimination
-                ka = 1.0  # Absorption rate constant
-                ke = 0.1  # Elimination rate constant
-                f = 1.0   # Bioavailability
-                dose = 100  # Nominal dose
-                vd = 10    # Volume of distribution
-                
-                # True concentration based on one-compartment model
-                if time == 0:
-                    true_concentration = 0
-                else:
-                    true_concentration = (
-                        (f * dose * formulation_effect / vd)
-                        * (ka / (ka - ke))
-                        * (np.exp(-ke * time) - np.exp(-ka * time))
-                    )
-                
-                # Add subject and period effects (multiplicative on log scale)
-                subject_effect = np.exp(subject_effects[subject_idx])
-                period_effect = np.exp(period_effects[period - 1])
-                
-                # Add random residual error
-                error = np.random.normal(0, residual_error)
-                observed_concentration = max(
-                    0, true_concentration * subject_effect * period_effect * np.exp(error)
-                )
-
-                data.append(
-                    {
-                        "SubjectID": subject,
-                        "Period": period,
-                        "Sequence": sequence,
-                        "Formulation": formulation,
-                        "Time (hr)": time,
-                        "Concentration (ng/mL)": observed_concentration,
-                    }
-                )
-
-    return pl.DataFrame(data)
+    subject_effects = rng.normal(0, inter_subject_cv, n_subjects)
+
+    # Per subject: within-subject variability per period, then one residual per sample
+    draws = rng.standard_normal((n_subjects, periods * (1 + n_times)))
+    period_effects = intra_subject_cv * draws[:, :periods]
+    errors = residual_error * draws[:, periods:].reshape(n_subjects, periods, n_times)
+
+    # Sequences alternate between TR and RT; Reference is given in period 1 of TR
+    # and period 2 of RT, Test in every other period
+    subject_idx = np.arange(n_subjects)
+    is_tr = subject_idx % 2 == 0
+    period = np.arange(1, periods + 1)
+    is_reference = (is_tr[:, None] & (period == 1)) | (~is_tr[:, None] & (period == 2))
+    formulation_effect = np.where(is_reference, 1.0, test_reference_ratio)
+
+    # Base PK model: one-compartment with first-order absorption and elimination
+    ka = 1.0  # Absorption rate constant
+    ke = 0.1  # Elimination rate constant
+    f = 1.0   # Bioavailability
+    dose = 100  # Nominal dose
+    vd = 10    # Volume of distribution
+    true_concentration = np.where(
+        times == 0,
+        0.0,
+        (f * dose * formulation_effect[:, :, None] / vd)
+        * (ka / (ka - ke))
+        * (np.exp(-ke * times) - np.exp(-ka * times)),
+    )
+
+    # Subject and period effects and residual error (multiplicative on log scale)
+    observed_concentration = np.maximum(
+        0,
+        true_concentration
+        * np.exp(subject_effects)[:, None, None]
+        * np.exp(period_effects)[:, :, None]
+        * np.exp(errors),
+    )
+
+    shape = (n_subjects, periods, n_times)
+    return pl.DataFrame({
+        "SubjectID": np.broadcast_to(subject_idx[:, None, None] + 1, shape).ravel(),
+        "Period": np.broadcast_to(period[None, :, None], shape).ravel(),
+        "Sequence": np.broadcast_to(np.where(is_tr, "TR", "RT")[:, None, None], shape).ravel(),
+        "Formulation": np.broadcast_to(
+            np.where(is_reference, "Reference", "Test")[:, :, None], shape
+        ).ravel(),
+        "Time (hr)": np.broadcast_to(np.asarray(time_points)[None, None, :], shape).ravel(),
+        "Concentration (ng/mL)": observed_concentration.ravel(),
+    })
 
 
 def generate_parallel_data(
@@ -154,61 +148,48 @@ def generate_parallel_data(
     if time_points is None:
         time_points = [0, 0.5, 1, 2, 4, 6, 8, 12, 24]
 
-    np.random.seed(seed)
-
-    formulations = ["Reference", "Test"]
+    # All subjects x times are generated with array operations. Draws are taken
+    # from a local legacy generator in the original per-subject order (subject
+    # effects, then residual errors), so a seed reproduces earlier datasets
+    # without touching the global NumPy random state.
+    rng = np.random.RandomState(seed)
+    times = np.asarray(time_points, dtype=np.float64)
     total_subjects = n_subjects_per_arm * 2
 
     # Between-subject variability
-    subject_effects = np.random.normal(0, inter_subject_cv, total_subjects)
-
-    data = []
-
-    for subject_idx, subject in enumerate(range(1, total_subjects + 1)):
-        # Assign formulation (first half to Reference, second half to Test)
-        formulation_idx = 0 if subject <= n_subjects_per_arm else 1
-        formulation = formulations[formulation_idx]
-        
-        # Formulation effect
-        formulation_effect = 1.0 if formulation == "Reference" else test_reference_ratio
-
-        for time in time_points:
-            # Base PK model with first-order absorption and elimination
-            ka = 1.0  # Absorption rate constant
-            ke = 0.1  # Elimination rate constant
-            f = 1.0   # Bioavailability
-            dose = 100  # Nominal dose
-            vd = 10    # Volume of distribution
-            
-            # True concentration based on one-compartment model
-            if time == 0:
-                true_concentration = 0
-            else:
-                true_concentration = (
-                    (f * dose * formulation_effect / vd)
-                    * (ka / (ka - ke))
-                    * (np.exp(-ke * time) - np.exp(-ka * time))
-                )
-            
-            # Add subject effect (multiplicative on log scale)
-            subject_effect = np.exp(subject_effects[subject_idx])
-            
-            # Add random residual error
-            error = np.random.normal(0, residual_error)
-            observed_concentration = max(
-                0, true_concentration * subject_effect * np.exp(error)
-            )
-
-            data.append(
-                {
-                    "SubjectID": subject,
-                    "Formulation": formulation,
-                    "Time (hr)": time,
-                    "Concentration (ng/mL)": observed_concentration,
-                }
-            )
-
-    return pl.DataFrame(data)
+    subject_effects = rng.normal(0, inter_subject_cv, total_subjects)
+    errors = residual_error * rng.standard_normal((total_subjects, len(times)))
+
+    # First half of the subjects receives Reference, second half Test
+    is_test = np.arange(total_subjects) >= n_subjects_per_arm
+    formulation_effect = np.where(is_test, test_reference_ratio, 1.0)
+
+    # Base PK model: one-compartment with first-order absorption and elimination
+    ka = 1.0  # Absorption rate constant
+    ke = 0.1  # Elimination rate constant
+    f = 1.0   # Bioavailability
+    dose = 100  # Nominal dose
+    vd = 10    # Volume of distribution
+    true_concentration = np.where(
+        times == 0,
+        0.0,
+        (f * dose * formulation_effect[:, None] / vd)
+        * (ka / (ka - ke))
+        * (np.exp(-ke * times) - np.exp(-ka * times)),
+    )
+
+    # Subject effect and residual error (multiplicative on log scale)
+    observed_concentration = np.maximum(
+        0, true_concentration * np.exp(subject_effects)[:, None] * np.exp(errors)
+    )
+
+    shape = (total_subjects, len(times))
+    return pl.DataFrame({
+        "SubjectID": np.broadcast_to(np.arange(1, total_subjects + 1)[:, None], shape).ravel(),
+        "Formulation": np.broadcast_to(np.where(is_test, "Test", "Reference")[:, None], shape).ravel(),
+        "Time (hr)": np.broadcast_to(times, shape).ravel(),
+        "Concentration (ng/mL)": observed_concentration.ravel(),
+    })
 
 
 def generate_crossover_2x2(n_subjects=24, seed=42):
@@ -338,156 +319,347 @@ def generate_parallel_design(n_subjects=40, seed=42):
     return pl.DataFrame(data)
 
 
-def generate_partial_replicate_data(n_subjects=12, seed=42):
+def spawn_seeds(seed=None, n=1):
+    """
+    Spawn independent seed sequences, e.g. one per dataset or worker process.
+
+    Parameters:
+    -----------
+    seed : int or np.random.SeedSequence, optional
+        Root seed (fresh entropy when None).
+    n : int
+        Number of child sequences (default: 1).
+
+    Returns:
+    --------
+    list of np.random.SeedSequence
+        Child sequences to pass as ``seed`` to the replicate generators.
+    """
+    root = seed if isinstance(seed, np.random.SeedSequence) else np.random.SeedSequence(seed)
+    return root.spawn(n)
+
+
+def _generate_replicate_data(
+    sequences,
+    n_subjects,
+    time_points,
+    test_reference_ratio,
+    inter_subject_cv,
+    intra_subject_cv_test,
+    intra_subject_cv_reference,
+    residual_error,
+    seed,
+):
+    """
+    Simulate a replicate crossover on a subjects x periods x times grid.
+
+    Subjects cycle through ``sequences`` (strings of "T"/"R", one letter per
+    period). The subject, within-subject and residual effects are drawn from
+    separate ``np.random.Generator`` streams spawned from ``seed``.
+    """
+    if time_points is None:
+        time_points = [0, 0.5, 1, 2, 4, 6, 8, 12, 24]
+
+    root = seed if isinstance(seed, np.random.SeedSequence) else np.random.SeedSequence(seed)
+    subject_rng, within_rng, residual_rng = [np.random.default_rng(s) for s in root.spawn(3)]
+    times = np.asarray(time_points, dtype=np.float64)
+    n_periods = len(sequences[0])
+    shape = (n_subjects, n_periods, len(times))
+
+    # Assign sequences cyclically; formulation per subject and period from the sequence letters
+    subject_idx = np.arange(n_subjects)
+    sequence = np.asarray(sequences)[subject_idx % len(sequences)]
+    letters = np.array([list(seq) for seq in sequences])[subject_idx % len(sequences)]
+    is_test = letters == "T"
+
+    # Formulation effect (Test relative to Reference) and period effect (slight decrease over periods)
+    formulation_effect = np.where(is_test, test_reference_ratio, 1.0)
+    period_effect = 1.0 - np.arange(n_periods) * 0.05
+
+    # Between-subject, formulation-specific within-subject and residual variability
+    subject_effect = subject_rng.normal(0, inter_subject_cv, n_subjects)
+    within_sd = np.where(is_test, intra_subject_cv_test, intra_subject_cv_reference)
+    within_subject_effect = within_sd * within_rng.standard_normal((n_subjects, n_periods))
+    error = residual_rng.normal(0, residual_error, shape)
+
+    # Base PK model
+    ka = 1.0  # absorption rate
+    ke = 0.1  # elimination rate
+    dose = 100
+    vd = 10
+    conc = np.where(
+        times == 0,
+        0.0,
+        (dose * formulation_effect[:, :, None] / vd)
+        * (ka / (ka - ke))
+        * (np.exp(-ke * times) - np.exp(-ka * times)),
+    )
+
+    # Apply effects (multiplicative on the concentration) and random error
+    conc = (
+        conc
+        * np.exp(subject_effect)[:, None, None]
+        * period_effect[None, :, None]
+        * np.exp(within_subject_effect)[:, :, None]
+    )
+    observed_conc = np.maximum(0, conc * np.exp(error))
+
+    return pl.DataFrame({
+        "SubjectID": np.broadcast_to(subject_idx[:, None, None] + 1, shape).ravel(),
+        "Period": np.broadcast_to(np.arange(1, n_periods + 1)[None, :, None], shape).ravel(),
+        "Sequence": np.broadcast_to(sequence[:, None, None], shape).ravel(),
+        "Formulation": np.broadcast_to(np.where(is_test, "Test", "Reference")[:, :, None], shape).ravel(),
+        "Time (hr)": np.broadcast_to(np.asarray(time_points)[None, None, :], shape).ravel(),
+        "Concentration (ng/mL)": observed_conc.ravel(),
+    })
+
+
+def generate_partial_replicate_data(
+    n_subjects=12,
+    seed=42,
+    time_points=None,
+    test_reference_ratio=0.95,
+    inter_subject_cv=0.2,
+    intra_subject_cv_test=0.3,
+    intra_subject_cv_reference=0.3,
+    residual_error=0.1,
+):
     """
     Generate simulated data for a 3-way partial replicate design (TRR, RTR, RRT)
     
     This design is commonly used for highly variable drugs and allows for
     the estimation of within-subject variability for the reference product.
-    """
-    np.random.seed(seed)
-    
-    # Define sequences for partial replicate (TRR, RTR, RRT)
-    sequences = ["TRR", "RTR", "RRT"]
-    
-    # Initialize data list
-    data = []
-    
-    for subject in range(1, n_subjects + 1):
-        # Assign sequence (cycling through sequences)
-        sequence = sequences[(subject - 1) % len(sequences)]
-        
-        # Subject-specific parameter
-        subject_effect = np.random.normal(0, 0.2)  # 20% between-subject variability
-        
-        for period in range(1, 4):  # 3 periods
-            # Determine formulation based on sequence and period
-            if sequence == "TRR":
-                formulation = "Test" if period == 1 else "Reference"
-            elif sequence == "RTR":
-                formulation = "Reference" if period in [1, 3] else "Test"
-            elif sequence == "RRT":
-                formulation = "Reference" if period in [1, 2] else "Test"
-                
-            # Formulation effect (Test is 95% of Reference)
-            formulation_effect = 0.95 if formulation == "Test" else 1.0
-            
-            # Period effect (slight decrease over periods)
-            period_effect = 1.0 - (period - 1) * 0.05
-            
-            # Within-subject variability for the period
-            # Higher within-subject variability (30%) to simulate a highly variable drug
-            within_subject_effect = np.random.normal(0, 0.3)
-            
-            # Generate concentration data for this subject/period
-            for time in [0, 0.5, 1, 2, 4, 6, 8, 12, 24]:
-                # Base PK model
-                if time == 0:
-                    conc = 0
-                else:
-                    ka = 1.0  # absorption rate
-                    ke = 0.1  # elimination rate
-                    dose = 100
-                    vd = 10
-                    
-                    conc = (
-                        (dose * formulation_effect / vd)
-                        * (ka / (ka - ke))
-                        * (np.exp(-ke * time) - np.exp(-ka * time))
-                    )
-                
-                # Apply effects (multiplicative on the concentration)
-                conc = conc * np.exp(subject_effect) * period_effect * np.exp(within_subject_effect)
-                
-                # Add random error
-                error = np.random.normal(0, 0.1)  # 10% residual error
-                observed_conc = max(0, conc * np.exp(error))
-                
-                data.append({
-                    "SubjectID": subject,
-                    "Period": period,
-                    "Sequence": sequence,
-                    "Formulation": formulation,
-                    "Time (hr)": time,
-                    "Concentration (ng/mL)": observed_conc
-                })
-    
-    return pl.DataFrame(data)
 
+    Parameters:
+    -----------
+    n_subjects : int
+        Number of subjects, assigned to the sequences in turn (default: 12).
+    seed : int or np.random.SeedSequence
+        Seed of the generator streams; use ``spawn_seeds`` for independent
+        datasets across processes (default: 42).
+    time_points : list
+        List of time points for PK sampling (default: [0, 0.5, 1, 2, 4, 6, 8, 12, 24]).
+    test_reference_ratio : float
+        True ratio of Test/Reference formulations (default: 0.95).
+    inter_subject_cv : float
+        Between-subject variability, log-scale SD (default: 0.2).
+    intra_subject_cv_test : float
+        Within-subject variability of Test, log-scale SD (default: 0.3).
+    intra_subject_cv_reference : float
+        Within-subject variability of Reference, log-scale SD (default: 0.3).
+    residual_error : float
+        Standard deviation for residual error (default: 0.1).
 
-def generate_full_replicate_data(n_subjects=24, seed=42):
+    Returns:
+    --------
+    pl.DataFrame
+        Simulated dataset with columns SubjectID, Period, Sequence, Formulation,
+        Time (hr) and Concentration (ng/mL).
+    """
+    return _generate_replicate_data(
+        ["TRR", "RTR", "RRT"],
+        n_subjects,
+        time_points,
+        test_reference_ratio,
+        inter_subject_cv,
+        intra_subject_cv_test,
+        intra_subject_cv_reference,
+        residual_error,
+        seed,
+    )
+
+
+def generate_full_replicate_data(
+    n_subjects=24,
+    seed=42,
+    time_points=None,
+    test_reference_ratio=0.95,
+    inter_subject_cv=0.2,
+    intra_subject_cv_test=0.3,
+    intra_subject_cv_reference=0.3,
+    residual_error=0.1,
+):
     """
     Generate simulated data for a 4-way full replicate design (TRTR, RTRT)
     
     This design is commonly used for highly variable drugs and provides the most
     information about within-subject variability for both test and reference products.
+
+    Parameters:
+    -----------
+    n_subjects : int
+        Number of subjects, assigned to the sequences in turn (default: 24).
+    seed : int or np.random.SeedSequence
+        Seed of the generator streams; use ``spawn_seeds`` for independent
+        datasets across processes (default: 42).
+    time_points : list
+        List of time points for PK sampling (default: [0, 0.5, 1, 2, 4, 6, 8, 12, 24]).
+    test_reference_ratio : float
+        True ratio of Test/Reference formulations (default: 0.95).
+    inter_subject_cv : float
+        Between-subject variability, log-scale SD (default: 0.2).
+    intra_subject_cv_test : float
+        Within-subject variability of Test, log-scale SD (default: 0.3).
+    intra_subject_cv_reference : float
+        Within-subject variability of Reference, log-scale SD (default: 0.3).
+    residual_error : float
+        Standard deviation for residual error (default: 0.1).
+
+    Returns:
+    --------
+    pl.DataFrame
+        Simulated dataset with columns SubjectID, Period, Sequence, Formulation,
+        Time (hr) and Concentration (ng/mL).
     """
-    np.random.seed(seed)
-    
-    # Define sequences for full replicate (TRTR, RTRT)
-    sequences = ["TRTR", "RTRT"]
-    
-    # Initialize data list
-    data = []
-    
-    for subject in range(1, n_subjects + 1):
-        # Assign sequence (alternating)
-        sequence = sequences[(subject - 1) % len(sequences)]
-        
-        # Subject-specific parameter
-        subject_effect = np.random.normal(0, 0.2)  # 20% between-subject variability
-        
-        for period in range(1, 5):  # 4 periods
-            # Determine formulation based on sequence and period
-            if sequence == "TRTR":
-                formulation = "Test" if period % 2 == 1 else "Reference"
-            elif sequence == "RTRT":
-                formulation = "Reference" if period % 2 == 1 else "Test"
-                
-            # Formulation effect (Test is 95% of Reference)
-            formulation_effect = 0.95 if formulation == "Test" else 1.0
-            
-            # Period effect (slight decrease over periods)
-            period_effect = 1.0 - (period - 1) * 0.05
-            
-            # Within-subject variability for the period
-            # Higher within-subject variability (30%) to simulate a highly variable drug
-            within_subject_effect = np.random.normal(0, 0.3)
-            
-            # Generate concentration data for this subject/period
-            for time in [0, 0.5, 1, 2, 4, 6, 8, 12, 24]:
-                # Base PK model
-                if time == 0:
-                    conc = 0
-                else:
-                    ka = 1.0  # absorption rate
-                    ke = 0.1  # elimination rate
-                    dose = 100
-                    vd = 10
-                    
-                    conc = (
-                        (dose * formulation_effect / vd)
-                        * (ka / (ka - ke))
-                        * (np.exp(-ke * time) - np.exp(-ka * time))
-                    )
-                
-                # Apply effects (multiplicative on the concentration)
-                conc = conc * np.exp(subject_effect) * period_effect * np.exp(within_subject_effect)
-                
-                # Add random error
-                error = np.random.normal(0, 0.1)  # 10% residual error
-                observed_conc = max(0, conc * np.exp(error))
-                
-                data.append({
-                    "SubjectID": subject,
-                    "Period": period,
-                    "Sequence": sequence,
-                    "Formulation": formulation,
-                    "Time (hr)": time,
-                    "Concentration (ng/mL)": observed_conc
-                })
-    
-    return pl.DataFrame(data)
+    return _generate_replicate_data(
+        ["TRTR", "RTRT"],
+        n_subjects,
+        time_points,
+        test_reference_ratio,
+        inter_subject_cv,
+        intra_subject_cv_test,
+        intra_subject_cv_reference,
+        residual_error,
+        seed,
+    )
+
+
+# Streaming designs: generator, its subject-count argument, subjects per count unit
+# and the sequence cycle length that chunk sizes must respect
+STREAMING_DESIGNS = {
+    "crossover": (generate_crossover_data, "n_subjects", 1, 2),
+    "parallel": (generate_parallel_data, "n_subjects_per_arm", 2, 2),
+    "partial_replicate": (generate_partial_replicate_data, "n_subjects", 1, 3),
+    "full_replicate": (generate_full_replicate_data, "n_subjects", 1, 2),
+}
+
+
+def iter_chunks(design="crossover", n_subjects=1000, chunk_size=100, seed=42, start_chunk=0, **kwargs):
+    """
+    Generate a simulated study as a stream of fixed-size chunks of subjects.
+
+    Chunk ``i`` holds subjects ``i * chunk_size + 1`` onwards and is generated
+    from its own child of ``np.random.SeedSequence(seed)``, so any chunk can be
+    (re)generated without the ones before it and only one chunk is held in
+    memory at a time. Every chunk is balanced across sequences (or arms).
+
+    Parameters:
+    -----------
+    design : str
+        One of ``STREAMING_DESIGNS`` (default: "crossover").
+    n_subjects : int
+        Total number of subjects (default: 1000).
+    chunk_size : int
+        Subjects per chunk; a multiple of the number of sequences (default: 100).
+    seed : int
+        Root seed of the chunk streams (default: 42).
+    start_chunk : int
+        Index of the first chunk to yield (default: 0).
+    **kwargs
+        Further arguments of the design's generator (e.g. ``test_reference_ratio``).
+
+    Yields:
+    -------
+    tuple of (int, pl.DataFrame)
+        Chunk index and the chunk's data.
+    """
+    if design not in STREAMING_DESIGNS:
+        raise ValueError(f"design must be one of {list(STREAMING_DESIGNS)}")
+    generator, size_arg, per_unit, cycle = STREAMING_DESIGNS[design]
+    if chunk_size % cycle or chunk_size % per_unit:
+        raise ValueError(f"chunk_size must be a multiple of {max(cycle, per_unit)} for the {design} design")
+    if n_subjects % cycle:
+        raise ValueError(f"n_subjects must be a multiple of {cycle} for the {design} design")
+
+    n_chunks = -(-n_subjects // chunk_size)
+    streams = np.random.SeedSequence(seed).spawn(n_chunks)
+    for index in range(start_chunk, n_chunks):
+        first = index * chunk_size
+        size = min(chunk_size, n_subjects - first)
+        chunk_seed = int(streams[index].generate_state(1)[0])
+        data = generator(**{size_arg: size // per_unit}, seed=chunk_seed, **kwargs)
+        yield index, data.with_columns(pl.col("SubjectID") + first)
+
+
+def write_parquet_dataset(
+    path,
+    design="crossover",
+    n_subjects=1000,
+    chunk_size=100,
+    seed=42,
+    resume=True,
+    **kwargs,
+):
+    """
+    Write a simulated study to a Parquet dataset partitioned by chunk.
+
+    Each chunk is written to ``path/chunk=<index>/data.parquet`` through a
+    temporary file that is renamed once complete, so an interrupted run leaves
+    only whole chunks behind. With ``resume=True`` existing chunks are kept and
+    generation continues after the last completed one. The settings are stored
+    in ``path/_simulation.json`` and must match when resuming.
+
+    The dataset can be read lazily, e.g.
+    ``pl.scan_parquet(path / "**/*.parquet", hive_partitioning=True)``, and
+    passed to the design classes.
+
+    Parameters:
+    -----------
+    path : str or Path
+        Output directory.
+    design : str
+        One of ``STREAMING_DESIGNS`` (default: "crossover").
+    n_subjects : int
+        Total number of subjects (default: 1000).
+    chunk_size : int
+        Subjects per chunk (default: 100).
+    seed : int
+        Root seed of the chunk streams (default: 42).
+    resume : bool
+        Continue an interrupted run instead of starting over (default: True).
+    **kwargs
+        Further arguments of the design's generator.
+
+    Returns:
+    --------
+    int
+        Number of chunks written by this call.
+    """
+    path = Path(path)
+    path.mkdir(parents=True, exist_ok=True)
+    settings = {
+        "design": design,
+        "n_subjects": n_subjects,
+        "chunk_size": chunk_size,
+        "seed": seed,
+        "kwargs": kwargs,
+    }
+    settings_file = path / "_simulation.json"
+    if settings_file.exists():
+        if not resume:
+            raise FileExistsError(f"{path} already holds a simulated dataset; use resume=True")
+        if json.loads(settings_file.read_text()) != json.loads(json.dumps(settings)):
+            raise ValueError(f"Settings differ from those of the dataset in {path}")
+    else:
+        settings_file.write_text(json.dumps(settings, indent=2))
+
+    def chunk_file(index):
+        return path / f"chunk={index:06d}" / "data.parquet"
+
+    # Chunks are written in order, so generation resumes after the last completed one
+    start_chunk = 0
+    while chunk_file(start_chunk).exists():
+        start_chunk += 1
+
+    written = 0
+    for index, data in iter_chunks(design, n_subjects, chunk_size, seed, start_chunk, **kwargs):
+        target = chunk_file(index)
+        target.parent.mkdir(exist_ok=True)
+        partial = target.with_suffix(".parquet.tmp")
+        data.write_parquet(partial)
+        os.replace(partial, target)
+        written += 1
+    return written
 
 
 if __name__ == "__main__":
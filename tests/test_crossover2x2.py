@@ -249,4 +249,400 @@ def test_summarize_pk_parameters(simulated_crossover_data):
     ref_summary_n = auc_summary.filter(pl.col("Formulation") == "Reference")["N"].item() if "Reference" in auc_summary["Formulation"] else 0
     
     assert test_summary_n == test_count
-    assert ref_summary_n == ref_count 
\ No newline at end of file
+    assert ref_summary_n == ref_count 
+
+def test_auc_independent_of_row_order(simulated_crossover_data):
+    """Test that AUC is computed on time-sorted profiles regardless of input row order"""
+    kwargs = dict(
+        subject_col="SubjectID",
+        seq_col="Sequence",
+        period_col="Period",
+        time_col="Time (hr)",
+        conc_col="Concentration (ng/mL)",
+        form_col="Formulation"
+    )
+    ordered = Crossover2x2(data=simulated_crossover_data, **kwargs)
+    shuffled = Crossover2x2(
+        data=simulated_crossover_data.sample(fraction=1.0, shuffle=True, seed=7),
+        **kwargs
+    )
+    
+    expected = ordered.params_df.sort(["SubjectID", "Period"])["AUC"].to_numpy()
+    actual = shuffled.params_df.sort(["SubjectID", "Period"])["AUC"].to_numpy()
+    
+    assert np.allclose(actual, expected, rtol=1e-10)
+
+
+def test_lazy_mode_matches_eager(simulated_crossover_data):
+    """Test that lazy mode computes only requested columns and matches eager results"""
+    kwargs = dict(
+        subject_col="SubjectID",
+        seq_col="Sequence",
+        period_col="Period",
+        time_col="Time (hr)",
+        conc_col="Concentration (ng/mL)",
+        form_col="Formulation"
+    )
+    eager = Crossover2x2(data=simulated_crossover_data, **kwargs)
+    lazy = Crossover2x2(data=simulated_crossover_data, lazy=True, **kwargs)
+    
+    subset = lazy.get_params_df(["log_Cmax"])
+    assert "log_Cmax" in subset.columns and "AUC" not in subset.columns
+    assert not lazy._parameters.is_computed("t_half")
+    
+    result = lazy.run_anova("log_Cmax", engine="native")
+    assert "anova_table" in result
+    assert not lazy._parameters.is_computed("AUC_inf")
+    
+    assert lazy.params_df.equals(eager.params_df)
+
+
+def test_lazyframe_scan_with_filters(simulated_crossover_data, tmp_path):
+    """Test that a filtered parquet scan gives the same parameters as the eager frame"""
+    kwargs = dict(
+        subject_col="SubjectID",
+        seq_col="Sequence",
+        period_col="Period",
+        time_col="Time (hr)",
+        conc_col="Concentration (ng/mL)",
+        form_col="Formulation"
+    )
+    eager = Crossover2x2(data=simulated_crossover_data, **kwargs)
+    
+    # Stack a second analyte that must be filtered out of the scan
+    path = tmp_path / "concentrations.parquet"
+    pl.concat([
+        simulated_crossover_data.with_columns(pl.lit("parent").alias("Analyte")),
+        simulated_crossover_data.with_columns(
+            pl.lit("metabolite").alias("Analyte"),
+            pl.col("Concentration (ng/mL)") * 0.1,
+        ),
+    ]).write_parquet(path)
+    
+    scanned = Crossover2x2(
+        data=pl.scan_parquet(path),
+        filters=pl.col("Analyte") == "parent",
+        **kwargs
+    )
+    
+    assert scanned.params_df.equals(eager.params_df)
+    
+    with pytest.raises(ValueError, match="Required column"):
+        Crossover2x2(data=pl.scan_parquet(path), **{**kwargs, "conc_col": "Conc"})
+
+
+def test_best_fit_lambda_z(simulated_crossover_data):
+    """Test the best-fit lambda_z option and its reported fit statistics"""
+    kwargs = dict(
+        subject_col="SubjectID",
+        seq_col="Sequence",
+        period_col="Period",
+        time_col="Time (hr)",
+        conc_col="Concentration (ng/mL)",
+        form_col="Formulation"
+    )
+    analyzer = Crossover2x2(data=simulated_crossover_data, lambda_z_method="best_fit", **kwargs)
+    params = analyzer.params_df.drop_nulls("lambda_z")
+    
+    assert len(params) > 0
+    assert (params["lambda_z_n_points"] >= 3).all()
+    assert (params["lambda_z_start"] > params["Tmax"]).all()
+    assert (params["lambda_z_adj_r2"] <= 1).all()
+    assert np.allclose(params["t_half"].to_numpy(), np.log(2) / params["lambda_z"].to_numpy())
+    
+    # The default keeps the last three samples
+    default = Crossover2x2(data=simulated_crossover_data, **kwargs).params_df
+    assert (default["lambda_z_n_points"].drop_nulls() <= 3).all()
+    
+    with pytest.raises(ValueError, match="lambda_z_method"):
+        Crossover2x2(data=simulated_crossover_data, lambda_z_method="last_5", **kwargs)
+
+
+def test_partial_auc(simulated_crossover_data):
+    """Test that partial AUCs add up and the full window reproduces AUC"""
+    analyzer = Crossover2x2(
+        data=simulated_crossover_data,
+        subject_col="SubjectID",
+        seq_col="Sequence",
+        period_col="Period",
+        time_col="Time (hr)",
+        conc_col="Concentration (ng/mL)",
+        form_col="Formulation"
+    )
+    t_last = simulated_crossover_data["Time (hr)"].max()
+    result = analyzer.calculate_partial_auc([(0, 2), (2, t_last), (0, t_last), (0, 1e6)])
+    
+    assert len(result) == len(analyzer.params_df)
+    assert np.allclose(
+        (result["AUC_0-2"] + result[f"AUC_2-{t_last:g}"]).to_numpy(),
+        result[f"AUC_0-{t_last:g}"].to_numpy(),
+    )
+    assert np.allclose(result[f"AUC_0-{t_last:g}"].to_numpy(), analyzer.params_df["AUC"].to_numpy())
+    assert result["AUC_0-1e+06"].is_null().all()
+    
+    named = analyzer.calculate_partial_auc([(0, 1.5)], names=["AUC_early"])
+    assert "AUC_early" in named.columns
+    
+    with pytest.raises(ValueError, match="t1 < t2"):
+        analyzer.calculate_partial_auc([(4, 2)])
+
+
+def test_native_anova_matches_ols(simulated_crossover_data):
+    """Test the closed-form ANOVA against OLS fits on unbalanced sequences"""
+    import statsmodels.api as sm
+    import statsmodels.formula.api as smf
+    
+    first_subject = simulated_crossover_data["SubjectID"].min()
+    analyzer = Crossover2x2(
+        data=simulated_crossover_data.filter(pl.col("SubjectID") != first_subject),
+        subject_col="SubjectID",
+        seq_col="Sequence",
+        period_col="Period",
+        time_col="Time (hr)",
+        conc_col="Concentration (ng/mL)",
+        form_col="Formulation"
+    )
+    result = analyzer.run_anova("log_AUC", engine="native")
+    table = {row["Source"]: row for row in result["anova_table"].to_dicts()}
+    
+    df = analyzer.params_df.to_pandas()
+    within = sm.stats.anova_lm(
+        smf.ols("log_AUC ~ C(SubjectID) + C(Period) + C(Formulation)", data=df).fit(), typ=2
+    )
+    sequence_ss = smf.ols("log_AUC ~ C(Sequence)", data=df).fit().ess
+    
+    assert np.isclose(table["Period"]["sum_sq"], within.loc["C(Period)", "sum_sq"])
+    assert np.isclose(table["Formulation"]["sum_sq"], within.loc["C(Formulation)", "sum_sq"])
+    assert np.isclose(table["Formulation"]["p_value"], within.loc["C(Formulation)", "PR(>F)"])
+    assert np.isclose(table["Residual"]["sum_sq"], within.loc["Residual", "sum_sq"])
+    assert table["Residual"]["df"] == within.loc["Residual", "df"]
+    assert np.isclose(table["Sequence"]["sum_sq"], sequence_ss)
+    assert np.isclose(
+        table["Sequence"]["sum_sq"] + table["SubjectID(Sequence)"]["sum_sq"],
+        within.loc["C(SubjectID)", "sum_sq"],
+    )
+    
+    # The closed form is the default; statsmodels remains available as a cross-check
+    default = analyzer.run_anova("log_AUC")
+    assert isinstance(default["anova_table"], pl.DataFrame) and "model" not in default
+    assert "model" in analyzer.run_anova("log_AUC", engine="statsmodels")
+
+    
+    # Several metrics are tabulated in one call
+    batch = analyzer.run_anovas(["log_AUC", "log_Cmax"])
+    assert batch["metric"].unique(maintain_order=True).to_list() == ["log_AUC", "log_Cmax"]
+    for metric in ["log_AUC", "log_Cmax"]:
+        single = analyzer.run_anova(metric)["anova_table"]
+        rows = batch.filter(pl.col("metric") == metric)
+        assert rows["Source"].to_list() == single["Source"].to_list()
+        assert np.allclose(rows["sum_sq"].to_numpy(), single["sum_sq"].to_numpy())
+
+def test_exact_point_estimate_matches_anova_model(simulated_crossover_data):
+    """Test the exact CI against the fixed-subject ANOVA model and the incomplete-data fallback"""
+    import statsmodels.formula.api as smf
+    
+    kwargs = dict(
+        subject_col="SubjectID",
+        seq_col="Sequence",
+        period_col="Period",
+        time_col="Time (hr)",
+        conc_col="Concentration (ng/mL)",
+        form_col="Formulation"
+    )
+    first_subject = simulated_crossover_data["SubjectID"].min()
+    unbalanced = simulated_crossover_data.filter(pl.col("SubjectID") != first_subject)
+    analyzer = Crossover2x2(data=unbalanced, **kwargs)
+    result = analyzer.calculate_point_estimate("log_AUC")
+    
+    model = smf.ols(
+        "log_AUC ~ C(SubjectID) + C(Period) + C(Formulation)", data=analyzer.params_df.to_pandas()
+    ).fit()
+    term = "C(Formulation)[T.Test]"
+    lower, upper = model.conf_int(alpha=0.1).loc[term]
+    
+    assert result["method"] == "exact"
+    assert np.isclose(result["point_estimate"], np.exp(model.params[term]) * 100)
+    assert np.isclose(result["lower_90ci"], np.exp(lower) * 100)
+    assert np.isclose(result["upper_90ci"], np.exp(upper) * 100)
+    
+    # A subject missing one period requires the mixed model
+    second_subject = unbalanced["SubjectID"].min()
+    incomplete = unbalanced.filter(
+        ~((pl.col("SubjectID") == second_subject) & (pl.col("Period") == 2))
+    )
+    fallback = Crossover2x2(data=incomplete, **kwargs).calculate_point_estimate("log_AUC")
+    assert fallback["method"] == "mixedlm"
+    assert 50 <= fallback["point_estimate"] <= 150
+
+
+
+def test_exact_point_estimate_hand_computed(simulated_crossover_data):
+    """Test the exact 2x2 interval against a hand-computed t-interval"""
+    analyzer = Crossover2x2(
+        data=simulated_crossover_data,
+        subject_col="SubjectID",
+        seq_col="Sequence",
+        period_col="Period",
+        time_col="Time (hr)",
+        conc_col="Concentration (ng/mL)",
+        form_col="Formulation"
+    )
+    # Test - Reference differences: TR sequence 0.10, -0.02, 0.04 (mean 0.04, SS 0.0072),
+    # RT sequence 0.00, 0.06, -0.03 (mean 0.01, SS 0.0042)
+    diffs = {1: 0.10, 2: -0.02, 3: 0.04, 4: 0.00, 5: 0.06, 6: -0.03}
+    rows = []
+    for subject, diff in diffs.items():
+        test_period = 1 if subject <= 3 else 2
+        for period in (1, 2):
+            is_test = period == test_period
+            rows.append({
+                "SubjectID": subject,
+                "Sequence": "TR" if subject <= 3 else "RT",
+                "Period": period,
+                "Formulation": "Test" if is_test else "Reference",
+                "log_AUC": 4.0 + 0.1 * subject + 0.05 * period + (diff if is_test else 0.0),
+            })
+    analyzer.params_df = pl.DataFrame(rows)
+    result = analyzer.calculate_point_estimate("log_AUC")
+    
+    # estimate = (0.04 + 0.01) / 2 = 0.025; s² = (0.0072 + 0.0042) / 4 = 0.00285;
+    # se = sqrt(s² / 4 * (1/3 + 1/3)) = 0.0217945; t(0.95, 4) = 2.1318468
+    assert result["method"] == "exact"
+    assert np.isclose(result["point_estimate"], 102.5315, atol=1e-4)
+    assert np.isclose(result["lower_90ci"], 97.8766, atol=1e-4)
+    assert np.isclose(result["upper_90ci"], 107.4078, atol=1e-4)
+    assert result["be_criteria_met"]
+
+def test_batch_point_estimates_match_single_metric(simulated_crossover_data):
+    """Test that the shared-factorization batch analysis matches per-metric estimates"""
+    analyzer = Crossover2x2(
+        data=simulated_crossover_data,
+        subject_col="SubjectID",
+        seq_col="Sequence",
+        period_col="Period",
+        time_col="Time (hr)",
+        conc_col="Concentration (ng/mL)",
+        form_col="Formulation"
+    )
+    metrics = ["log_AUC", "log_Cmax", "log_AUC_inf"]
+    batch = analyzer.calculate_point_estimates(metrics)
+    
+    assert batch["metric"].to_list() == metrics
+    for row in batch.to_dicts():
+        single = analyzer.calculate_point_estimate(row["metric"])
+        assert np.isclose(row["point_estimate"], single["point_estimate"])
+        assert np.isclose(row["lower_90ci"], single["lower_90ci"])
+        assert np.isclose(row["upper_90ci"], single["upper_90ci"])
+        assert row["be_criteria_met"] == single["be_criteria_met"]
+
+
+def test_model_frame_cached_until_params_change(simulated_crossover_data):
+    """Test that the model representation is reused and rebuilt when params_df is replaced"""
+    analyzer = Crossover2x2(
+        data=simulated_crossover_data,
+        subject_col="SubjectID",
+        seq_col="Sequence",
+        period_col="Period",
+        time_col="Time (hr)",
+        conc_col="Concentration (ng/mL)",
+        form_col="Formulation"
+    )
+    analyzer.calculate_point_estimates(["log_AUC", "log_Cmax"])
+    model = analyzer._model_frame(analyzer.params_df)
+    analyzer.run_anova("log_AUC")
+    analyzer.calculate_point_estimate("log_Cmax")
+    assert analyzer._model_frame(analyzer.params_df) is model
+    assert model.params is analyzer.params_df
+    
+    # Replacing the parameter table invalidates the cache
+    analyzer.params_df = analyzer.params_df.with_columns(pl.col("log_AUC") + np.log(1.1))
+    shifted = analyzer.calculate_point_estimates(["log_AUC"])
+    rebuilt = analyzer._model_frame(analyzer.params_df)
+    assert rebuilt is not model
+    assert rebuilt.params is analyzer.params_df
+    before = model.formulation_effects(["log_AUC"], ["SubjectID", "Period"], "Formulation")
+    assert np.isclose(shifted["point_estimate"][0], before["point_estimate"][0])
+    
+    # Lazy analyzers reuse the frame and model of each column set
+    lazy = Crossover2x2(
+        data=simulated_crossover_data, subject_col="SubjectID", seq_col="Sequence", period_col="Period",
+        time_col="Time (hr)", conc_col="Concentration (ng/mL)", form_col="Formulation", lazy=True,
+    )
+    lazy.calculate_point_estimate("log_AUC")
+    model = lazy._model_frame(lazy._params_for(["log_AUC"]))
+    lazy.run_anova("log_AUC")
+    lazy.calculate_point_estimate("log_Cmax")
+    assert lazy._model_frame(lazy._params_for(["log_AUC"])) is model
+    assert len(lazy._models) == 2
+
+
+def test_design_hooks_are_abstract():
+    """Test that a design class missing a PKDesignMixin hook fails at instantiation"""
+    from bioeq.design_base import PKDesignMixin
+    
+    class Incomplete(PKDesignMixin):
+        def _auc_rule(self):
+            return "linear"
+    
+    with pytest.raises(TypeError, match="_terminal_window"):
+        Incomplete()
+
+def test_bootstrap_point_estimate_reproducible(simulated_crossover_data):
+    """Test that sequence-stratified bootstrap replicates depend on the seed only"""
+    analyzer = Crossover2x2(
+        data=simulated_crossover_data,
+        subject_col="SubjectID",
+        seq_col="Sequence",
+        period_col="Period",
+        time_col="Time (hr)",
+        conc_col="Concentration (ng/mL)",
+        form_col="Formulation"
+    )
+    serial = analyzer.bootstrap_point_estimate("log_AUC", n_boot=2500, seed=2024)
+    pooled = analyzer.bootstrap_point_estimate("log_AUC", n_boot=2500, seed=2024, n_jobs=2)
+    other = analyzer.bootstrap_point_estimate("log_AUC", n_boot=2500, seed=2025)
+    
+    assert np.array_equal(serial["estimates"], pooled["estimates"])
+    assert not np.array_equal(serial["estimates"], other["estimates"])
+    exact = analyzer.calculate_point_estimate("log_AUC")
+    assert np.isclose(serial["point_estimate"], exact["point_estimate"])
+    # The bootstrap SE of a mean difference is close to the analytical one
+    analytical_se = (np.log(exact["upper_90ci"]) - np.log(exact["lower_90ci"])) / (2 * 1.70)
+    assert 0.7 < serial["standard_error"] / analytical_se < 1.3
+    
+    analyzer.params_df = analyzer.params_df.filter(pl.col("Formulation") == "Reference")
+    with pytest.raises(ValueError, match="Exactly 2 formulation levels"):
+        analyzer.bootstrap_point_estimate("log_AUC", n_boot=10)
+
+
+def test_influence_matches_refits(simulated_crossover_data):
+    """Test leave-one-subject-out downdates against refits without each subject"""
+    import statsmodels.formula.api as smf
+    
+    columns = dict(
+        subject_col="SubjectID",
+        seq_col="Sequence",
+        period_col="Period",
+        time_col="Time (hr)",
+        conc_col="Concentration (ng/mL)",
+        form_col="Formulation"
+    )
+    analyzer = Crossover2x2(data=simulated_crossover_data, **columns)
+    influence = analyzer.calculate_influence("log_AUC")
+    assert len(influence) == simulated_crossover_data["SubjectID"].n_unique()
+    
+    for row in influence.head(3).to_dicts():
+        reduced = Crossover2x2(
+            data=simulated_crossover_data.filter(pl.col("SubjectID") != row["SubjectID"]), **columns
+        )
+        refit = reduced.calculate_point_estimate("log_AUC")
+        assert np.isclose(row["point_estimate"], refit["point_estimate"])
+        assert np.isclose(row["lower_90ci"], refit["lower_90ci"])
+        assert np.isclose(row["upper_90ci"], refit["upper_90ci"])
+    
+    contrasts = analyzer._subject_contrasts("log_AUC").with_columns(
+        (pl.col("y_test") - pl.col("y_ref")).alias("diff")
+    ).to_pandas()
+    ols = smf.ols("diff ~ C(test_second)", data=contrasts).fit()
+    expected = ols.get_influence().resid_studentized_external
+    assert np.allclose(influence["studentized_residual"].to_numpy(), expected)
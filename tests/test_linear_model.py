@@ -0,0 +1,112 @@
+import pytest
+import polars as pl
+import numpy as np
+import statsmodels.formula.api as smf
+from bioeq import linear_model
+
+
+@pytest.fixture
+def crossover_params():
+    """Fixture to provide a 2x2 parameter table with two log metrics and missing values"""
+    rng = np.random.default_rng(11)
+    rows = []
+    for subject in range(1, 15):
+        sequence = "RT" if subject % 2 else "TR"
+        subject_effect = rng.normal(0, 0.3)
+        formulations = ["Reference", "Test"] if sequence == "RT" else ["Test", "Reference"]
+        for period, formulation in zip([1, 2], formulations):
+            shift = 0.05 if formulation == "Test" else 0.0
+            rows.append({
+                "SubjectID": subject,
+                "Period": period,
+                "Formulation": formulation,
+                "log_AUC": 5 + subject_effect + shift + rng.normal(0, 0.1),
+                "log_Cmax": 3 + subject_effect - shift + rng.normal(0, 0.15),
+            })
+    params = pl.DataFrame(rows)
+    # Drop one observation of log_Cmax to create a second missingness pattern
+    return params.with_columns(
+        pl.when((pl.col("SubjectID") == 3) & (pl.col("Period") == 2))
+        .then(None)
+        .otherwise(pl.col("log_Cmax"))
+        .alias("log_Cmax")
+    )
+
+
+def test_multi_response_fit_matches_lstsq(crossover_params):
+    """Test that one factorization solves every response column like a separate fit"""
+    factors = ["SubjectID", "Period", "Formulation"]
+    X, names = linear_model.ModelFrame(crossover_params, factors, "SubjectID").design(factors)
+    Y = crossover_params.select(["log_AUC"]).to_numpy()
+    Y = np.hstack([Y, 2 * Y + 1])
+    fit = linear_model.LinearModel(X, names).fit(Y)
+
+    expected, _, _, _ = np.linalg.lstsq(X, Y, rcond=None)
+    assert names[-1] == "C(Formulation)[T.Test]"
+    assert np.allclose(fit.coef, expected)
+    assert fit.df == len(crossover_params) - X.shape[1]
+
+
+def test_formulation_effects_handle_missingness(crossover_params):
+    """Test the batch table against statsmodels fits on each metric's own rows"""
+    model = linear_model.ModelFrame(crossover_params, ["SubjectID", "Period", "Formulation"], "SubjectID")
+    result = model.formulation_effects(["log_AUC", "log_Cmax"], ["SubjectID", "Period"], "Formulation")
+
+    for row in result.to_dicts():
+        df = crossover_params.drop_nulls(row["metric"]).to_pandas()
+        model = smf.ols(f"{row['metric']} ~ C(SubjectID) + C(Period) + C(Formulation)", data=df).fit()
+        term = "C(Formulation)[T.Test]"
+        lower, upper = model.conf_int(alpha=0.1).loc[term]
+        assert row["n"] == len(df)
+        assert np.isclose(row["estimate"], model.params[term])
+        assert np.isclose(row["se"], model.bse[term])
+        assert np.isclose(row["lower_90ci"], np.exp(lower) * 100)
+        assert np.isclose(row["upper_90ci"], np.exp(upper) * 100)
+
+
+def test_model_frame_design_matches_formula_coding(crossover_params):
+    """Test that cached designs of row subsets match the statsmodels coding of the subset"""
+    factors = ["SubjectID", "Period", "Formulation"]
+    model = linear_model.ModelFrame(crossover_params, factors, "SubjectID")
+    rows = (crossover_params["SubjectID"] > 4).to_numpy()
+
+    X, names = model.design(factors, rows)
+    subset = crossover_params.filter(pl.Series(rows)).to_pandas()
+    expected = smf.ols("log_AUC ~ C(SubjectID) + C(Period) + C(Formulation)", data=subset)
+    assert names == expected.exog_names
+    assert np.array_equal(X, expected.exog)
+    assert model.design(factors, rows)[0] is X
+    assert model.least_squares(factors) is model.least_squares(factors)
+
+
+def test_formulation_effects_require_a_formulation_contrast(crossover_params):
+    """Test that a metric observed for one formulation only raises instead of reporting another coefficient"""
+    params = crossover_params.with_columns(
+        pl.when(pl.col("Formulation") == "Reference").then(pl.col("log_AUC")).alias("log_ref_only")
+    )
+    model = linear_model.ModelFrame(params, ["SubjectID", "Period", "Formulation"], "SubjectID")
+    with pytest.raises(ValueError, match=r"C\(Formulation\)\[T.Test\]"):
+        model.formulation_effects(["log_AUC", "log_ref_only"], [], "Formulation")
+    
+    result = model.formulation_effects(["log_AUC"], [], "Formulation")
+    df = params.to_pandas()
+    expected = smf.ols("log_AUC ~ C(Formulation)", data=df).fit().params["C(Formulation)[T.Test]"]
+    assert np.isclose(result["estimate"][0], expected)
+
+
+def test_mixed_model_matches_formula(crossover_params):
+    """Test that the mixed model on the cached design matches the statsmodels formula fit"""
+    factors = ["SubjectID", "Period", "Formulation"]
+    model = linear_model.ModelFrame(crossover_params, factors, "SubjectID")
+    fit = model.mixed_model("log_Cmax", ["Formulation", "Period"]).fit()
+    
+    df = crossover_params.drop_nulls("log_Cmax").to_pandas()
+    expected = smf.mixedlm("log_Cmax ~ C(Formulation) + C(Period)", data=df, groups=df["SubjectID"]).fit()
+    assert list(fit.params.index) == list(expected.params.index)
+    assert np.allclose(fit.params, expected.params, atol=1e-6)
+    assert np.allclose(fit.bse, expected.bse, atol=1e-6)
+    assert np.array_equal(
+        crossover_params["SubjectID"].to_numpy()[model.observed("log_Cmax")],
+        model.levels["SubjectID"][model.subject_index[model.observed("log_Cmax")]],
+    )
+    assert "pandas" not in model.__dict__
@@ -0,0 +1,182 @@
+import pytest
+import polars as pl
+import numpy as np
+from bioeq import nca
+
+
+@pytest.fixture
+def ragged_profiles():
+    """Fixture to provide profiles of different lengths in shuffled row order"""
+    rng = np.random.default_rng(0)
+    rows = []
+    for subject in range(1, 7):
+        times = np.sort(rng.choice([0, 0.5, 1, 2, 4, 6, 8, 12, 24], size=3 + subject, replace=False))
+        concs = 10 * (np.exp(-0.15 * times) - np.exp(-1.2 * times)) * rng.lognormal(0, 0.1, len(times))
+        for t, c in zip(times, concs):
+            rows.append({"SubjectID": subject, "Time (hr)": t, "Concentration (ng/mL)": c})
+    return pl.DataFrame(rows).sample(fraction=1.0, shuffle=True, seed=1)
+
+
+def _profiles(data):
+    return nca.ProfileSet.from_frame(data, ["SubjectID"], "Time (hr)", "Concentration (ng/mL)")
+
+
+def _per_subject(data):
+    for subject in sorted(data["SubjectID"].unique().to_list()):
+        profile = data.filter(pl.col("SubjectID") == subject).sort("Time (hr)")
+        yield profile["Time (hr)"].to_numpy(), profile["Concentration (ng/mL)"].to_numpy()
+
+
+def test_profile_set_layout(ragged_profiles):
+    """Test that profiles are packed contiguously and sorted by time"""
+    profiles = _profiles(ragged_profiles)
+
+    assert profiles.n_profiles == 6
+    assert profiles.keys["SubjectID"].to_list() == [1, 2, 3, 4, 5, 6]
+    assert profiles.offsets[0] == 0 and profiles.offsets[-1] == len(ragged_profiles)
+    assert np.array_equal(profiles.sizes, np.arange(4, 10))
+    for i in range(profiles.n_profiles):
+        segment = profiles.times[profiles.offsets[i]:profiles.offsets[i + 1]]
+        assert np.all(np.diff(segment) > 0)
+
+
+def test_kernels_match_per_profile_reference(ragged_profiles):
+    """Test AUC, Cmax, Tmax and terminal slope against per-profile NumPy calculations"""
+    profiles = _profiles(ragged_profiles)
+    auc = nca.auc(profiles, "linear")
+    cmax = nca.cmax(profiles)
+    tmax = nca.tmax(profiles, cmax)
+    slope = nca.loglinear_fit(profiles, nca.terminal_window(profiles, n_points=3)).slope
+
+    for i, (times, concs) in enumerate(_per_subject(ragged_profiles)):
+        assert np.isclose(auc[i], np.trapezoid(concs, times), rtol=1e-12)
+        assert cmax[i] == concs.max()
+        assert tmax[i] == times[np.argmax(concs)]
+        expected_slope = np.polyfit(times[-3:], np.log(concs[-3:]), 1)[0]
+        assert np.isclose(slope[i], expected_slope, rtol=1e-8)
+
+
+def test_terminal_window_respects_eligibility():
+    """Test that the window keeps the last eligible points and C_last skips zeros"""
+    profiles = nca.ProfileSet(
+        times=np.array([0, 1, 2, 4, 8, 0, 1, 2]),
+        concs=np.array([0, 5, 3, 2, 0, 0, 4, 0]),
+        offsets=np.array([0, 5, 8]),
+    )
+    window = nca.terminal_window(profiles, n_points=3, eligible=profiles.concs > 0)
+
+    assert window.tolist() == [False, True, True, True, False, False, True, False]
+    assert np.array_equal(nca.clast(profiles), [2.0, 4.0])
+    assert np.array_equal(nca.clast(profiles, positive_only=False), [0.0, 0.0])
+    # A single point cannot define a slope
+    assert np.isnan(nca.loglinear_fit(profiles, window).slope[1])
+
+
+def _best_fit_reference(times, concs, min_points=3, tolerance=1e-4):
+    """Per-profile best-fit lambda_z by fitting every terminal window separately"""
+    after_tmax = (times > times[np.argmax(concs)]) & (concs > 0)
+    t, y = times[after_tmax], np.log(concs[after_tmax])
+    fits = []
+    for k in range(min_points, len(t) + 1):
+        slope, intercept = np.polyfit(t[-k:], y[-k:], 1)
+        residual = y[-k:] - (slope * t[-k:] + intercept)
+        r2 = 1 - np.sum(residual ** 2) / np.sum((y[-k:] - y[-k:].mean()) ** 2)
+        if slope < 0:
+            fits.append((1 - (1 - r2) * (k - 1) / (k - 2), k, slope))
+    if not fits:
+        return None
+    best = max(score for score, _, _ in fits)
+    return max((k, score, slope) for score, k, slope in fits if score >= best - tolerance)
+
+
+def test_best_fit_window_matches_exhaustive_search():
+    """Test that the prefix-sum window selection agrees with fitting every window"""
+    rng = np.random.default_rng(3)
+    times = np.array([0, 0.5, 1, 2, 3, 4, 6, 8, 12, 16, 24])
+    rows = []
+    for subject in range(40):
+        # Two-phase disposition so the best window is not always the longest one
+        concs = (20 * np.exp(-0.9 * times) + 5 * np.exp(-0.08 * times) - 25 * np.exp(-2.5 * times))
+        concs = concs * rng.lognormal(0, 0.08, len(times))
+        for t, c in zip(times, concs):
+            rows.append({"SubjectID": subject, "Time (hr)": t, "Concentration (ng/mL)": c})
+    data = pl.DataFrame(rows)
+    profiles = _profiles(data)
+
+    tmax = nca.tmax(profiles)
+    eligible = (profiles.concs > 0) & (profiles.times > tmax[profiles.segment_ids])
+    fit = nca.loglinear_fit(profiles, nca.best_fit_window(profiles, eligible))
+
+    for i, (t, c) in enumerate(_per_subject(data)):
+        n_points, adj_r2, slope = _best_fit_reference(t, c)
+        assert fit.n_points[i] == n_points
+        assert fit.end[i] == t[-1] and fit.start[i] == t[-n_points]
+        assert np.isclose(fit.adj_r2[i], adj_r2, rtol=1e-9)
+        assert np.isclose(fit.lambda_z[i], -slope, rtol=1e-9)
+
+
+def test_linear_up_log_down_auc(ragged_profiles):
+    """Test linear-up/log-down AUC against a per-interval reference"""
+    profiles = _profiles(ragged_profiles)
+    auc = nca.auc(profiles, "linear_up_log_down")
+
+    for i, (times, concs) in enumerate(_per_subject(ragged_profiles)):
+        expected = 0.0
+        for t1, t2, c1, c2 in zip(times[:-1], times[1:], concs[:-1], concs[1:]):
+            if c2 < c1 and c2 > 0:
+                expected += (t2 - t1) * (c1 - c2) / np.log(c1 / c2)
+            else:
+                expected += (t2 - t1) * (c1 + c2) / 2
+        assert np.isclose(auc[i], expected, rtol=1e-12)
+    # The log rule never exceeds the linear rule on declining segments
+    assert np.all(auc <= nca.auc(profiles, "linear"))
+
+    with pytest.raises(ValueError, match="auc_method"):
+        nca.auc(profiles, "log")
+
+
+@pytest.mark.parametrize("method", nca.AUC_METHODS)
+def test_partial_auc_matches_resampled_profiles(ragged_profiles, method):
+    """Test partial AUCs against AUCs of profiles truncated at interpolated window edges"""
+    profiles = _profiles(ragged_profiles)
+    windows = np.array([[0, 2], [0.75, 5], [1, 1.5], [3, 30]])
+    result = nca.partial_auc(profiles, windows, method)
+
+    assert result.shape == (profiles.n_profiles, len(windows))
+    for i, (times, concs) in enumerate(_per_subject(ragged_profiles)):
+        for k, (t1, t2) in enumerate(windows):
+            if t1 < times[0] or t2 > times[-1]:
+                assert np.isnan(result[i, k])
+                continue
+            # Insert the window edges as samples with interpolated concentrations
+            inside = (times > t1) & (times < t2)
+            edges = []
+            for edge in (t1, t2):
+                j = np.searchsorted(times, edge, side="right") - 1
+                j_next = min(j + 1, len(times) - 1)
+                c1, c2 = concs[j], concs[j_next]
+                frac = (edge - times[j]) / (times[j_next] - times[j]) if j_next > j else 0.0
+                if method == "linear_up_log_down" and 0 < c2 < c1:
+                    edges.append(c1 * (c2 / c1) ** frac)
+                else:
+                    edges.append(c1 + (c2 - c1) * frac)
+            sub = nca.ProfileSet(
+                times=np.concatenate([[t1], times[inside], [t2]]),
+                concs=np.concatenate([[edges[0]], concs[inside], [edges[1]]]),
+                offsets=np.array([0, inside.sum() + 2]),
+            )
+            assert np.isclose(result[i, k], nca.auc(sub, method)[0], rtol=1e-10)
+
+    # The full sampled range reproduces AUC_last
+    full = nca.auc_to(profiles, profiles.times[profiles.offsets[1:] - 1][:, None], method)
+    assert np.allclose(full[:, 0], nca.auc(profiles, method), rtol=1e-12)
+
+
+def test_partial_auc_profile_specific_windows(ragged_profiles):
+    """Test that per-profile windows give the same results as shared windows"""
+    profiles = _profiles(ragged_profiles)
+    windows = np.array([[0, 2], [1, 4]])
+    shared = nca.partial_auc(profiles, windows)
+    per_profile = nca.partial_auc(profiles, np.tile(windows, (profiles.n_profiles, 1, 1)))
+
+    assert np.array_equal(shared, per_profile, equal_nan=True)
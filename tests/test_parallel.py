@@ -230,4 +230,95 @@ def test_summarize_pk_parameters(simulated_parallel_data):
     ref_summary_n = auc_summary.filter(pl.col("Formulation") == "Reference")["N"].item() if "Reference" in auc_summary["Formulation"] else 0
     
     assert test_summary_n == test_count
-    assert ref_summary_n == ref_count 
\ No newline at end of file
+    assert ref_summary_n == ref_count 
+
+def test_lazyframe_input(simulated_parallel_data):
+    """Test that a LazyFrame input gives the same parameters as the eager frame"""
+    kwargs = dict(
+        subject_col="SubjectID",
+        time_col="Time (hr)",
+        conc_col="Concentration (ng/mL)",
+        form_col="Formulation"
+    )
+    eager = ParallelDesign(data=simulated_parallel_data, **kwargs)
+    lazy_input = ParallelDesign(data=simulated_parallel_data.lazy(), **kwargs)
+    
+    assert lazy_input.params_df.equals(eager.params_df)
+
+
+def test_linear_up_log_down_auc_method(simulated_parallel_data):
+    """Test that the log-down rule lowers AUC and flows into AUC_inf"""
+    kwargs = dict(
+        subject_col="SubjectID",
+        time_col="Time (hr)",
+        conc_col="Concentration (ng/mL)",
+        form_col="Formulation"
+    )
+    linear = ParallelDesign(data=simulated_parallel_data, **kwargs).params_df
+    log_down = ParallelDesign(
+        data=simulated_parallel_data, auc_method="linear_up_log_down", **kwargs
+    ).params_df
+    
+    assert (log_down["AUC"] <= linear["AUC"]).all()
+    assert (log_down["AUC"] < linear["AUC"]).any()
+    assert log_down["Cmax"].equals(linear["Cmax"])
+    assert np.allclose(
+        (log_down["AUC_inf"] - log_down["AUC"]).drop_nulls().to_numpy(),
+        (linear["AUC_inf"] - linear["AUC"]).drop_nulls().to_numpy(),
+    )
+    
+    with pytest.raises(ValueError, match="auc_method"):
+        ParallelDesign(data=simulated_parallel_data, auc_method="log", **kwargs)
+
+
+def test_batch_point_estimates_match_single_metric(simulated_parallel_data):
+    """Test that the batch analysis reproduces the single-metric and statsmodels OLS estimates"""
+    import statsmodels.formula.api as smf
+    
+    analyzer = ParallelDesign(
+        data=simulated_parallel_data,
+        subject_col="SubjectID",
+        time_col="Time (hr)",
+        conc_col="Concentration (ng/mL)",
+        form_col="Formulation"
+    )
+    batch = analyzer.calculate_point_estimates(["log_AUC", "log_Cmax"])
+    
+    for row in batch.to_dicts():
+        single = analyzer.calculate_point_estimate(row["metric"])
+        assert np.isclose(row["point_estimate"], single["point_estimate"])
+        assert np.isclose(row["lower_90ci"], single["lower_90ci"])
+        assert np.isclose(row["upper_90ci"], single["upper_90ci"])
+        df = analyzer.params_df.drop_nulls(row["metric"]).to_pandas()
+        model = smf.ols(f"{row['metric']} ~ C(Formulation)", data=df).fit()
+        lower, upper = model.conf_int(alpha=0.1).loc["C(Formulation)[T.Test]"]
+        assert np.isclose(row["lower_90ci"], np.exp(lower) * 100)
+        assert np.isclose(row["upper_90ci"], np.exp(upper) * 100)
+
+
+def test_bootstrap_point_estimate(simulated_parallel_data):
+    """Test the arm-stratified bootstrap against the point estimate and a direct resampling loop"""
+    from bioeq import bootstrap
+    
+    analyzer = ParallelDesign(
+        data=simulated_parallel_data,
+        subject_col="SubjectID",
+        time_col="Time (hr)",
+        conc_col="Concentration (ng/mL)",
+        form_col="Formulation"
+    )
+    results = analyzer.bootstrap_point_estimate("log_Cmax", n_boot=1500, seed=7)
+    single = analyzer.calculate_point_estimate("log_Cmax")
+    assert np.isclose(results["point_estimate"], single["point_estimate"])
+    assert len(results["estimates"]) == 1500
+    assert results["lower_ci"] < results["point_estimate"] < results["upper_ci"]
+    
+    # The first block replays the first spawned stream: Test arm, then Reference arm
+    params = analyzer.params_df
+    test = params.filter(pl.col("Formulation") == "Test")["log_Cmax"].to_numpy()
+    reference = params.filter(pl.col("Formulation") == "Reference")["log_Cmax"].to_numpy()
+    rng = np.random.default_rng(np.random.SeedSequence(7).spawn(2)[0])
+    test_idx = rng.integers(0, len(test), size=(bootstrap.BLOCK_SIZE, len(test)))
+    ref_idx = rng.integers(0, len(reference), size=(bootstrap.BLOCK_SIZE, len(reference)))
+    expected = test[test_idx].mean(axis=1) - reference[ref_idx].mean(axis=1)
+    assert np.allclose(results["estimates"][:bootstrap.BLOCK_SIZE], expected)
@@ -0,0 +1,60 @@
+import pytest
+import numpy as np
+from scipy import integrate, stats
+from bioeq import power
+
+
+def test_power_matches_reference_values():
+    """Test exact TOST power against published reference values (PowerTOST, exact method)"""
+    assert np.isclose(power.power_tost(0.3, 0.95, 40), 0.8158453, atol=1e-6)
+    assert np.isclose(power.power_tost(0.2, 0.95, 20), 0.8346802, atol=1e-6)
+
+
+@pytest.mark.parametrize("df, t, delta, b", [(2, 1.5, 0.5, 3.0), (38, 1.69, 4.0, 100.0), (3, -2.0, 1.0, 0.5)])
+def test_owens_q_matches_adaptive_quadrature(df, t, delta, b):
+    """Test the fixed-node Owen's Q against adaptive quadrature of its definition"""
+    expected = integrate.quad(
+        lambda x: stats.norm.cdf(t * x / np.sqrt(df) - delta) * stats.chi.pdf(x, df), 0, b, epsabs=1e-13
+    )[0]
+    assert np.isclose(power.owens_q(df, t, delta, b), expected, rtol=1e-9, atol=1e-14)
+
+
+def test_power_grid_broadcasts():
+    """Test that CV x GMR x n grids match element-wise evaluation"""
+    cv = np.array([0.15, 0.3])[:, None, None]
+    gmr = np.array([0.9, 1.0, 1.1])[None, :, None]
+    n = np.array([12, 24, 48])[None, None, :]
+    grid = power.power_tost(cv, gmr, n, design="2x2x4")
+    assert grid.shape == (2, 3, 3)
+    assert np.isclose(grid[1, 2, 0], power.power_tost(0.3, 1.1, 12, design="2x2x4"))
+    # Power increases with n and decreases with CV
+    assert np.all(np.diff(grid, axis=2) > 0)
+    assert np.all(grid[1] < grid[0])
+
+
+@pytest.mark.parametrize("design, expected", [("2x2", 40), ("2x2x4", 20), ("2x3x3", 30)])
+def test_sample_size_reference_values(design, expected):
+    """Test sample sizes for CV 30%, GMR 0.95 and 80% power against reference values"""
+    assert power.sample_size_tost(0.3, 0.95, design=design) == expected
+
+
+@pytest.mark.parametrize("design", list(power.DESIGNS))
+def test_sample_size_is_smallest_reaching_target(design):
+    """Test that the searched size reaches the target and one sequence-step less does not"""
+    rng = np.random.default_rng(5)
+    cv = rng.uniform(0.1, 0.5, 200)
+    gmr = rng.uniform(0.85, 1.15, 200)
+    n = power.sample_size_tost(cv, gmr, target_power=0.9, design=design)
+    step = power.DESIGNS[design][3]
+    assert np.all(n % step == 0)
+    assert np.all(power.power_tost(cv, gmr, n, design=design) >= 0.9)
+    smaller = power.power_tost(cv, gmr, n - step, design=design)
+    assert np.all((smaller < 0.9) | (n - step < 2 * step))
+
+
+def test_sample_size_unreachable_and_invalid_design():
+    """Test NaN for scenarios that cannot reach the target and errors for unknown designs"""
+    n = power.sample_size_tost(np.array([0.2, 0.2]), np.array([0.95, 1.3]))
+    assert n[0] == 20 and np.isnan(n[1])
+    with pytest.raises(ValueError):
+        power.power_tost(0.3, design="3x3")
@@ -2,6 +2,7 @@ import pytest
 import polars as pl
 import numpy as np
 from pathlib import Path
+from scipy import stats
 from bioeq.replicate_crossover import ReplicateCrossover
 
 
@@ -308,6 +309,51 @@ def test_within_subject_cv_calculation(full_replicate_data):
     assert 10 <= cv_results["within_subject_cv"] <= 20, f"Expected CV ~15%, got {cv_results['within_subject_cv']}%"
 
 
+
+@pytest.mark.parametrize("design_type", ["partial", "full"])
+def test_within_subject_cv_multiple_parameters(partial_replicate_data, full_replicate_data, design_type):
+    """Test the multi-parameter CVwR/CVwT table against per-subject variances"""
+    from scipy import stats
+    
+    data = partial_replicate_data if design_type == "partial" else full_replicate_data
+    analyzer = ReplicateCrossover(
+        data=data,
+        design_type=design_type,
+        subject_col="SubjectID",
+        seq_col="Sequence",
+        period_col="Period",
+        time_col="Time (hr)",
+        conc_col="Concentration (ng/mL)",
+        form_col="Formulation"
+    )
+    parameters = ["log_AUC", "log_Cmax", "log_AUC_inf"]
+    table = analyzer.calculate_within_subject_cv(parameters)
+    assert table["parameter"].to_list() == parameters
+    
+    for parameter, row in zip(parameters, table.iter_rows(named=True)):
+        for form, suffix in [("Reference", "wr"), ("Test", "wt")]:
+            variances = (
+                analyzer.params_df.filter(pl.col("Formulation") == form)
+                .group_by("SubjectID")
+                .agg(pl.col(parameter).var())[parameter]
+                .drop_nulls()
+            )
+            if len(variances) == 0:
+                # Test is not replicated in the partial design
+                assert row[f"df_{suffix}"] == 0 and np.isnan(row[f"cv_{suffix}"])
+                continue
+            df = len(variances)
+            s2 = variances.mean()
+            assert row[f"df_{suffix}"] == df
+            assert np.isclose(row[f"s2_{suffix}"], s2)
+            assert np.isclose(row[f"cv_{suffix}"], np.sqrt(np.exp(s2) - 1) * 100)
+            upper = df * s2 / stats.chi2.ppf(0.025, df)
+            assert np.isclose(row[f"cv_{suffix}_upper"], np.sqrt(np.exp(upper) - 1) * 100)
+            assert row[f"cv_{suffix}_lower"] < row[f"cv_{suffix}"] < row[f"cv_{suffix}_upper"]
+        
+        single = analyzer.calculate_within_subject_cv(parameter)
+        assert np.isclose(single["within_subject_cv"], row["cv_wr"])
+
 def test_rsabe_execution(full_replicate_data):
     """Test that reference-scaled average bioequivalence analysis runs without errors"""
     analyzer = ReplicateCrossover(
@@ -374,4 +420,195 @@ def test_summarize_pk_parameters(partial_replicate_data):
     
     # Check that AUC and Cmax are summarized
     assert "AUC" in summary["Parameter"].unique()
-    assert "Cmax" in summary["Parameter"].unique() 
\ No newline at end of file
+    assert "Cmax" in summary["Parameter"].unique() 
+
+def test_nca_stages_computed_once(partial_replicate_data, monkeypatch):
+    """Test that AUC and half-life are computed once per instance and reused for AUC_inf"""
+    calls = {"auc": 0, "half_life": 0}
+    original_auc = ReplicateCrossover._calculate_auc
+    original_half_life = ReplicateCrossover._estimate_half_life
+    
+    def count_auc(self):
+        calls["auc"] += 1
+        return original_auc(self)
+    
+    def count_half_life(self):
+        calls["half_life"] += 1
+        return original_half_life(self)
+    
+    monkeypatch.setattr(ReplicateCrossover, "_calculate_auc", count_auc)
+    monkeypatch.setattr(ReplicateCrossover, "_estimate_half_life", count_half_life)
+    
+    analyzer = ReplicateCrossover(
+        data=partial_replicate_data,
+        design_type="partial",
+        subject_col="SubjectID",
+        seq_col="Sequence",
+        period_col="Period",
+        time_col="Time (hr)",
+        conc_col="Concentration (ng/mL)",
+        form_col="Formulation"
+    )
+    analyzer.half_life_df
+    analyzer.get_params_df(["AUC_inf", "log_AUC"])
+    
+    assert calls == {"auc": 1, "half_life": 1}
+    
+    # AUC_last reuses the AUC from the profile pass
+    with_inf = analyzer.params_df.filter(pl.col("AUC_inf").is_not_null())
+    assert np.allclose(with_inf["AUC_last"].to_numpy(), with_inf["AUC"].to_numpy())
+
+
+def test_lazy_mode_computes_requested_columns_only(full_replicate_data):
+    """Test that lazy mode defers PK parameters until they are requested"""
+    kwargs = dict(
+        design_type="full",
+        subject_col="SubjectID",
+        seq_col="Sequence",
+        period_col="Period",
+        time_col="Time (hr)",
+        conc_col="Concentration (ng/mL)",
+        form_col="Formulation"
+    )
+    eager = ReplicateCrossover(data=full_replicate_data, **kwargs)
+    lazy = ReplicateCrossover(data=full_replicate_data, lazy=True, **kwargs)
+    
+    subset = lazy.get_params_df(["log_Cmax"])
+    assert subset.columns == ["SubjectID", "Period", "Sequence", "Formulation", "log_Cmax"]
+    assert lazy._parameters.is_computed("Cmax")
+    assert not lazy._parameters.is_computed("t_half")
+    assert not lazy._parameters.is_computed("AUC")
+    
+    cv = lazy.calculate_within_subject_cv("log_Cmax")
+    assert np.isclose(cv["cv_percent"], eager.calculate_within_subject_cv("log_Cmax")["cv_percent"])
+    
+    assert lazy.params_df.equals(eager.params_df)
+    
+    # LazyFrame sources stay lazy; rows are filtered in the scan
+    scanned = ReplicateCrossover(
+        data=full_replicate_data.lazy(), filters=pl.col("SubjectID") <= 6, **kwargs
+    )
+    assert isinstance(scanned.data, pl.LazyFrame)
+    assert scanned.params_df.equals(eager.params_df.filter(pl.col("SubjectID") <= 6))
+
+
+@pytest.mark.parametrize("design_type", ["partial", "full"])
+def test_native_rsabe_matches_contrast_regressions(partial_replicate_data, full_replicate_data, design_type):
+    """Test the closed-form RSABE components against OLS fits of the FDA contrasts"""
+    import statsmodels.formula.api as smf
+    from bioeq import reference_scaled
+    
+    data = partial_replicate_data if design_type == "partial" else full_replicate_data
+    analyzer = ReplicateCrossover(
+        data=data,
+        design_type=design_type,
+        subject_col="SubjectID",
+        seq_col="Sequence",
+        period_col="Period",
+        time_col="Time (hr)",
+        conc_col="Concentration (ng/mL)",
+        form_col="Formulation"
+    )
+    results = analyzer.run_rsabe("log_AUC")
+    contrasts = analyzer._intra_subject_contrasts("log_AUC").to_pandas()
+    
+    # I ~ sequence with sum coding: the intercept is the mean of the sequence means
+    i_model = smf.ols("I ~ C(Sequence, Sum)", data=contrasts).fit()
+    d_model = smf.ols("D ~ C(Sequence)", data=contrasts.dropna(subset=["D"])).fit()
+    
+    assert np.isclose(results["test_ref_diff"], i_model.params["Intercept"])
+    assert np.isclose(results["within_subject_variance"], d_model.mse_resid / 2)
+    
+    # Howe's bound is above the criterion and follows from the component bounds
+    estimate, se, df = i_model.params["Intercept"], i_model.bse["Intercept"], i_model.df_resid
+    s2wr, df_wr = d_model.mse_resid / 2, d_model.df_resid
+    theta = reference_scaled.FDA_THETA
+    point_bound = (abs(estimate) + stats.t.ppf(0.95, df) * se) ** 2
+    scale_bound = -theta * s2wr * df_wr / stats.chi2.ppf(0.95, df_wr)
+    expected = estimate ** 2 - theta * s2wr + np.sqrt(
+        (point_bound - estimate ** 2) ** 2 + (scale_bound + theta * s2wr) ** 2
+    )
+    assert np.isclose(results["rsabe_upper_bound"], expected)
+    assert results["rsabe_upper_bound"] > results["rsabe_criterion"]
+    assert results["rsabe_criterion_met"] == (results["rsabe_upper_bound"] <= 0)
+    
+    # The overall conclusion follows the scaled branch only when sWR reaches the cutoff
+    if np.sqrt(results["within_subject_variance"]) >= reference_scaled.FDA_SWR_CUTOFF:
+        expected_be = results["rsabe_criterion_met"] and 80 <= results["point_estimate"] <= 125
+    else:
+        ci = np.exp(i_model.conf_int(alpha=0.1).loc["Intercept"]) * 100
+        expected_be = 80 <= ci.iloc[0] and ci.iloc[1] <= 125
+    assert results["be_conclusion"] == expected_be
+    
+    # The mixed model remains available
+    assert "model_summary" in analyzer.run_rsabe("log_AUC", engine="statsmodels")
+
+
+def test_abel_matches_ema_method_a(full_replicate_data):
+    """Test ABEL against the EMA method A fixed-effects ANOVA fitted with statsmodels"""
+    import statsmodels.formula.api as smf
+    from bioeq import reference_scaled
+    
+    analyzer = ReplicateCrossover(
+        data=full_replicate_data,
+        design_type="full",
+        subject_col="SubjectID",
+        seq_col="Sequence",
+        period_col="Period",
+        time_col="Time (hr)",
+        conc_col="Concentration (ng/mL)",
+        form_col="Formulation"
+    )
+    results = analyzer.run_abel("log_Cmax")
+    df = analyzer.params_df.to_pandas()
+    
+    model = smf.ols(
+        "log_Cmax ~ C(Sequence) + C(SubjectID) + C(Period) + C(Formulation)", data=df
+    ).fit()
+    lower, upper = model.conf_int(alpha=0.1).loc["C(Formulation)[T.Test]"]
+    reference = smf.ols(
+        "log_Cmax ~ C(SubjectID) + C(Period)", data=df[df["Formulation"] == "Reference"]
+    ).fit()
+    
+    assert np.isclose(results["point_estimate"], np.exp(model.params["C(Formulation)[T.Test]"]) * 100)
+    assert np.isclose(results["lower_90ci"], np.exp(lower) * 100)
+    assert np.isclose(results["upper_90ci"], np.exp(upper) * 100)
+    assert np.isclose(results["within_subject_variance"], reference.mse_resid)
+    assert results["df_wr"] == reference.df_resid
+    assert results["reference_scaled_method"] == "ABEL"
+    
+    # Limits: unscaled up to 30%, widened above, capped at CVwR = 50%
+    limits = reference_scaled.abel_limits(np.array([25.0, 40.0, 50.0, 80.0]))
+    assert np.allclose(limits["lower"][[0, 2, 3]], [80.0, 69.84, 69.84], atol=0.005)
+    assert np.allclose(limits["upper"][[0, 2, 3]], [125.0, 143.19, 143.19], atol=0.005)
+    assert 69.84 < limits["lower"][1] < 80 and 125 < limits["upper"][1] < 143.19
+
+
+def test_influence_matches_refits(partial_replicate_data):
+    """Test leave-one-subject-out downdates against the FDA contrasts without each subject"""
+    from bioeq import reference_scaled
+    
+    analyzer = ReplicateCrossover(
+        data=partial_replicate_data,
+        design_type="partial",
+        subject_col="SubjectID",
+        seq_col="Sequence",
+        period_col="Period",
+        time_col="Time (hr)",
+        conc_col="Concentration (ng/mL)",
+        form_col="Formulation"
+    )
+    influence = analyzer.calculate_influence("log_Cmax")
+    contrasts = analyzer._intra_subject_contrasts("log_Cmax")
+    assert influence["SubjectID"].to_list() == contrasts["SubjectID"].to_list()
+    
+    for k, row in enumerate(influence.to_dicts()):
+        kept = np.arange(len(contrasts)) != k
+        sequences = contrasts["Sequence"].to_numpy()[kept]
+        refit = reference_scaled.rsabe_fda(
+            contrasts["I"].to_numpy()[kept], contrasts["D"].to_numpy()[kept], sequences
+        )
+        assert np.isclose(row["point_estimate"], np.exp(refit["estimate"]) * 100)
+        assert np.isclose(row["lower_90ci"], np.exp(refit["lower"]) * 100)
+        assert np.isclose(row["upper_90ci"], np.exp(refit["upper"]) * 100)
+        assert np.isclose(row["within_subject_cv"], reference_scaled.cv_from_variance(refit["s2wr"]))
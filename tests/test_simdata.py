@@ -0,0 +1,127 @@
+import numpy as np
+import pytest
+import polars as pl
+from simdata.simulation_data_generator import (
+    generate_crossover_data,
+    generate_full_replicate_data,
+    generate_parallel_data,
+    generate_partial_replicate_data,
+    iter_chunks,
+    spawn_seeds,
+    write_parquet_dataset,
+)
+
+
+def test_generate_crossover_data_layout():
+    """Test the subjects x periods x times layout and treatment assignment of the 2x2 generator"""
+    data = generate_crossover_data(n_subjects=6, time_points=[0, 1, 4, 12], seed=1)
+    assert data.columns == [
+        "SubjectID", "Period", "Sequence", "Formulation", "Time (hr)", "Concentration (ng/mL)"
+    ]
+    assert data.shape == (6 * 2 * 4, 6)
+    assert data["SubjectID"].to_list()[:8] == [1] * 8
+    
+    assignment = data.unique(["SubjectID", "Period"]).sort(["SubjectID", "Period"])
+    expected = {("TR", 1): "Reference", ("TR", 2): "Test", ("RT", 1): "Test", ("RT", 2): "Reference"}
+    for row in assignment.iter_rows(named=True):
+        assert row["Sequence"] == ("TR" if row["SubjectID"] % 2 == 1 else "RT")
+        assert row["Formulation"] == expected[(row["Sequence"], row["Period"])]
+    
+    assert (data.filter(pl.col("Time (hr)") == 0)["Concentration (ng/mL)"] == 0).all()
+    assert (data["Concentration (ng/mL)"] >= 0).all()
+    assert data.equals(generate_crossover_data(n_subjects=6, time_points=[0, 1, 4, 12], seed=1))
+    assert not np.allclose(
+        data["Concentration (ng/mL)"].to_numpy(),
+        generate_crossover_data(n_subjects=6, time_points=[0, 1, 4, 12], seed=2)["Concentration (ng/mL)"].to_numpy(),
+    )
+
+
+
+
+def test_generate_parallel_data_layout_leaves_global_state():
+    """Test the arm assignment of the parallel generator and that it does not reseed np.random"""
+    np.random.seed(0)
+    expected = np.random.rand()
+    np.random.seed(0)
+    data = generate_parallel_data(n_subjects_per_arm=3, time_points=[0, 1, 4], seed=1)
+    assert np.random.rand() == expected
+    
+    assert data.shape == (6 * 3, 4)
+    arms = data.unique(["SubjectID", "Formulation"]).sort("SubjectID")["Formulation"].to_list()
+    assert arms == ["Reference"] * 3 + ["Test"] * 3
+    assert (data.filter(pl.col("Time (hr)") == 0)["Concentration (ng/mL)"] == 0).all()
+    assert data.equals(generate_parallel_data(n_subjects_per_arm=3, time_points=[0, 1, 4], seed=1))
+
+def test_replicate_generators_recover_formulation_specific_variability():
+    """Test that separate Test and Reference within-subject SDs are reflected in Cmax"""
+    data = generate_full_replicate_data(
+        n_subjects=4000, time_points=[0, 2], intra_subject_cv_test=0.1, intra_subject_cv_reference=0.5
+    )
+    assert data["Sequence"].unique().sort().to_list() == ["RTRT", "TRTR"]
+    
+    # At a single post-dose time point, log concentration differences between the two
+    # administrations of a formulation have variance 2·(s_w² + residual²)
+    log_conc = data.filter(pl.col("Time (hr)") == 2).with_columns(
+        pl.col("Concentration (ng/mL)").log().alias("y")
+    )
+    for formulation, sd in [("Test", 0.1), ("Reference", 0.5)]:
+        replicates = (
+            log_conc.filter(pl.col("Formulation") == formulation)
+            .sort(["SubjectID", "Period"])
+            .group_by("SubjectID", maintain_order=True)
+            .agg((pl.col("y").first() - pl.col("y").last()).alias("d"))
+        )
+        # The period effect difference is constant and drops out of the variance
+        variance = replicates["d"].var() / 2
+        assert np.isclose(variance, sd ** 2 + 0.1 ** 2, rtol=0.1)
+
+
+def test_replicate_generators_seeding():
+    """Test reproducibility for a seed and independence of spawned streams"""
+    first, second = spawn_seeds(7, 2)
+    data = generate_partial_replicate_data(n_subjects=9, seed=first)
+    assert data.shape == (9 * 3 * 9, 6)
+    assert data["Sequence"].to_list()[::27] == ["TRR", "RTR", "RRT"] * 3
+    assert data.equals(generate_partial_replicate_data(n_subjects=9, seed=spawn_seeds(7, 2)[0]))
+    assert not data.equals(generate_partial_replicate_data(n_subjects=9, seed=second))
+
+
+def test_iter_chunks_offsets_subjects_and_regenerates_any_chunk():
+    """Test that chunks cover all subjects once and each chunk is reproducible on its own"""
+    chunks = list(iter_chunks("partial_replicate", n_subjects=15, chunk_size=6, seed=3, time_points=[0, 2]))
+    assert [index for index, _ in chunks] == [0, 1, 2]
+    data = pl.concat([chunk for _, chunk in chunks])
+    assert data["SubjectID"].unique().sort().to_list() == list(range(1, 16))
+    assert data.group_by("Sequence").agg(pl.col("SubjectID").n_unique())["SubjectID"].to_list() == [5, 5, 5]
+
+    _, last = next(iter_chunks("partial_replicate", n_subjects=15, chunk_size=6, seed=3, start_chunk=2, time_points=[0, 2]))
+    assert last.equals(chunks[2][1])
+    with pytest.raises(ValueError):
+        next(iter_chunks("partial_replicate", n_subjects=15, chunk_size=4))
+
+
+def test_write_parquet_dataset_resumes_after_interruption(tmp_path):
+    """Test that an interrupted dataset is completed to the same data as an uninterrupted run"""
+    settings = dict(design="crossover", n_subjects=10, chunk_size=4, seed=5, time_points=[0, 1, 4])
+    assert write_parquet_dataset(tmp_path / "full", **settings) == 3
+
+    partial = tmp_path / "partial"
+    write_parquet_dataset(partial, **settings)
+    # Simulate a run that stopped while writing the second chunk
+    (partial / "chunk=000001" / "data.parquet").rename(partial / "chunk=000001" / "data.parquet.tmp")
+    (partial / "chunk=000002" / "data.parquet").unlink()
+    assert write_parquet_dataset(partial, **settings) == 2
+    assert write_parquet_dataset(partial, **settings) == 0
+
+    def read(path):
+        return pl.scan_parquet(path / "**/*.parquet", hive_partitioning=True).sort(
+            ["SubjectID", "Period", "Time (hr)"]
+        ).collect()
+
+    full = read(tmp_path / "full")
+    assert full["SubjectID"].n_unique() == 10
+    assert full.equals(read(partial))
+    with pytest.raises(ValueError):
+        write_parquet_dataset(partial, **{**settings, "seed": 6})
+    with pytest.raises(FileExistsError):
+        write_parquet_dataset(partial, resume=False, **settings)
@@ -0,0 +1,114 @@
+import pytest
+import numpy as np
+import polars as pl
+from bioeq import Crossover2x2, ParallelDesign, ReplicateCrossover, simulate
+from simdata.simulation_data_generator import generate_partial_replicate_data
+
+
+def _trial_frame(concs, is_test, times):
+    """Arrange one simulated trial (subjects, periods, times) in the long format of the design classes"""
+    n_subjects, n_periods, n_times = concs.shape
+    shape = concs.shape
+    subject = np.broadcast_to(np.arange(1, n_subjects + 1)[:, None, None], shape)
+    period = np.broadcast_to(np.arange(1, n_periods + 1)[None, :, None], shape)
+    sequence = np.where(is_test[:, 0], "TR", "RT") if n_periods == 2 else np.full(n_subjects, "P")
+    return pl.DataFrame({
+        "SubjectID": subject.ravel(),
+        "Period": period.ravel(),
+        "Sequence": np.broadcast_to(sequence[:, None, None], shape).ravel(),
+        "Formulation": np.broadcast_to(np.where(is_test, "Test", "Reference")[:, :, None], shape).ravel(),
+        "Time (hr)": np.broadcast_to(times, shape).ravel(),
+        "Concentration (ng/mL)": concs.ravel(),
+    })
+
+
+@pytest.mark.parametrize("design, n_subjects", [("2x2", 12), ("parallel", 16)])
+def test_batch_decisions_match_design_classes(design, n_subjects):
+    """Test that batched NCA and BE decisions reproduce the per-trial class analyses"""
+    times = np.asarray(simulate.DEFAULT_TIME_POINTS, dtype=np.float64)
+    concs, is_test = simulate._simulate_concentrations(
+        np.random.default_rng(3), 4, design, n_subjects, 0.9, 0.2, 0.25, 0.1, times
+    )
+    passed = simulate._be_decisions(concs, is_test, times, ["AUC", "Cmax"], "linear", 0.05, 0.8, 1.25)
+    
+    for trial in range(4):
+        data = _trial_frame(concs[trial], is_test, times)
+        columns = dict(subject_col="SubjectID", time_col="Time (hr)",
+                       conc_col="Concentration (ng/mL)", form_col="Formulation")
+        if design == "2x2":
+            analyzer = Crossover2x2(data=data, seq_col="Sequence", period_col="Period", **columns)
+        else:
+            analyzer = ParallelDesign(data=data, **columns)
+        for k, metric in enumerate(["log_AUC", "log_Cmax"]):
+            assert passed[trial, k] == analyzer.calculate_point_estimate(metric)["be_criteria_met"]
+
+
+def test_pass_rates_reproducible_with_mcse():
+    """Test pass rates, their Monte Carlo SE and independence from the number of workers"""
+    serial = simulate.simulate_be_trials(n_trials=1200, n_subjects=12, gmr=1.0, seed=11)
+    pooled = simulate.simulate_be_trials(n_trials=1200, n_subjects=12, gmr=1.0, seed=11, n_jobs=2)
+    
+    assert np.array_equal(serial["passed"], pooled["passed"])
+    assert serial["passed"].shape == (1200, 2)
+    rate = serial["passed"].all(axis=1).mean()
+    assert serial["pass_rate"] == rate
+    assert np.isclose(serial["mcse"], np.sqrt(rate * (1 - rate) / 1200))
+    assert serial["metric_pass_rates"]["AUC"] >= serial["pass_rate"]
+
+
+def test_type_one_error_at_acceptance_limit():
+    """Test that a true ratio on the upper limit passes at about the nominal 5% rate"""
+    results = simulate.simulate_be_trials(
+        n_trials=4000, n_subjects=24, gmr=1.25, metrics=["Cmax"], seed=5
+    )
+    assert abs(results["pass_rate"] - 0.05) < 4 * results["mcse"]
+    with pytest.raises(ValueError):
+        simulate.simulate_be_trials(n_trials=10, design="3x3")
+
+
+@pytest.mark.parametrize("design", ["2x3x3", "2x2x4"])
+def test_rsabe_blocks_match_run_rsabe(design):
+    """Test that parameter-level RSABE decisions reproduce the native run_rsabe on the same values"""
+    sequences = simulate.REPLICATE_SEQUENCES[design]
+    n_subjects, sigma, log_gmrs = 12, np.sqrt(np.log1p(0.3 ** 2)), np.log([1.0, 1.15, 1.3])
+    analyzer = ReplicateCrossover(
+        data=generate_partial_replicate_data(n_subjects=n_subjects), design_type="partial",
+        subject_col="SubjectID", seq_col="Sequence", period_col="Period",
+        time_col="Time (hr)", conc_col="Concentration (ng/mL)", form_col="Formulation",
+    )
+    
+    for trial in range(6):
+        seed = np.random.SeedSequence([7, trial])
+        passed = simulate._rsabe_block(1, seed, design, n_subjects, sigma, sigma, log_gmrs, 0.05)
+        errors = np.random.default_rng(seed).standard_normal((n_subjects, len(sequences[0]))) * sigma
+        codes = np.arange(n_subjects) % len(sequences)
+        is_test = np.array([[letter == "T" for letter in sequences[code]] for code in codes])
+        for log_gmr, expected in zip(log_gmrs, passed):
+            analyzer.params_df = pl.DataFrame({
+                "SubjectID": np.repeat(np.arange(1, n_subjects + 1), is_test.shape[1]),
+                "Sequence": np.repeat(np.array(sequences)[codes], is_test.shape[1]),
+                "Period": np.tile(np.arange(1, is_test.shape[1] + 1), n_subjects),
+                "Formulation": np.where(is_test, "Test", "Reference").ravel(),
+                "log_AUC": (errors + log_gmr * is_test).ravel(),
+            })
+            assert analyzer.run_rsabe("log_AUC")["be_conclusion"] == bool(expected)
+
+
+def test_rsabe_type_one_error_surface():
+    """Test the inflation surface layout, worker independence and the inflation near CVwR = 30%"""
+    surface = simulate.rsabe_type1_error(cvwr=[0.2, 0.3], n_trials=6000, seed=3)
+    pooled = simulate.rsabe_type1_error(cvwr=[0.2, 0.3], n_trials=6000, seed=3, n_jobs=2)
+    assert surface.equals(pooled)
+    assert surface["gmr"].to_list() == pytest.approx([1.25, 1.25])
+    assert surface["null"].all()
+    
+    low, near_switch = surface.to_dicts()
+    assert abs(low["pass_rate"] - 0.05) < 4 * low["mcse"]
+    assert near_switch["inflation"] > 5 * near_switch["mcse"]
+    
+    grid = simulate.rsabe_type1_error(cvwr=[0.4], gmr=[1.0, 1.6], n_trials=2000, seed=3)
+    assert grid["null"].to_list() == [False, True]
+    assert grid["inflation"].to_list()[0] is None
+    assert grid["pass_rate"][0] > 0.8
+    with pytest.raises(ValueError):
+        simulate.rsabe_type1_error(design="2x2")